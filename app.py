@@ -2,11 +2,21 @@ import streamlit as st
 import pandas as pd
 import datetime
 import pytz
-
-from utils.data_loader import load_data, load_matches, load_captains
-from utils.standings import prepare_team_standings
-from utils.probability import calculate_win_probability
-from utils.helpers import get_c_vc_points, get_current_c_vc
+import os
+import time
+
+from utils.data_loader import load_data, load_matches, load_captains, fetch_points
+from utils.dashboard import season_cube, season_h2h, season_auction, season_progress, TOTAL_MATCHES
+from utils.memory import record_session, memory_report
+from utils.season_store import SeasonStore
+from utils.live import LivePoller, live_standings, LIVE_INTERVAL_SECONDS
+from utils.api import ApiServer
+from utils.precompute import get_precomputer, precomputed, PRECOMPUTE_POLL_SECONDS
+from utils.scoring import RULES
+from utils.warmup import attach
+from utils.archive import get_archive, record_snapshots
+from utils.telemetry import MetricsExporter, RERUN_SECONDS, ACTIVE_SESSIONS
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 
 from tabs.tab1_rankings import render_tab1
 from tabs.tab2_players import render_tab2
@@ -14,12 +24,15 @@ from tabs.tab3_insights import render_tab3
 from tabs.tab4_squad import render_tab4
 from tabs.tab5_replacement import render_tab5
 from tabs.tab6_match_points import render_tab6
+from tabs.tab7_head_to_head import render_tab7
+from tabs.tab8_auction import render_tab8
 
 # ----------------------------------------
 # CONFIG
 # ----------------------------------------
 st.set_page_config(layout="wide", page_title="IPL Dashboard-Core Group")
-TOTAL_MATCHES = 74
+
+rerun_started = time.perf_counter()
 
 ist = pytz.timezone("Asia/Kolkata")
 current_time = datetime.datetime.now(ist)
@@ -33,14 +46,68 @@ with open("style/style.css") as f:
 if "refresh_trigger" not in st.session_state:
     st.session_state["refresh_trigger"] = False
 
-@st.cache_data
+# cache_resource: one shared copy per process instead of a pickled copy per session.
+# Everything downstream treats these frames as read-only. The cache is warmed
+# in the background now and on every new data version, and every version is
+# kept as an archive snapshot for time travel.
+@st.cache_resource
 def load_all_data():
     df = load_data()
     matches_df = load_matches()
     cap_df = load_captains()
-    return df, matches_df, cap_df
+    return attach(record_snapshots(SeasonStore(df, cap_df, matches_df)))
+
+@st.cache_resource
+def session_registry():
+    return {}
+
+@st.cache_resource
+def live_poller():
+    return LivePoller(load_all_data(), fetch_points)
+
+# JSON API in-process, so it shares the dashboard's computed results
+@st.cache_resource
+def api_server():
+    port = os.environ.get("DASHBOARD_API_PORT")
+    return ApiServer(load_all_data(), port=int(port)).start() if port else None
+
+# Prometheus text on METRICS_PORT (/metrics) and/or written to METRICS_FILE
+@st.cache_resource
+def metrics_exporter():
+    return MetricsExporter().start()
 
-df, matches_df, cap_df = load_all_data()
+metrics_exporter()
+
+# picks up per-match score drops and updates only the affected days
+store = load_all_data()
+season = store.poll()
+
+api_server()
+
+# ----------------------------------------
+# TIME TRAVEL
+# ----------------------------------------
+# render the whole dashboard against the data as it was at a past snapshot
+archive = get_archive()
+snapshots = archive.snapshots() if archive else []
+
+def snapshot_label(pos):
+    if pos is None:
+        return "Latest"
+    taken_at = datetime.datetime.fromisoformat(snapshots[pos]["taken_at"]).astimezone(ist)
+    return taken_at.strftime("%d %b, %I:%M:%S %p IST")
+
+as_of = st.sidebar.selectbox(
+    "🕰️ Data as of",
+    [None] + list(range(len(snapshots)))[::-1],
+    format_func=snapshot_label,
+    key="as_of"
+)
+
+if as_of is not None:
+    season = archive.season(snapshots[as_of])
+
+df, matches_df, cap_df = season.df, season.matches_df, season.cap_df
 
 # ----------------------------------------
 # DAYS
@@ -54,16 +121,16 @@ selected_day = st.sidebar.selectbox(
     index=len(day_numbers)-1
 )
 
-effective_day = max(selected_day - 1, 1)
-
 # ----------------------------------------
 # SIDEBAR
 # ----------------------------------------
 
 if st.sidebar.button("🔄 Refresh Data"):
 
-    # Clear cache ONLY on click
+    # Clear cache ONLY on click; the store diffs the new snapshot and only
+    # recomputes results affected by what changed
     st.cache_data.clear()
+    store.reload(load_data(), load_captains(), load_matches())
 
     # Store IST time
     ist = pytz.timezone("Asia/Kolkata")
@@ -74,6 +141,13 @@ if st.sidebar.button("🔄 Refresh Data"):
 
     st.rerun()
 
+live_mode = st.sidebar.toggle(
+    "🔴 Live Match Mode",
+    key="live_mode",
+    help=f"Auto-updates today's points every {LIVE_INTERVAL_SECONDS}s",
+    disabled=as_of is not None
+)
+
 st.sidebar.markdown("---")
 
 matches_left = TOTAL_MATCHES - selected_day + 1
@@ -86,10 +160,10 @@ st.sidebar.markdown(f"""
 
 st.sidebar.markdown("---")
 
-st.sidebar.markdown("""
+st.sidebar.markdown(f"""
 ### 🧠 Rules
-• Captain = 2×  
-• Vice Captain = 1.5×  
+• Captain = {RULES.captain:g}×  
+• Vice Captain = {RULES.vice_captain:g}×  
 • Max 2 changes allowed  
 """)
 
@@ -101,17 +175,45 @@ st.sidebar.markdown("""
 • Focus on active franchises  
 """)
 
-team_df, scored_df, top_owner, low_owner, max_points, min_points = prepare_team_standings(
-    df, cap_df, matches_df, selected_day, effective_day
-)
+# new data is computed off-thread (this day and the latest one); until it
+# lands the page shows the last completed results with a badge instead of
+# blocking the rerun
+precomputer = get_precomputer()
+precomputer.schedule(season, list(dict.fromkeys([selected_day, day_numbers[-1]])))
 
-prob_df, explanations = calculate_win_probability(
-    df, scored_df, matches_df, selected_day
-)
+day_data, stale_view = precomputed("view", season, selected_day)
 
-prob_map = prob_df.set_index("Owner")["Win %"]
+team_df = day_data["team_df"]
+scored_df = day_data["scored_df"]
+top_owner, low_owner = day_data["top_owner"], day_data["low_owner"]
+max_points, min_points = day_data["max_points"], day_data["min_points"]
+prob_df, explanations = day_data["prob_df"], day_data["explanations"]
 
-team_df["Win %"] = team_df["Owner"].map(prob_map)
+# ----------------------------------------
+# MEMORY REPORT
+# ----------------------------------------
+ctx = get_script_run_ctx()
+session_id = ctx.session_id if ctx else "local"
+
+record_session(session_registry(), session_id, {
+    "team_df": team_df,
+    "scored_df": scored_df,
+    "prob_df": prob_df,
+    "explanations": explanations,
+    "session_state": dict(st.session_state)
+})
+ACTIVE_SESSIONS.set(len(session_registry()))
+
+with st.sidebar.expander("🧮 Memory"):
+    st.dataframe(
+        memory_report(
+            {"points": df, "matches": matches_df, "captains": cap_df, "season": season, "cube": season_cube(season), "head_to_head": season_h2h(season), "auction": season_auction(season)},
+            session_registry(),
+            session_id
+        ),
+        use_container_width=True,
+        hide_index=True
+    )
 
 # ----------------------------------------
 # VISITOR COUNTER
@@ -161,22 +263,63 @@ if "last_refresh" in st.session_state:
     st.caption(f"📡 Data synced at: {last.strftime('%d %b, %I:%M %p IST')}")
 else:
     st.caption("📡 Data not refreshed yet")
-    
+
+if as_of is not None:
+    st.caption(f"🕰️ Time travel: showing the data as of {snapshot_label(as_of)}")
+
+if stale_view:
+    st.caption("⏳ Computing… showing the last completed results")
+
+# reruns the page once this day's fresh results are all in the cache
+@st.fragment(run_every=PRECOMPUTE_POLL_SECONDS)
+def await_precompute(day):
+    if precomputer.ready(season, day):
+        st.rerun()
+
+if precomputer.workers and not precomputer.ready(season, selected_day):
+    await_precompute(selected_day)
+
 st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
 
 # ----------------------------------------
-# PROGRESS BAR
+# LIVE MATCH MODE
 # ----------------------------------------
+@st.fragment(run_every=LIVE_INTERVAL_SECONDS)
+def render_live(day):
+
+    poller = live_poller()
+    live_season = poller.refresh(day)
+
+    st.markdown(f"### 🔴 Live Standings - Day {day}")
 
-completed_df = matches_df[
-    matches_df["Day"] < selected_day
-].copy()
+    st.dataframe(
+        live_standings(live_season, day).style.format({
+            "Live Points": "{:.1f}",
+            "Today": "{:.1f}"
+        }),
+        use_container_width=True,
+        hide_index=True
+    )
 
-matches_completed = completed_df["Teams"].apply(
-    lambda x: len(str(x).split(",")) // 2
-).sum()
+    if poller.last_error:
+        st.caption(f"⚠️ Live fetch failed, showing last data: {poller.last_error}")
+    elif poller.last_fetch:
+        last = datetime.datetime.fromtimestamp(poller.last_fetch, ist)
+        st.caption(
+            f"📡 Live data fetched at {last.strftime('%I:%M:%S %p IST')} · "
+            f"updates every {LIVE_INTERVAL_SECONDS}s"
+        )
 
-progress = matches_completed / TOTAL_MATCHES
+    st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+
+if live_mode and as_of is None:
+    render_live(selected_day)
+
+# ----------------------------------------
+# PROGRESS BAR
+# ----------------------------------------
+
+matches_completed, progress = season_progress(matches_df, selected_day)
 
 percent = int(progress * 100)
 
@@ -286,13 +429,15 @@ st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
 # ----------------------------------------
 # TABS
 # ----------------------------------------
-tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
+tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8 = st.tabs([
     "🏆 Rankings",
     "👥 Players",
     "📊 Insights",
     "🎯 Squad Composition",
     "🤝 Replacement",
-    "📅 Match Points"
+    "📅 Match Points",
+    "⚔️ Head to Head",
+    "💰 Auction Value"
 ])
 
 
@@ -308,24 +453,29 @@ with tab1:
     matches_df,
     scored_df,
     selected_day,
-    get_c_vc_points,
-    get_current_c_vc
+    season
 )
 
 with tab2:
     render_tab2(df, scored_df, cap_df, selected_day)
 
 with tab3:
-    render_tab3(df, scored_df, team_df, selected_day)
+    render_tab3(season_cube(season), team_df, day_data["effective_day"])
 
 with tab4:
-    render_tab4(df, cap_df, selected_day)
+    render_tab4(season_cube(season), cap_df, selected_day)
 
 with tab5:
-    render_tab5(df, selected_day)
+    render_tab5(df, selected_day, season)
 
 with tab6:
-    render_tab6(df, matches_df, selected_day)
+    render_tab6(season, matches_df, selected_day)
+
+with tab7:
+    render_tab7(season_h2h(season), day_data["effective_day"])
+
+with tab8:
+    render_tab8(season_auction(season), day_data["effective_day"])
 
 # ----------------------------------------
 # FOOTER
@@ -333,4 +483,6 @@ with tab6:
 st.markdown(
     "<div style='text-align:center;color:#94a3b8;margin-top:20px;'>Built for IPL 🚀</div>",
     unsafe_allow_html=True
-)
\ No newline at end of file
+)
+
+RERUN_SECONDS.observe(time.perf_counter() - rerun_started)
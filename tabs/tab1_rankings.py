@@ -2,8 +2,10 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import textwrap
+from utils.dashboard import day_planner, day_digest, PLANNER_DAYS
+from utils.precompute import precomputed
 
-def render_tab1(df, team_df, cap_df,matches_df,scored_df,selected_day, get_c_vc_points,get_current_c_vc):
+def render_tab1(df, team_df, cap_df,matches_df,scored_df,selected_day, season):
 
     st.markdown(f"""
     <span style="color:#94a3b8;font-size:0.85rem;">
@@ -14,7 +16,7 @@ def render_tab1(df, team_df, cap_df,matches_df,scored_df,selected_day, get_c_vc_
     st.markdown("### 🏆 Team Rankings")
 
     display_df = team_df[
-        ["Rank", "Owner", "Points", "Movement", "Next Rank", "1st Rank", "Win %", "Watchlist"]
+        ["Rank", "Owner", "Points", "Movement", "Next Rank", "1st Rank", "Win %", "Status", "Watchlist"]
     ].rename(columns={
         "Points": "Total Points",
         "Watchlist": f"Watchlist (Day {selected_day})"
@@ -52,273 +54,92 @@ def render_tab1(df, team_df, cap_df,matches_df,scored_df,selected_day, get_c_vc_
         hide_index=True
     )
 
-    st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
-
     # --------------------------------------------------
-    # UPCOMING MATCH FORECASTS
-    # --------------------------------------------------
-
-    st.markdown("## 📈 Upcoming Match Forecasts")
-
-    # --------------------------------------------------
-    # NEXT 5 MATCHES
+    # WHAT CHANGED (daily digest)
     # --------------------------------------------------
-    future_matches = matches_df[
-        matches_df["Day"] >= selected_day
-    ].head(5).copy()
-
-    if not future_matches.empty:
-
-        # --------------------------------------------------
-        # FORMAT MATCH LABEL
-        # --------------------------------------------------
-        def format_match_label(day, teams_str):
-
-            teams = [
-                t.strip()
-                for t in teams_str.split(",")
-            ]
-
-            # DOUBLE HEADER
-            if len(teams) == 4:
-
-                return (
-                    f"Day {day} - "
-                    f"{teams[0]} vs {teams[1]} | "
-                    f"{teams[2]} vs {teams[3]}"
-                )
-
-            # NORMAL MATCH
-            elif len(teams) == 2:
-
-                return (
-                    f"Day {day} - "
-                    f"{teams[0]} vs {teams[1]}"
-                )
-
-            return f"Day {day} - {teams_str}"
-
-        # --------------------------------------------------
-        # CREATE LABELS
-        # --------------------------------------------------
-        future_matches["match_label"] = future_matches.apply(
-            lambda x: format_match_label(
-                x["Day"],
-                x["Teams"]
-            ),
-            axis=1
-        )
-
-        # --------------------------------------------------
-        # BUILD FORECASTS
-        # --------------------------------------------------
-        all_match_forecasts = {}
-        summary_rows = []
-
-        for _, match in future_matches.iterrows():
-
-            match_label = match["match_label"]
-
-            teams = [
-                t.strip()
-                for t in match["Teams"].split(",")
-            ]
-
-            forecast_rows = []
-
-            # ----------------------------------------
-            # OWNER FORECAST
-            # ----------------------------------------
-            for owner, group in df.groupby("owner_name"):
-
-                owner_players = group[
-                    group["franchise"].isin(teams)
-                ].copy()
-
-                total = 0
+    digest = day_digest(season, selected_day)
 
-                # current captain / VC for that match day
-                captain, vice_captain = get_current_c_vc(
-                    cap_df,
-                    owner,
-                    match["Day"]
-                )
+    with st.expander(f"📰 What Changed on Day {digest['day']}"):
 
-                # ----------------------------------------
-                # PLAYER FORECAST
-                # ----------------------------------------
-                for _, r in owner_players.iterrows():
+        sections = [
+            ("⭐ Top Performances", "players"),
+            ("👑 Captain Hauls", "captains"),
+            ("🔀 Rank Swaps", "swaps"),
+            ("📈 Movers", "movers"),
+            ("🔥 Streaks", "streaks")
+        ]
 
-                    player = r["player_name"]
+        for title, key in sections:
+            st.markdown(f"#### {title}")
 
-                    player_scores = []
+            if digest[key].empty:
+                st.caption("Nothing to report.")
+            else:
+                st.dataframe(digest[key], use_container_width=True, hide_index=True)
 
-                    for d in range(1, selected_day + 1):
-
-                        day_col = f"day{d}"
-
-                        pts = pd.to_numeric(
-                            r.get(day_col, 0),
-                            errors="coerce"
-                        )
-
-                        pts = 0 if pd.isna(pts) else pts
+    # --------------------------------------------------
+    # WEEK-AHEAD PLANNER
+    # --------------------------------------------------
+    with st.expander(f"🗓️ Week Ahead Planner (Day {selected_day}–{selected_day + PLANNER_DAYS - 1})"):
 
-                        # ----------------------------------------
-                        # APPLY FORECAST MULTIPLIER
-                        # ----------------------------------------
-                        if player == captain:
-                            pts *= 2
+        planner_df = day_planner(season, selected_day)
 
-                        elif player == vice_captain:
-                            pts *= 1.5
+        if planner_df.empty:
+            st.info("No confirmed fixtures in this window.")
+        else:
+            summary = planner_df.pivot_table(
+                index="owner_name", columns="Day", values="expected",
+                aggfunc="sum", observed=True
+            ).round(1)
+            summary.columns = [f"Day {d}" for d in summary.columns]
+            summary["Total"] = summary.sum(axis=1)
+
+            st.markdown("Expected points of each owner's playing XI (C/VC included)")
+            st.dataframe(
+                summary.sort_values("Total", ascending=False).rename_axis("Owner"),
+                use_container_width=True
+            )
 
-                        if pts != 0:
-                            player_scores.append(pts)
+            planner_owner = st.selectbox(
+                "Owner",
+                sorted(planner_df["owner_name"].unique()),
+                key="planner_owner"
+            )
 
-                    # ----------------------------------------
-                    # PLAYER AVERAGE
-                    # ----------------------------------------
-                    avg_points = (
-                        sum(player_scores) / len(player_scores)
-                        if player_scores else 0
-                    )
+            owner_plan = planner_df[planner_df["owner_name"] == planner_owner]
 
-                    total += avg_points
+            st.dataframe(
+                owner_plan.assign(Player=owner_plan["tag"] + owner_plan["player_name"])[
+                    ["Day", "Player", "franchise", "expected"]
+                ].rename(columns={"franchise": "Team", "expected": "Expected"}).round(1),
+                use_container_width=True,
+                hide_index=True
+            )
 
-                forecast_rows.append({
-                    "Owner": owner,
-                    "Predicted Points": round(total, 1)
-                })
+    st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
 
-            # ----------------------------------------
-            # FORECAST DF
-            # ----------------------------------------
-            forecast_df = pd.DataFrame(forecast_rows)
+    # --------------------------------------------------
+    # UPCOMING MATCH FORECASTS
+    # --------------------------------------------------
 
-            forecast_df = forecast_df.sort_values(
-                "Predicted Points",
-                ascending=False
-            )
+    st.markdown("## 📈 Upcoming Match Forecasts")
 
-            all_match_forecasts[match_label] = forecast_df
+    # --------------------------------------------------
+    # NEXT 5 MATCHES
+    # --------------------------------------------------
+    forecasts, stale = precomputed("forecasts", season, selected_day)
 
-            # ----------------------------------------
-            # SUMMARY ROW
-            # ----------------------------------------
-            top_row = forecast_df.iloc[0]
+    if stale:
+        st.caption("⏳ Computing… showing the last completed forecast")
 
-            summary_rows.append({
-                "Match": match_label,
-                "Top Owner": top_row["Owner"],
-                "Best Forecast": round(top_row["Predicted Points"], 1)
-            })
+    all_match_forecasts = forecasts["match_forecasts"]
+    summary_df = forecasts["summary_df"]
 
-        # --------------------------------------------------
-        # SUMMARY DF
-        # --------------------------------------------------
-        summary_df = pd.DataFrame(summary_rows)
+    if all_match_forecasts:
 
-    
         # --------------------------------------------------
         # MATCH FORECAST CARDS
         # --------------------------------------------------
-
-        def calculate_final_forecast(
-            df,
-            team_df,
-            cap_df,
-            matches_df,
-            selected_day,
-            get_current_c_vc
-        ):
-
-            future_matches_all = matches_df[
-                matches_df["Day"] > selected_day
-            ].copy()
-
-            forecast_rows = []
-
-            for owner, group in df.groupby("owner_name"):
-
-                current_points = team_df.loc[
-                    team_df["Owner"] == owner,
-                    "Points"
-                ].values[0]
-
-                future_projection = 0
-
-                for _, match in future_matches_all.iterrows():
-
-                    teams = [
-                        t.strip()
-                        for t in match["Teams"].split(",")
-                    ]
-
-                    owner_players = group[
-                        group["franchise"].isin(teams)
-                    ].copy()
-
-                    captain, vice_captain = get_current_c_vc(
-                        cap_df,
-                        owner,
-                        match["Day"]
-                    )
-
-                    match_projection = 0
-
-                    for _, r in owner_players.iterrows():
-
-                        player = r["player_name"]
-
-                        scores = []
-
-                        for d in range(1, selected_day + 1):
-
-                            pts = pd.to_numeric(
-                                r.get(f"day{d}", 0),
-                                errors="coerce"
-                            )
-
-                            pts = 0 if pd.isna(pts) else pts
-
-                            if player == captain:
-                                pts *= 2
-
-                            elif player == vice_captain:
-                                pts *= 1.5
-
-                            if pts != 0:
-                                scores.append(pts)
-
-                        avg_points = (
-                            sum(scores) / len(scores)
-                            if scores else 0
-                        )
-
-                        match_projection += avg_points
-
-                    future_projection += match_projection
-
-                predicted_final = (
-                    current_points +
-                    future_projection
-                )
-
-                forecast_rows.append({
-                    "Owner": owner,
-                    "Predicted Final": round(predicted_final, 1)
-                })
-
-            forecast_df = pd.DataFrame(forecast_rows)
-
-            forecast_df = forecast_df.sort_values(
-                "Predicted Final",
-                ascending=False
-            ).reset_index(drop=True)
-
-            return forecast_df
-
         card_cols = st.columns(len(summary_df))
 
         for i, (_, row) in enumerate(summary_df.iterrows()):
@@ -408,123 +229,11 @@ def render_tab1(df, team_df, cap_df,matches_df,scored_df,selected_day, get_c_vc_
     st.markdown("## 🏆 Final Tournament Forecast")
 
     # --------------------------------------------------
-    # FORECAST FUNCTION
-    # --------------------------------------------------
-
-    def calculate_final_forecast(sim_day):
-
-        future_matches_all = matches_df[
-            matches_df["Day"] >= sim_day
-        ].copy()
-
-        forecast_rows = []
-
-        for owner, group in df.groupby("owner_name"):
-
-            # ----------------------------------------
-            # CURRENT POINTS
-            # ----------------------------------------
-            current_points = team_df.loc[
-                team_df["Owner"] == owner,
-                "Points"
-            ].values[0]
-
-            future_projection = 0
-
-            # ----------------------------------------
-            # SIMULATE FUTURE MATCHES
-            # ----------------------------------------
-            for _, match in future_matches_all.iterrows():
-
-                teams = [
-                    t.strip()
-                    for t in match["Teams"].split(",")
-                ]
-
-                owner_players = group[
-                    group["franchise"].isin(teams)
-                ].copy()
-
-                captain, vice_captain = get_current_c_vc(
-                    cap_df,
-                    owner,
-                    match["Day"]
-                )
-
-                match_projection = 0
-
-                for _, r in owner_players.iterrows():
-
-                    player = r["player_name"]
-
-                    scores = []
-
-                    for d in range(1, sim_day + 1):
-
-                        pts = pd.to_numeric(
-                            r.get(f"day{d}", 0),
-                            errors="coerce"
-                        )
-
-                        pts = 0 if pd.isna(pts) else pts
-
-                        # ----------------------------------------
-                        # APPLY C / VC
-                        # ----------------------------------------
-                        if player == captain:
-                            pts *= 2
-
-                        elif player == vice_captain:
-                            pts *= 1.5
-
-                        if pts != 0:
-                            scores.append(pts)
-
-                    avg_points = (
-                        sum(scores) / len(scores)
-                        if scores else 0
-                    )
-
-                    match_projection += avg_points
-
-                future_projection += match_projection
-
-            predicted_final = (
-                current_points +
-                future_projection
-            )
-
-            forecast_rows.append({
-                "Owner": owner,
-                "Predicted Final": round(predicted_final, 1)
-            })
-
-        forecast_df = pd.DataFrame(forecast_rows)
-
-        forecast_df = forecast_df.sort_values(
-            "Predicted Final",
-            ascending=False
-        ).reset_index(drop=True)
-
-        return forecast_df
-
-
-    # --------------------------------------------------
-    # CURRENT FORECAST
+    # CURRENT + PREVIOUS FORECAST
     # --------------------------------------------------
 
-    forecast_df = calculate_final_forecast(
-        selected_day
-    )
-
-    # --------------------------------------------------
-    # PREVIOUS FORECAST
-    # --------------------------------------------------
-
-    previous_df = calculate_final_forecast(
-        max(selected_day - 1, 1)
-    )
-    
+    forecast_df = forecasts["forecast_df"]
+    previous_df = forecasts["previous_df"]
 
     previous_map = dict(
         zip(
@@ -582,54 +291,10 @@ def render_tab1(df, team_df, cap_df,matches_df,scored_df,selected_day, get_c_vc_
     # ==================================================
     st.markdown("### 🧠 Captain Strategy")
 
-    cap_df.columns = [c.lower() for c in cap_df.columns]
-
-    # 🔧 Clean history + return changes count
-    def format_history(series):
-        if series.empty:
-            return "—", 0
-
-        cleaned = []
-        prev = None
-
-        for name in series.tolist():
-            if name != prev:
-                cleaned.append(name)
-                prev = name
-
-        history_str = cleaned[0] if len(cleaned) == 1 else " → ".join(cleaned)
-        changes = max(len(cleaned) - 1, 0)
-
-        return history_str, changes
-
-    rows = []
-
-    for owner in df["owner_name"].unique():
-
-        oc = cap_df[
-            cap_df["owner_name"] == owner
-        ].sort_values("from_day")
-
-        if not oc.empty:
-            captain_history, cap_changes = format_history(oc["captain"])
-            vc_history, vc_changes = format_history(oc["vice_captain"])
-        else:
-            captain_history, vc_history = "—", "—"
-            cap_changes, vc_changes = 0, 0
-
-        # ✅ Total changes (Captain + VC)
-        total_changes = cap_changes + vc_changes
-
-        rows.append({
-            "Owner": owner,
-            "Captain": captain_history,
-            "Cap Points": get_c_vc_points(df,cap_df,owner,selected_day,role="captain"),
-            "Vice Captain": vc_history,
-            "VC Points": get_c_vc_points(df,cap_df,owner,selected_day,role="vice_captain"),
-            "Changes": total_changes
-        })
+    cap_table, stale = precomputed("captains", season, selected_day)
 
-    cap_table = pd.DataFrame(rows)
+    if stale:
+        st.caption("⏳ Computing… showing the last completed table")
 
     st.dataframe(
         cap_table,
@@ -1,5 +1,8 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
+
+from utils.calculator import day_multipliers
 
 def render_tab2(df, scored_df, cap_df, selected_day):
 
@@ -21,7 +24,7 @@ def render_tab2(df, scored_df, cap_df, selected_day):
     owner_points_df = (
         scored_df
         .loc[scored_df["owner_name"] == selected_owner]
-        .groupby(["player_name", "franchise"])["player_points"]
+        .groupby(["player_name", "franchise"], observed=True)["player_points"]
         .sum()
         .reset_index()
         .sort_values("player_points", ascending=False)
@@ -30,8 +33,6 @@ def render_tab2(df, scored_df, cap_df, selected_day):
     # --------------------------------------------------
     # CAPTAIN DATA (CLEAN)
     # --------------------------------------------------
-    cap_df.columns = [c.lower() for c in cap_df.columns]
-
     owner_caps = (
         cap_df[
             (cap_df["owner_name"] == selected_owner) &
@@ -51,46 +52,32 @@ def render_tab2(df, scored_df, cap_df, selected_day):
     # --------------------------------------------------
     # MATCH-WISE GAINS
     # --------------------------------------------------
+    # scoring-rule multipliers of every roster row, one vector per day
+    day_mults = {
+        d: day_multipliers(df, cap_df, d)
+        for d in range(1, selected_day + 1)
+        if f"day{d}" in df.columns
+    }
+
     def get_player_daywise_gains(player_name):
 
-        player_row = df[
+        rows = np.flatnonzero(
             (df["owner_name"] == selected_owner) &
             (df["player_name"] == player_name)
-        ]
+        )
 
-        if player_row.empty:
+        if len(rows) == 0:
             return "—"
 
-        row = player_row.iloc[0]
+        row = df.iloc[rows[0]]
         gains = []
 
-        for d in range(1, selected_day + 1):
-
-            day_col = f"day{d}"
-            if day_col not in df.columns:
-                continue
+        for d, mult in day_mults.items():
 
-            points = pd.to_numeric(row.get(day_col, 0), errors="coerce")
+            points = row.get(f"day{d}", 0)
             points = 0 if pd.isna(points) else points
 
-            # Dynamic captain lookup
-            cap_row = owner_caps[owner_caps["from_day"] <= d]
-
-            if not cap_row.empty:
-                latest_cap = cap_row.iloc[-1]
-                c = latest_cap["captain"]
-                vc = latest_cap["vice_captain"]
-            else:
-                c, vc = None, None
-
-            multiplier = 1.0
-
-            if player_name == c:
-                multiplier = 2.0
-            elif player_name == vc:
-                multiplier = 1.5
-
-            value = round(points * multiplier, 1)
+            value = round(points * mult[rows[0]], 1)
 
             if value != 0:
                 gains.append(value)
@@ -1,32 +1,28 @@
 import streamlit as st
+import pandas as pd
 import plotly.express as px
 
 
 
-def render_tab3(df, scored_df, team_df, selected_day):
+def render_tab3(cube, team_df, effective_day):
 
     st.markdown("### 📊 Insights")
 
     # ----------------------------------------
     # PLAYER IMPACT SEGMENTATION
     # ----------------------------------------
-    player_totals = (
-        scored_df
-        .groupby(["owner_name", "player_name"])["player_points"]
-        .sum()
-        .reset_index()
+    squad = cube.slice("owner_name", "players").merge(
+        cube.slice("owner_name", "active", effective_day), on="owner_name"
     )
 
-    player_totals["category"] = player_totals["player_points"].apply(
-        lambda x: "Dead (<10 points)" if x < 10 else "Active (≥10 points)"
-    )
+    stack_df = pd.concat([
+        squad.assign(category="Active (≥10 points)", count=squad["active"]),
+        squad.assign(category="Dead (<10 points)", count=squad["players"] - squad["active"])
+    ]).sort_values(["owner_name", "category"], kind="stable")
 
-    stack_df = (
-        player_totals
-        .groupby(["owner_name", "category"])["player_name"]
-        .count()
-        .reset_index(name="count")
-    )
+    stack_df = stack_df.loc[
+        stack_df["count"] > 0, ["owner_name", "category", "count"]
+    ].astype({"count": int}).reset_index(drop=True)
 
     # ----------------------------------------
     # CHARTS
@@ -39,11 +35,8 @@ def render_tab3(df, scored_df, team_df, selected_day):
     col1.plotly_chart(fig1, use_container_width=True)
 
     # Franchise Contribution
-    franchise_df = (
-        scored_df
-        .groupby("franchise")["player_points"]
-        .sum()
-        .reset_index()
+    franchise_df = cube.slice("franchise", "scored", effective_day).rename(
+        columns={"scored": "player_points"}
     )
 
     fig2 = px.pie(franchise_df, names="franchise", values="player_points")
@@ -72,4 +65,26 @@ def render_tab3(df, scored_df, team_df, selected_day):
         legend_title=""
     )
 
-    st.plotly_chart(fig3, use_container_width=True)
\ No newline at end of file
+    st.plotly_chart(fig3, use_container_width=True)
+
+    # Points by Role
+    role_df = cube.slice(["owner_name", "role"], "scored", effective_day)
+
+    fig4 = px.bar(
+        role_df,
+        x="owner_name",
+        y="scored",
+        color="role",
+        text_auto=".0f",
+        barmode="stack"
+    )
+
+    fig4.update_layout(
+        template="plotly_dark",
+        title="🎭 Points by Role",
+        xaxis_title="Owner",
+        yaxis_title="Points",
+        legend_title=""
+    )
+
+    st.plotly_chart(fig4, use_container_width=True)
@@ -1,9 +1,11 @@
 import streamlit as st
 import plotly.express as px
 
-def render_tab4(df, cap_df, selected_day):
+def render_tab4(cube, cap_df, selected_day):
 
-    squad_df = df.groupby(["owner_name", "franchise"]).size().reset_index(name="player_count")
+    squad_df = cube.slice(["owner_name", "franchise"], "players").rename(
+        columns={"players": "player_count"}
+    ).astype({"player_count": int})
 
     fig = px.bar(
         squad_df,
@@ -1,22 +1,19 @@
 import streamlit as st
 import pandas as pd
+from utils.data_loader import get_day_cols
+from utils.dashboard import day_trades
+from utils.trades import TRADE_PRICE_GAP
 
-def render_tab5(df, selected_day):
+def render_tab5(df, selected_day, season):
 
     st.subheader("🔁 Player Replacement")
 
     # -------------------------------
     # 🔹 Dynamic Day Columns
     # -------------------------------
-    import re
+    day_cols = get_day_cols(df)
 
-    day_cols = sorted(
-        [col for col in df.columns if col.startswith("day")],
-        key=lambda x: int(re.findall(r'\d+', x)[0])
-    )
-
-    df[day_cols] = df[day_cols].apply(pd.to_numeric, errors="coerce").fillna(0)
-    df["total_points"] = df[day_cols].sum(axis=1)
+    df = df.assign(total_points=df[day_cols].sum(axis=1))
 
     # -------------------------------
     # 🔹 Owner Selection
@@ -130,4 +127,31 @@ def render_tab5(df, selected_day):
         3. The replacement players fantasy XI points should be equal to or max 50 points higher the ruled out player 
         4. Points count from next match only  
         5. If player is already C/VC in another team, cannot assign C/VC again  
-        """)
\ No newline at end of file
+        """)
+
+    st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+
+    # -------------------------------
+    # 🔹 Trade Analyzer
+    # -------------------------------
+    st.subheader("🔄 Trade Analyzer")
+
+    st.caption(
+        f"1-for-1 and 2-for-2 swaps where both owners gain projected points for the rest of "
+        f"the season (form × remaining fixtures, best C/VC re-picked), price gap ≤ {TRADE_PRICE_GAP:.0f}"
+    )
+
+    trades = day_trades(season, selected_day, selected_owner)
+
+    if trades.empty:
+        st.info(f"No trade helps both {selected_owner} and another owner right now.")
+    else:
+        st.dataframe(
+            trades.style.format({
+                "Gain": "{:+.1f}",
+                "Partner Gain": "{:+.1f}",
+                "Price Δ": "{:+.0f}"
+            }),
+            use_container_width=True,
+            hide_index=True
+        )
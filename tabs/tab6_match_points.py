@@ -1,7 +1,7 @@
 import streamlit as st
-import pandas as pd
+from utils.dashboard import day_matches, match_table
 
-def render_tab6(df, matches_df, selected_day):
+def render_tab6(season, matches_df, selected_day):
 
     st.subheader("📅 Match-wise Points")
 
@@ -19,22 +19,11 @@ def render_tab6(df, matches_df, selected_day):
     # -------------------------------
     # 🔹 Get Matches
     # -------------------------------
-    rows = matches_df[matches_df["Day"] == selected_day_mp]
-
-    teams = []
-    for _, r in rows.iterrows():
-        teams.extend([t.strip() for t in r["Teams"].split(",")])
-
-    # Create match pairs
-    matches = [
-        (teams[i], teams[i+1])
-        for i in range(0, len(teams), 2)
-        if i + 1 < len(teams)
-    ]
+    matches = day_matches(matches_df, selected_day_mp)
 
     if not matches:
         st.warning("No matches found for this day.")
-        st.stop()
+        return
 
     # -------------------------------
     # 🔹 Match Selection
@@ -54,36 +43,15 @@ def render_tab6(df, matches_df, selected_day):
     # -------------------------------
     # 🔹 Points Extraction
     # -------------------------------
-    day_col = f"day{selected_day_mp}"
-
-    if day_col not in df.columns:
+    if selected_day_mp not in season.day_numbers:
         st.warning("No points data available for this day.")
-        st.stop()
-
-    match_df = df[
-        df["franchise"].isin([team1, team2])
-    ].copy()
+        return
 
-    match_df[day_col] = pd.to_numeric(
-        match_df[day_col],
-        errors="coerce"
-    ).fillna(0)
-
-    # -------------------------------
-    # 🔹 Prepare Table
-    # -------------------------------
-    display_df = match_df[
-        ["owner_name", "player_name", "franchise", day_col]
-    ].rename(columns={
-        "owner_name": "Owner",
-        "player_name": "Player",
-        "franchise": "Team",
-        day_col: "Points"
-    }).sort_values("Points", ascending=False)
+    display_df = match_table(season, selected_day_mp, team1, team2)
 
     if display_df.empty:
         st.warning("No player data available for this match.")
-        st.stop()
+        return
 
     # -------------------------------
     # 🔥 Highlight Top Performer
@@ -0,0 +1,87 @@
+import streamlit as st
+import plotly.express as px
+
+def render_tab7(h2h, effective_day):
+
+    st.subheader("⚔️ Head to Head")
+
+    st.markdown(f"""
+    <span style="color:#94a3b8;font-size:0.85rem;">
+    ℹ️ Days won by the row owner against the column owner, through Day {effective_day}.
+    </span>
+    """, unsafe_allow_html=True)
+
+    # -------------------------------
+    # 🔹 Days Won Heatmap
+    # -------------------------------
+    wins_df = h2h.wins_matrix(effective_day)
+
+    fig = px.imshow(
+        wins_df,
+        text_auto=True,
+        color_continuous_scale="Greens",
+        labels={"x": "Opponent", "y": "Owner", "color": "Days Won"}
+    )
+
+    fig.update_layout(template="plotly_dark")
+
+    st.plotly_chart(fig, use_container_width=True)
+
+    st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+
+    render_pair(h2h, effective_day)
+
+
+# reruns on its own, so switching owners never recomputes the page
+@st.fragment
+def render_pair(h2h, effective_day):
+
+    # -------------------------------
+    # 🔹 Owner Selection
+    # -------------------------------
+    col1, col2 = st.columns(2)
+
+    owner_a = col1.selectbox("Owner", h2h.owners, key="h2h_owner")
+
+    owner_b = col2.selectbox(
+        "Opponent",
+        [o for o in h2h.owners if o != owner_a],
+        key="h2h_opponent"
+    )
+
+    pair = h2h.pair(owner_a, owner_b, effective_day)
+
+    # -------------------------------
+    # 🔹 Summary
+    # -------------------------------
+    gap = pair["gap"]
+    current_gap = gap["Gap"].iloc[-1] if not gap.empty else 0
+
+    m1, m2, m3, m4 = st.columns(4)
+    m1.metric(f"{owner_a} Won", pair["wins"])
+    m2.metric(f"{owner_b} Won", pair["losses"])
+    m3.metric("Tied", pair["ties"])
+    m4.metric("Current Gap", f"{current_gap:+.1f}")
+
+    # -------------------------------
+    # 🔹 Cumulative Gap
+    # -------------------------------
+    if not gap.empty:
+        fig = px.line(gap, x="Day", y="Gap", markers=True)
+        fig.add_hline(y=0, line_dash="dot", line_color="#94a3b8")
+        fig.update_layout(
+            template="plotly_dark",
+            title=f"📈 {owner_a} − {owner_b} (cumulative)",
+            yaxis_title="Points Gap"
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+    # -------------------------------
+    # 🔹 Shared Franchises
+    # -------------------------------
+    st.markdown("#### 🤝 Shared Franchises")
+
+    if pair["shared"].empty:
+        st.info("No franchises in common.")
+    else:
+        st.dataframe(pair["shared"], use_container_width=True, hide_index=True)
@@ -0,0 +1,111 @@
+import streamlit as st
+import plotly.express as px
+
+from utils.auction import PRICE_UNIT
+
+def render_tab8(auction, effective_day):
+
+    st.subheader("💰 Auction Value")
+
+    render_value(auction, effective_day)
+
+
+# reruns on its own, so moving the day range never recomputes the page
+@st.fragment
+def render_value(auction, effective_day):
+
+    days = [d for d in auction.day_numbers if d <= effective_day] or auction.day_numbers[:1]
+
+    if len(days) > 1:
+        from_day, to_day = st.select_slider(
+            "Days", options=days, value=(days[0], days[-1]), key="auction_days"
+        )
+    else:
+        from_day = to_day = days[0]
+
+    st.markdown(f"""
+    <span style="color:#94a3b8;font-size:0.85rem;">
+    ℹ️ Raw player points (no C/VC) from Day {from_day} to Day {to_day}, per {PRICE_UNIT} of bid price.
+    </span>
+    """, unsafe_allow_html=True)
+
+    table = auction.table(from_day, to_day)
+    priced = table[table["price"] > 0]
+
+    # -------------------------------
+    # 🔹 Price vs Points + Frontier
+    # -------------------------------
+    fig = px.scatter(
+        priced,
+        x="price",
+        y="points",
+        color="owner_name",
+        symbol="frontier",
+        hover_data=["player_name", "franchise", "role", "value"],
+        labels={"price": "Bid Price", "points": "Points", "owner_name": "Owner"}
+    )
+
+    frontier = priced[priced["frontier"]].sort_values("price")
+    fig.add_scatter(
+        x=frontier["price"], y=frontier["points"], mode="lines",
+        line={"dash": "dot", "color": "#94a3b8"}, name="Value frontier"
+    )
+
+    fig.update_layout(template="plotly_dark", title="📈 Price vs Points")
+
+    st.plotly_chart(fig, use_container_width=True)
+
+    # -------------------------------
+    # 🔹 Owner Spend Efficiency
+    # -------------------------------
+    st.markdown("#### 🏦 Owner Spend Efficiency")
+
+    st.dataframe(
+        auction.owner_efficiency(from_day, to_day).rename(columns={
+            "owner_name": "Owner",
+            "spend": "Spend",
+            "points": "Points",
+            "players": "Players",
+            "frontier": "On Frontier",
+            "value": f"Pts / {PRICE_UNIT}",
+            "efficiency": "Efficiency"
+        }).style.format({
+            "Spend": "{:.0f}",
+            "Points": "{:.1f}",
+            f"Pts / {PRICE_UNIT}": "{:.2f}",
+            "Efficiency": "{:.2f}"
+        }),
+        use_container_width=True,
+        hide_index=True
+    )
+
+    # -------------------------------
+    # 🔹 Best & Worst Buys
+    # -------------------------------
+    st.markdown("#### 🎯 Best & Worst Buys")
+
+    col1, col2 = st.columns(2)
+
+    by = col1.radio("Group by", ["role", "franchise"], horizontal=True, key="auction_by",
+                    format_func=str.title)
+    k = col2.slider("Players per group", 1, 5, 3, key="auction_k")
+
+    buys = auction.best_and_worst(by, k, from_day, to_day)
+
+    st.dataframe(
+        buys[[by, "pick", "player_name", "owner_name", "price", "points", "value"]].rename(columns={
+            by: by.title(),
+            "pick": "Pick",
+            "player_name": "Player",
+            "owner_name": "Owner",
+            "price": "Price",
+            "points": "Points",
+            "value": f"Pts / {PRICE_UNIT}"
+        }).style.format({
+            "Price": "{:.0f}",
+            "Points": "{:.1f}",
+            f"Pts / {PRICE_UNIT}": "{:.2f}"
+        }),
+        use_container_width=True,
+        hide_index=True
+    )
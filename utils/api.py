@@ -0,0 +1,189 @@
+import sys
+import time
+import json
+import hashlib
+import logging
+import argparse
+import threading
+from urllib.parse import unquote, urlparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+
+from utils.data_loader import fetch_points, normalize_points, load_matches, load_captains
+from utils.season_store import SeasonStore
+from utils.dashboard import day_payload, day_hash, owner_players, records
+from utils.warmup import attach
+
+logger = logging.getLogger(__name__)
+
+API_HOST = "127.0.0.1"
+API_PORT = 8502
+
+# standalone server only: how often the drop directory is checked
+API_POLL_SECONDS = 5
+
+
+# ----------------------------------------
+# ROUTES
+# ----------------------------------------
+# /api/days
+# /api/day/<N>/standings
+# /api/day/<N>/kpis
+# /api/day/<N>/win-probability   (with elimination / clinch bounds)
+# /api/day/<N>/forecasts
+# /api/day/<N>/match-points
+# /api/day/<N>/owners/<owner>
+DAY_SECTIONS = {
+    "standings": lambda p: {"standings": p["standings"]},
+    "kpis": lambda p: {"kpis": p["kpis"], "progress": p["progress"]},
+    "win-probability": lambda p: {"win_probability": p["win_probability"], "bounds": p["bounds"]},
+    "forecasts": lambda p: {
+        "summary": p["forecast_summary"],
+        "matches": p["match_forecasts"],
+        "final": p["final_forecast"]
+    },
+    "match-points": lambda p: {"match_points": p["match_points"]},
+}
+
+
+class NotFound(Exception):
+    pass
+
+
+def resolve(season, path):
+
+    # returns (etag seed, body builder) so the body is only built on a cache miss
+    parts = [unquote(p) for p in path.strip("/").split("/")]
+
+    if parts == ["api", "days"]:
+        seed = f"days:{season.day_numbers}"
+        return seed, lambda: {"days": list(season.day_numbers)}
+
+    if len(parts) < 4 or parts[:2] != ["api", "day"] or not parts[2].isdigit():
+        raise NotFound(path)
+
+    day = int(parts[2])
+    if day not in season.day_numbers:
+        raise NotFound(f"day {day}")
+
+    seed = f"{day_hash(season, day)}:{'/'.join(parts[3:])}"
+
+    if len(parts) == 4 and parts[3] in DAY_SECTIONS:
+        section = DAY_SECTIONS[parts[3]]
+        return seed, lambda: {"day": day, **section(day_payload(season, day))}
+
+    if len(parts) == 5 and parts[3] == "owners":
+        owner = parts[4]
+        if owner not in set(season.df["owner_name"].astype(str)):
+            raise NotFound(f"owner {owner}")
+        return seed, lambda: {
+            "day": day,
+            "owner": owner,
+            "players": records(owner_players(season, day, owner))
+        }
+
+    raise NotFound(path)
+
+
+# ----------------------------------------
+# HANDLER
+# ----------------------------------------
+class ApiHandler(BaseHTTPRequestHandler):
+
+    server_version = "DashboardAPI/1.0"
+
+    def do_GET(self):
+
+        api = self.server.api
+
+        try:
+            season = api.current()
+            seed, build = resolve(season, urlparse(self.path).path)
+        except NotFound as e:
+            return self.send_json(404, {"error": f"not found: {e}"})
+
+        etag = '"' + hashlib.sha256(seed.encode()).hexdigest()[:32] + '"'
+
+        if etag in [t.strip() for t in self.headers.get("If-None-Match", "").split(",")]:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        self.send_json(200, build(), etag)
+
+    def send_json(self, status, body, etag=None):
+
+        data = json.dumps(body, ensure_ascii=False).encode()
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Cache-Control", "no-cache")
+        if etag:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, fmt, *args):
+        logger.debug(fmt, *args)
+
+
+# ----------------------------------------
+# SERVER
+# ----------------------------------------
+class ApiServer:
+
+    def __init__(self, store, host=API_HOST, port=API_PORT):
+
+        self.store = store
+        self.httpd = ThreadingHTTPServer((host, port), ApiHandler)
+        self.httpd.api = self
+        self.thread = None
+
+    def current(self):
+        # reads never poll: whoever owns the store applies new scores
+        return self.store.state
+
+    def start(self):
+
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        logger.info("API listening on %s:%s", *self.httpd.server_address[:2])
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+# ----------------------------------------
+# CLI
+#   python -m utils.api [--source local] [--port 8502]
+# ----------------------------------------
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Read-only JSON API over the dashboard.")
+    parser.add_argument("--host", default=API_HOST)
+    parser.add_argument("--port", type=int, default=API_PORT)
+    parser.add_argument("--source", choices=["sheet", "local"], default="sheet")
+    args = parser.parse_args(argv)
+
+    raw = pd.read_csv("data/points.csv") if args.source == "local" else fetch_points()
+    store = attach(SeasonStore(normalize_points(raw), load_captains(), load_matches()))
+
+    server = ApiServer(store, args.host, args.port).start()
+    print(f"Serving on http://{args.host}:{args.port}/api/days")
+
+    # no dashboard reruns here, so score drops are picked up on a timer
+    try:
+        while True:
+            time.sleep(API_POLL_SECONDS)
+            store.poll()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
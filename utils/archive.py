@@ -0,0 +1,228 @@
+import os
+import io
+import sys
+import json
+import hashlib
+import datetime
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from utils.data_loader import normalize_matches
+from utils.season_store import build_season_state
+
+# "" turns snapshots off (time travel only offers the latest data)
+ARCHIVE_DIR = os.environ.get("ARCHIVE_DIR", "data/archive")
+
+# rebuilt past seasons kept in memory for quick switching
+ARCHIVE_STATES = 4
+
+FRAMES = ["points", "captains", "matches"]
+
+# re-derived on load instead of stored
+DERIVED_COLUMNS = ["team_list"]
+
+
+# ----------------------------------------
+# COLUMN CODEC (.npy, memory-mappable)
+# ----------------------------------------
+def encode_column(series):
+
+    # (values, missing mask or None): numbers / flags as-is; text as
+    # fixed-width unicode, which np.load can map without pickling
+    if series.dtype.kind in "biuf":
+        return series.to_numpy(), None
+
+    missing = series.isna().to_numpy()
+    values = np.array([str(v) for v in series.astype(object).where(~missing, "")], dtype=str)
+
+    return values, (missing if missing.any() else None)
+
+
+def decode_column(array, dtype, missing=None):
+
+    if array.dtype.kind != "U":
+        return np.asarray(array, dtype=dtype)
+
+    values = array.tolist()
+
+    if missing is not None:
+        values = [None if m else v for v, m in zip(values, missing)]
+
+    if dtype == "category":
+        return pd.Series(values).astype("category")
+
+    if dtype == "object":
+        return pd.Series([v if v is None else sys.intern(v) for v in values], dtype=object)
+
+    return pd.Series(values, dtype=dtype)
+
+
+# ----------------------------------------
+# SNAPSHOT ARCHIVE
+# ----------------------------------------
+# Content-addressed: every column is one .npy object named by its hash, and a
+# snapshot is a manifest line listing its columns' hashes. A new day or a
+# corrected cell only adds the columns that changed; the rest are shared with
+# earlier snapshots. Objects are opened memory-mapped, so loading a snapshot
+# reads only the pages it touches.
+class SnapshotArchive:
+
+    def __init__(self, root=None):
+
+        self.root = root or ARCHIVE_DIR
+        self.objects_dir = os.path.join(self.root, "objects")
+        self.index_path = os.path.join(self.root, "snapshots.jsonl")
+        os.makedirs(self.objects_dir, exist_ok=True)
+
+        self.lock = threading.Lock()
+        self.entries = self._read_index()
+
+        # snapshot id -> rebuilt SeasonState (LRU)
+        self.states = OrderedDict()
+
+    def _read_index(self):
+
+        if not os.path.exists(self.index_path):
+            return []
+
+        with open(self.index_path) as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def _object_path(self, digest):
+        return os.path.join(self.objects_dir, digest[:2], f"{digest}.npy")
+
+    def put(self, array):
+
+        buf = io.BytesIO()
+        np.save(buf, array, allow_pickle=False)
+        data = buf.getvalue()
+
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+
+        # already stored: identical content, identical name
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+
+        return digest
+
+    def get(self, digest):
+        return np.load(self._object_path(digest), mmap_mode="r", allow_pickle=False)
+
+    def _put_column(self, col, series):
+
+        # [name, dtype, values hash, missing-mask hash or None]
+        values, missing = encode_column(series)
+
+        return [
+            col, str(series.dtype), self.put(values),
+            None if missing is None else self.put(missing)
+        ]
+
+    def snapshots(self):
+        # oldest first; positions are stable (the index is append-only)
+        return list(self.entries)
+
+    def record(self, season):
+
+        frames = {
+            name: [
+                self._put_column(col, frame[col])
+                for col in frame.columns if col not in DERIVED_COLUMNS
+            ]
+            for name, frame in zip(FRAMES, [season.df, season.cap_df, season.matches_df])
+        }
+
+        snapshot_id = hashlib.sha256(
+            json.dumps(frames, sort_keys=True).encode()
+        ).hexdigest()[:16]
+
+        with self.lock:
+            # unchanged since the last snapshot: nothing to keep
+            if self.entries and self.entries[-1]["id"] == snapshot_id:
+                return None
+
+            entry = {
+                "id": snapshot_id,
+                "taken_at": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+                "frames": frames
+            }
+
+            with open(self.index_path, "a") as f:
+                f.write(json.dumps(entry) + "\n")
+
+            self.entries.append(entry)
+
+        return entry
+
+    def load(self, entry):
+
+        # (df, cap_df, matches_df) exactly as the dashboard had them
+        frames = [
+            pd.DataFrame({
+                col: decode_column(self.get(digest), dtype, None if mask is None else self.get(mask))
+                for col, dtype, digest, mask in entry["frames"][name]
+            })
+            for name in FRAMES
+        ]
+
+        df, cap_df, matches_df = frames
+
+        return df, cap_df, normalize_matches(matches_df)
+
+    def season(self, entry):
+
+        snapshot_id = entry["id"]
+
+        with self.lock:
+            if snapshot_id in self.states:
+                self.states.move_to_end(snapshot_id)
+                return self.states[snapshot_id]
+
+        state = build_season_state(*self.load(entry))
+        state.snapshot = snapshot_id
+
+        with self.lock:
+            self.states[snapshot_id] = state
+            while len(self.states) > ARCHIVE_STATES:
+                self.states.popitem(last=False)
+
+        return state
+
+
+_archive = None
+_archive_lock = threading.Lock()
+
+
+def get_archive():
+
+    # process-wide archive, or None when ARCHIVE_DIR is ""
+    global _archive
+
+    if not ARCHIVE_DIR:
+        return None
+
+    with _archive_lock:
+        if _archive is None:
+            _archive = SnapshotArchive(ARCHIVE_DIR)
+
+    return _archive
+
+
+def record_snapshots(store):
+
+    # snapshot the data now and every new data version the store publishes
+    archive = get_archive()
+
+    if archive is not None:
+        store.subscribe(archive.record)
+        archive.record(store.state)
+
+    return store
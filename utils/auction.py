@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+
+# value = points per this many units of bid price
+PRICE_UNIT = 100
+
+PLAYER_COLUMNS = ["owner_name", "player_name", "franchise", "role"]
+
+
+# ----------------------------------------
+# LEAGUE-WIDE AUCTION VALUE
+# ----------------------------------------
+class AuctionValue:
+
+    def __init__(self, season):
+
+        df = season.df
+
+        self.players = df[PLAYER_COLUMNS].astype(object).reset_index(drop=True)
+        self.price = df["bid_price"].to_numpy(dtype=np.float64)
+        self.released = df["released_injured"].to_numpy(dtype=bool)
+
+        # raw points: what the player delivered, whoever captained him
+        self.cum_raw = season.cum_raw
+        self.day_numbers = season.day_numbers
+        self._pos = season._pos
+
+    @property
+    def nbytes(self):
+        return self.price.nbytes + self.released.nbytes
+
+    def points(self, from_day=None, to_day=None):
+
+        # per player, days from_day..to_day inclusive, from two cumulative rows
+        start = 0 if from_day is None else self._pos(from_day - 1)
+        return self.cum_raw[self._pos(to_day)] - self.cum_raw[start]
+
+    def table(self, from_day=None, to_day=None):
+
+        points = self.points(from_day, to_day)
+
+        value = np.divide(
+            points * PRICE_UNIT, self.price,
+            out=np.full_like(points, np.nan), where=self.price > 0
+        )
+
+        # unpriced rows (bonus adjustments) never compete on value
+        priced = self.price > 0
+        frontier = np.zeros(len(points), dtype=bool)
+        frontier[priced] = pareto_frontier(self.price[priced], points[priced])
+
+        return self.players.assign(
+            price=self.price,
+            points=points,
+            value=value,
+            released=self.released,
+            frontier=frontier
+        )
+
+    def owner_efficiency(self, from_day=None, to_day=None):
+
+        t = self.table(from_day, to_day)
+
+        out = t.groupby("owner_name").agg(
+            spend=("price", "sum"), points=("points", "sum"), players=("player_name", "size"),
+            frontier=("frontier", "sum")
+        )
+
+        out["value"] = out["points"] * PRICE_UNIT / out["spend"].where(out["spend"] > 0)
+
+        # > 1: the owner's share of league points beats their share of spend
+        out["efficiency"] = (out["points"] / t["points"].sum()) / (out["spend"] / t["price"].sum())
+
+        return out.sort_values("value", ascending=False).reset_index()
+
+    def best_and_worst(self, by="role", k=3, from_day=None, to_day=None):
+
+        # k best and k worst value buys within each `by` group (priced players only)
+        t = self.table(from_day, to_day).dropna(subset=[by, "value"])
+        t = t.sort_values(["value", "price"], ascending=[False, True])
+
+        rank = t.groupby(by).cumcount()
+        size = t.groupby(by)[by].transform("size")
+
+        best = t[rank < k].assign(pick="Best")
+        worst = t[(rank >= size - k) & (rank >= k)].assign(pick="Worst")
+
+        return pd.concat([best, worst.iloc[::-1]]).sort_values(
+            [by, "pick"], kind="stable"
+        ).reset_index(drop=True)
+
+
+def pareto_frontier(price, points):
+
+    # players no one beats on both: nobody cheaper-or-equal has more points
+    order = np.lexsort((-points, price))
+    best_before = np.maximum.accumulate(np.concatenate([[-np.inf], points[order][:-1]]))
+
+    on = np.zeros(len(price), dtype=bool)
+    on[order] = points[order] > best_before
+
+    return on
@@ -0,0 +1,251 @@
+import os
+import sys
+import json
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from utils.data_loader import fetch_points, normalize_points, load_matches, load_captains
+from utils.season_store import build_season_state
+from utils.forecast import fixture_projections
+from utils.probability import calculate_win_probability
+from utils.calculator import day_multipliers
+from utils.dashboard import day_hash
+from utils import form
+
+# bump when a metric changes to drop every cached result
+BACKTEST_VERSION = 2
+
+BACKTEST_CACHE = ".cache/backtest.json"
+
+FORM_METHODS = ["window", "ewma", "mean"]
+
+RELIABILITY_BINS = [0, 0.05, 0.1, 0.15, 0.2, 0.3, 0.5, 1.0]
+
+
+# ----------------------------------------
+# REPLAY HELPERS
+# ----------------------------------------
+def season_as_of(season, day):
+
+    # only the days before `day`, as the dashboard saw them that morning
+    later = [f"day{d}" for d in season.day_numbers if d >= day]
+
+    return build_season_state(
+        season.df.drop(columns=later), season.cap_df, season.matches_df
+    )
+
+
+def owner_totals(df, values):
+
+    return pd.Series(values, index=df["owner_name"]).groupby(level=0, observed=True).sum()
+
+
+def last_played_day(season):
+
+    played = [d for k, d in enumerate(season.day_numbers) if season.raw[k].any()]
+    return played[-1] if played else None
+
+
+def rank_corr(predicted, actual):
+
+    if len(predicted) < 2 or predicted.nunique() < 2 or actual.nunique() < 2:
+        return np.nan
+
+    # Spearman, as Pearson on ranks (pandas' own needs scipy)
+    return predicted.rank().corr(actual.rank())
+
+
+# ----------------------------------------
+# ONE DAY (all form methods)
+# ----------------------------------------
+def backtest_day(season, day, horizon):
+
+    df, cap_df, matches_df = season.df, season.cap_df, season.matches_df
+
+    past = season_as_of(season, day)
+    player_form = past.form(day)
+
+    current = owner_totals(df, past.scored_points(day - 1)["player_points"].to_numpy())
+
+    fixtures = matches_df[matches_df["Day"] == day]
+    remaining = matches_df[(matches_df["Day"] >= day) & (matches_df["Day"] <= horizon)]
+
+    actual_day = owner_totals(df, season.day_scored(day))
+    actual_final = owner_totals(df, season.scored_points(horizon)["player_points"].to_numpy())
+
+    # spread of each owner's match forecast, from the players' form variance
+    playing = df["franchise"].isin(
+        [t for teams in fixtures["team_list"] for t in teams]
+    ).to_numpy()
+    weight = playing * day_multipliers(df, cap_df, day)
+
+    rows = []
+
+    for method in FORM_METHODS:
+
+        level = player_form.level(method)
+
+        predicted_day = fixture_projections(df, cap_df, fixtures, level).sum(axis=1)
+        predicted_final = current + fixture_projections(df, cap_df, remaining, level).sum(axis=1)
+
+        sd = np.sqrt(owner_totals(df, weight ** 2 * player_form.variance(method)))
+        error = (predicted_day - actual_day).abs()
+
+        rows.append({
+            "day": day,
+            "method": method,
+            "match_mae": float(error.mean()) if len(fixtures) else np.nan,
+            "match_rank_corr": rank_corr(predicted_day, actual_day),
+            "match_within_1sd": float((error <= sd).mean()) if len(fixtures) else np.nan,
+            "final_mae": float((predicted_final - actual_final).abs().mean()),
+            "final_rank_corr": rank_corr(predicted_final, actual_final)
+        })
+
+    # ----------------------------------------
+    # WIN PROBABILITY (independent of the form method)
+    # ----------------------------------------
+    prob_df, _ = calculate_win_probability(
+        past.df, past.scored_points(day - 1), remaining, day, past
+    )
+
+    leader = actual_final.idxmax()
+    win = [
+        {"day": day, "p": float(p) / 100, "won": int(owner == leader)}
+        for owner, p in zip(prob_df["Owner"], prob_df["Win %"])
+    ]
+
+    return {"rows": rows, "win": win}
+
+
+# ----------------------------------------
+# WORKERS
+# ----------------------------------------
+_worker_season = None
+
+
+def _init_worker(season):
+
+    global _worker_season
+    _worker_season = season
+
+
+def _backtest_day(day, horizon):
+    return backtest_day(_worker_season, day, horizon)
+
+
+def day_key(season, day, horizon):
+
+    # the result changes with the data up to the horizon and with the form settings
+    return hashlib.sha256(
+        f"v{BACKTEST_VERSION}:{day_hash(season, horizon)}:{day}:"
+        f"{form.FORM_HALFLIFE}:{form.FORM_WINDOW}".encode()
+    ).hexdigest()
+
+
+def run_backtest(season, workers=None, force=False, cache_path=BACKTEST_CACHE):
+
+    horizon = last_played_day(season)
+    days = [d for d in season.day_numbers if horizon is not None and 1 < d <= horizon]
+
+    cache = {}
+    if os.path.exists(cache_path) and not force:
+        with open(cache_path) as f:
+            cache = json.load(f)
+
+    keys = {d: day_key(season, d, horizon) for d in days}
+    todo = [d for d in days if keys[d] not in cache]
+
+    if todo:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(season,)
+        ) as pool:
+            for d, result in zip(todo, pool.map(_backtest_day, todo, [horizon] * len(todo))):
+                cache[keys[d]] = result
+
+        os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+        with open(cache_path, "w") as f:
+            json.dump(cache, f)
+
+    results = [cache[keys[d]] for d in days]
+
+    per_day = pd.DataFrame([r for res in results for r in res["rows"]])
+    win = pd.DataFrame([w for res in results for w in res["win"]])
+
+    return per_day, win, todo
+
+
+# ----------------------------------------
+# SUMMARY
+# ----------------------------------------
+def summarize(per_day):
+
+    if per_day.empty:
+        return per_day
+
+    return (
+        per_day.drop(columns="day")
+        .groupby("method", sort=False)
+        .mean()
+        .round(3)
+    )
+
+
+def calibration(win):
+
+    # predicted Win % vs how often that owner actually led at the horizon
+    if win.empty:
+        return win, np.nan
+
+    brier = float(((win["p"] - win["won"]) ** 2).mean())
+
+    table = (
+        win.assign(bin=pd.cut(win["p"], RELIABILITY_BINS, include_lowest=True))
+        .groupby("bin", observed=True)
+        .agg(predicted=("p", "mean"), observed=("won", "mean"), n=("won", "size"))
+        .round(3)
+    )
+
+    return table, brier
+
+
+# ----------------------------------------
+# CLI
+#   python -m utils.backtest [--source local] [--workers 4] [--force]
+# ----------------------------------------
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(
+        description="Replay the played season and score the dashboard's forecasts."
+    )
+    parser.add_argument("--source", choices=["sheet", "local"], default="sheet")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--force", action="store_true")
+    parser.add_argument("--cache", default=BACKTEST_CACHE)
+    args = parser.parse_args(argv)
+
+    raw = pd.read_csv("data/points.csv") if args.source == "local" else fetch_points()
+    season = build_season_state(normalize_points(raw), load_captains(), load_matches())
+
+    per_day, win, computed = run_backtest(season, args.workers, args.force, args.cache)
+
+    if per_day.empty:
+        print("Nothing to backtest: fewer than two played days.")
+        return
+
+    table, brier = calibration(win)
+
+    print(f"Backtested days {sorted(map(int, per_day['day'].unique()))} "
+          f"against day {last_played_day(season)} ({len(computed)} computed, rest cached)\n")
+    print(summarize(per_day).to_string(), "\n")
+    print(f"Win % Brier score: {brier:.4f}")
+    print(table.to_string())
+
+
+if __name__ == "__main__":
+    sys.exit(main())
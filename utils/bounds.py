@@ -0,0 +1,114 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from utils.data_loader import get_day_cols
+from utils.scoring import RULES
+from utils.telemetry import timed
+
+# ceiling / floor on one player's points in one match; widened to the
+# season's own extremes so a bound is never beaten by real data
+MAX_MATCH_POINTS = float(os.environ.get("MAX_MATCH_POINTS", 400))
+MIN_MATCH_POINTS = float(os.environ.get("MIN_MATCH_POINTS", -20))
+
+# playoff fixtures before the teams are known
+TBC = "TBC"
+
+
+@timed("owner_bounds")
+def owner_bounds(df, current_points, matches_df, selected_day):
+
+    # ----------------------------------------
+    # PER-MATCH LIMITS
+    # ----------------------------------------
+    # only days up to `selected_day`, so a day's bounds never move with later data
+    day_values = df[
+        [c for c in get_day_cols(df) if int(c[3:]) <= selected_day]
+    ].to_numpy(dtype=np.float64)
+    ceiling = np.nanmax(day_values, initial=MAX_MATCH_POINTS)
+    floor = min(np.nanmin(day_values, initial=MIN_MATCH_POINTS), 0)
+
+    # ----------------------------------------
+    # ELIGIBLE PLAYERS IN ACTION (owners x fixtures)
+    # ----------------------------------------
+    fixtures = matches_df[matches_df["Day"] >= selected_day]
+
+    owners = df.groupby("owner_name", observed=True).size().index.astype(object)
+
+    eligible = df[~df["released_injured"]]
+    per_franchise = pd.crosstab(
+        eligible["owner_name"].astype(object),
+        eligible["franchise"].astype(object)
+    ).reindex(owners, fill_value=0)
+
+    franchises = per_franchise.columns.to_numpy()
+    owned = per_franchise.to_numpy()
+
+    counts = np.zeros((len(owned), len(fixtures)), dtype=np.int64)
+    for j, teams in enumerate(fixtures["team_list"]):
+
+        known = np.isin(franchises, list(teams))
+        counts[:, j] = owned[:, known].sum(axis=1)
+
+        # a TBC slot can be any franchise: assume each owner's best ones
+        unknown = sum(t == TBC for t in teams)
+        if unknown:
+            rest = -np.sort(-owned[:, ~known], axis=1)
+            counts[:, j] += rest[:, :unknown].sum(axis=1)
+
+    counts = pd.DataFrame(counts, index=per_franchise.index)
+
+    # best (and, with a negative floor, worst) case puts C and VC on two of
+    # them, every player at the rules' highest multiplier
+    shares = RULES.peak(eligible) * (
+        counts +
+        (RULES.slot_peak("captain") - 1) * (counts >= 1) +
+        (RULES.slot_peak("vice_captain") - 1) * (counts >= 2)
+    ).sum(axis=1)
+
+    current = current_points.reindex(shares.index).fillna(0)
+
+    upper = (current + ceiling * shares).to_numpy()
+    lower = (current + floor * shares).to_numpy()
+
+    # ----------------------------------------
+    # RANK RANGE (owners x owners)
+    # ----------------------------------------
+    others = ~np.eye(len(shares), dtype=bool)
+
+    best_rank = 1 + ((lower[None, :] > upper[:, None]) & others).sum(axis=1)
+    worst_rank = 1 + ((upper[None, :] >= lower[:, None]) & others).sum(axis=1)
+
+    bounds_df = pd.DataFrame({
+        "Owner": shares.index,
+        "Current": current.to_numpy(),
+        "Min Final": lower.round(1),
+        "Max Final": upper.round(1),
+        "Best Rank": best_rank,
+        "Worst Rank": worst_rank
+    })
+
+    bounds_df["Status"] = [
+        format_status(b, w, len(bounds_df))
+        for b, w in zip(best_rank, worst_rank)
+    ]
+
+    return bounds_df
+
+
+def format_status(best_rank, worst_rank, n_owners):
+
+    if best_rank == worst_rank == 1:
+        return "🏆 Clinched 1st"
+
+    if best_rank == worst_rank:
+        return f"🔒 Clinched #{best_rank}"
+
+    if best_rank > 1:
+        return "❌ Eliminated"
+
+    if worst_rank < n_owners:
+        return f"🔒 Top {worst_rank}"
+
+    return "—"
@@ -1,4 +1,9 @@
 import pandas as pd
+import numpy as np
+
+from utils.scoring import RULES
+
+SCORED_COLUMNS = ["owner_name", "player_name", "franchise", "role"]
 
 def get_current_c_vc(cap_df, owner, day):
 
@@ -14,30 +19,29 @@ def get_current_c_vc(cap_df, owner, day):
     return row["captain"], row["vice_captain"]
 
 
+def day_multipliers(df, cap_df, day):
+
+    # scoring-rule multiplier of every roster row on `day`, as one vector
+    mult, _ = RULES.compile(df, cap_df, [day])
+
+    return mult[0]
+
+
 def calculate_points(df, cap_df, upto_day):
 
-    temp = df.copy()
-    temp["player_points"] = 0.0
+    # slim view of the id columns; the day matrix is never copied
+    temp = df[SCORED_COLUMNS]
+    temp = temp.assign(player_points=0.0)
 
     for d in range(1, upto_day + 1):
 
         day_col = f"day{d}"
-        if day_col not in temp.columns:
+        if day_col not in df.columns:
             continue
 
-        points = pd.to_numeric(temp[day_col], errors="coerce").fillna(0)
-        multiplier = pd.Series(1.0, index=temp.index)
-
-        for owner in temp["owner_name"].unique():
-            c, vc = get_current_c_vc(cap_df, owner, d)
-
-            mask = temp["owner_name"] == owner
-
-            if c:
-                multiplier.loc[mask & (temp["player_name"] == c)] = 2.0
-            if vc:
-                multiplier.loc[mask & (temp["player_name"] == vc)] = 1.5
+        points = df[day_col].fillna(0).astype(float)
+        multiplier = day_multipliers(df, cap_df, d)
 
         temp["player_points"] += points * multiplier
 
-    return temp
\ No newline at end of file
+    return temp
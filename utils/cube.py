@@ -0,0 +1,96 @@
+import numpy as np
+
+# every roster row falls in exactly one (owner, franchise, role) cell
+DIMENSIONS = ["owner_name", "franchise", "role"]
+
+# players below this many scored points count as "dead" in Squad Quality
+ACTIVE_POINTS = 10
+
+
+def group_sum(values, codes, n_groups):
+
+    # (..., rows) -> (..., n_groups): sums the last axis by group code, one
+    # contiguous run per group after a stable sort (no rows x groups matrix)
+    order = np.argsort(codes, kind="stable")
+    present, starts = np.unique(codes[order], return_index=True)
+
+    out = np.zeros(values.shape[:-1] + (n_groups,))
+    if len(present):
+        out[..., present] = np.add.reduceat(
+            values[..., order].astype(np.float64, copy=False), starts, axis=-1
+        )
+
+    return out
+
+
+# ----------------------------------------
+# OWNER x FRANCHISE x ROLE x DAY CUBE
+# ----------------------------------------
+class PointsCube:
+
+    def __init__(self, season):
+
+        df = season.df
+
+        # rows missing a franchise/role keep a NaN cell; slices by that
+        # dimension drop it, as a plain groupby would
+        groups = df.groupby(DIMENSIONS, observed=True, dropna=False)
+
+        # one row per non-empty cell, in groupby order
+        self.keys = groups.size().reset_index(name="players")[DIMENSIONS]
+        self.day_numbers = season.day_numbers
+        self._pos = season._pos
+
+        # roster row -> cell code; measures are summed by code, so memory
+        # stays O(rows + cells) per day however many owners there are
+        cell = groups.ngroup().to_numpy()
+        n_cells = len(self.keys)
+
+        # static measures (cells)
+        self.players = np.bincount(cell, minlength=n_cells).astype(np.float64)
+        self.eligible = np.bincount(
+            cell, weights=~df["released_injured"].to_numpy(dtype=bool), minlength=n_cells
+        )
+
+        # cumulative measures ((days + 1) x cells, row k = after the first k days)
+        self.scored = group_sum(season.cum_scored, cell, n_cells)
+        self.raw = group_sum(season.cum_raw, cell, n_cells)
+        self.active = group_sum(season.cum_scored >= ACTIVE_POINTS, cell, n_cells)
+
+        # roster rows per franchise, for player-level drill-downs
+        self.franchise_rows = df.groupby("franchise", observed=True).indices
+
+    @property
+    def nbytes(self):
+        return sum(
+            a.nbytes for a in
+            [self.players, self.eligible, self.scored, self.raw, self.active]
+        )
+
+    def measure(self, name, upto_day=None):
+
+        values = getattr(self, name)
+
+        if values.ndim == 1:
+            return values
+
+        return values[self._pos(upto_day)]
+
+    def slice(self, by, measure="scored", upto_day=None, **filters):
+
+        # sum of `measure` over every dimension not in `by`
+        cells = self.keys.assign(**{measure: self.measure(measure, upto_day)})
+
+        for dim, values in filters.items():
+            cells = cells[cells[dim].isin(np.atleast_1d(values))]
+
+        return cells.groupby(by, observed=True)[measure].sum().reset_index()
+
+    def rows(self, franchises):
+
+        found = [self.franchise_rows[f] for f in franchises if f in self.franchise_rows]
+
+        if not found:
+            return np.array([], dtype=int)
+
+        return np.sort(np.concatenate(found))
@@ -0,0 +1,509 @@
+import json
+import sqlite3
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from utils.data_loader import get_day_cols
+from utils.standings import prepare_team_standings
+from utils.probability import calculate_win_probability
+from utils.forecast import upcoming_match_forecasts, final_forecast
+from utils.bounds import owner_bounds
+from utils.cube import PointsCube
+from utils.head_to_head import HeadToHead
+from utils.auction import AuctionValue
+from utils.trades import find_trades
+from utils.digest import compute_digest
+from utils.helpers import watchlist_horizon
+from utils.history import get_history
+from utils.scoring import RULES
+from utils.telemetry import CACHE_REQUESTS, COMPUTE_SECONDS
+
+logger = logging.getLogger(__name__)
+
+TOTAL_MATCHES = 74
+
+# days covered by the week-ahead planner
+PLANNER_DAYS = 7
+
+# (kind, season version, day) -> result, shared by app sessions, export and api
+DAY_CACHE_SIZE = 256
+
+_day_cache = OrderedDict()
+_day_cache_lock = threading.Lock()
+
+# (kind, lineage, day) -> (season version, result) of the newest result
+# computed, served while a newer version is still being computed. The
+# lineage is the archive snapshot id (None for the live data), so a
+# time-travel view and the live one never stand in for each other.
+# Bounded like the day cache, least recently used first out.
+LATEST_SIZE = 256
+
+_latest = OrderedDict()
+
+
+def _lookup(kind, season, day):
+
+    # caller holds _day_cache_lock
+    key = (kind, season.version, day)
+
+    if key in _day_cache:
+        _day_cache.move_to_end(key)
+        return _day_cache[key]
+
+    # a day before the first changed day is unaffected by a newer snapshot
+    if day is not None:
+        for version, first_day in season.reusable:
+            if day < first_day and (kind, version, day) in _day_cache:
+                return _day_cache[(kind, version, day)]
+
+    return None
+
+
+def cached(kind, season, day, build):
+
+    key = (kind, season.version, day)
+
+    # one label per result kind, not per owner/variant
+    label = kind.split(":")[0]
+
+    with _day_cache_lock:
+        value = _lookup(kind, season, day)
+        if key in _day_cache:
+            CACHE_REQUESTS.inc(kind=label, outcome="hit")
+            return value
+
+    if value is None:
+        CACHE_REQUESTS.inc(kind=label, outcome="miss")
+        with COMPUTE_SECONDS.time(function=f"cached:{label}"):
+            value = build(season, day)
+    else:
+        CACHE_REQUESTS.inc(kind=label, outcome="reuse")
+
+    with _day_cache_lock:
+        _day_cache[key] = value
+        while len(_day_cache) > DAY_CACHE_SIZE:
+            _day_cache.popitem(last=False)
+
+        lineage = (kind, season.snapshot, day)
+        if _latest.get(lineage, (-1, None))[0] <= season.version:
+            _latest[lineage] = (season.version, value)
+        _latest.move_to_end(lineage)
+        while len(_latest) > LATEST_SIZE:
+            _latest.popitem(last=False)
+
+    return value
+
+
+def peek(kind, season, day):
+
+    # cached result for this season, or None; never computes
+    with _day_cache_lock:
+        return _lookup(kind, season, day)
+
+
+def latest(kind, season, day):
+
+    # newest result computed for `day` under any version of this season's
+    # lineage, or None
+    lineage = (kind, season.snapshot, day)
+
+    with _day_cache_lock:
+        if lineage not in _latest:
+            return None
+        _latest.move_to_end(lineage)
+        return _latest[lineage][1]
+
+
+# ----------------------------------------
+# SHARED COMPUTE CORE (app, export, api)
+# ----------------------------------------
+def compute_day(season, selected_day):
+
+    df, matches_df, cap_df = season.df, season.matches_df, season.cap_df
+
+    effective_day = max(selected_day - 1, 1)
+
+    team_df, scored_df, top_owner, low_owner, max_points, min_points = prepare_team_standings(
+        df, cap_df, matches_df, selected_day, effective_day, season
+    )
+
+    bounds_df = owner_bounds(
+        df, team_df.set_index("Owner")["Points"], matches_df, selected_day
+    )
+
+    prob_df, explanations = calculate_win_probability(
+        df, scored_df, matches_df, selected_day, season, bounds_df
+    )
+
+    prob_map = prob_df.set_index("Owner")["Win %"]
+
+    team_df["Win %"] = team_df["Owner"].map(prob_map)
+    team_df["Status"] = team_df["Owner"].map(dict(zip(bounds_df["Owner"], bounds_df["Status"])))
+
+    return {
+        "selected_day": selected_day,
+        "effective_day": effective_day,
+        "team_df": team_df,
+        "scored_df": scored_df,
+        "top_owner": top_owner,
+        "low_owner": low_owner,
+        "max_points": max_points,
+        "min_points": min_points,
+        "prob_df": prob_df,
+        "bounds_df": bounds_df,
+        "explanations": explanations
+    }
+
+
+def day_view(season, day):
+    return cached("view", season, day, compute_day)
+
+
+# ----------------------------------------
+# FORECASTS
+# ----------------------------------------
+def compute_forecasts(season, day):
+
+    df, matches_df, cap_df = season.df, season.matches_df, season.cap_df
+    team_df = day_view(season, day)["team_df"]
+
+    all_match_forecasts, summary_df = upcoming_match_forecasts(
+        df, cap_df, matches_df, day, season
+    )
+
+    forecast_df = final_forecast(df, team_df, cap_df, matches_df, day, season)
+    record_day(season, day, forecast_df)
+
+    previous_df = previous_forecast(season, max(day - 1, 1))
+
+    return {
+        "match_forecasts": all_match_forecasts,
+        "summary_df": summary_df,
+        "forecast_df": forecast_df,
+        "previous_df": previous_df
+    }
+
+
+def day_forecasts(season, day):
+    return cached("forecasts", season, day, compute_forecasts)
+
+
+# ----------------------------------------
+# HISTORY (persisted per-day results)
+# ----------------------------------------
+def record_day(season, day, forecast_df):
+
+    # a past snapshot never overwrites what the latest data recorded
+    history = get_history()
+    if history is None or season.snapshot is not None:
+        return
+
+    view = day_view(season, day)
+
+    try:
+        history.record([(day, day_hash(season, day), view["team_df"], forecast_df, view["prob_df"])])
+    except sqlite3.Error as e:
+        logger.warning("Could not record day %s in history: %s", day, e)
+
+
+def previous_forecast(season, day):
+
+    # the forecast published for `day`, from history when it matches this data
+    history = get_history()
+
+    if history is not None:
+        try:
+            stored = history.final_forecast(day, day_hash(season, day))
+        except sqlite3.Error as e:
+            logger.warning("Could not read day %s from history: %s", day, e)
+            stored = None
+
+        if stored is not None:
+            return stored
+
+    df, matches_df, cap_df = season.df, season.matches_df, season.cap_df
+    team_df = day_view(season, day)["team_df"]
+
+    forecast_df = final_forecast(df, team_df, cap_df, matches_df, day, season)
+    record_day(season, day, forecast_df)
+
+    return forecast_df
+
+
+def compute_captains(season, day):
+
+    df, cap_df = season.df, season.cap_df
+
+    # consecutive repeats collapse: "A → B" plus the number of switches
+    def format_history(series):
+        if series.empty:
+            return "—", 0
+
+        cleaned = []
+        prev = None
+
+        for name in series.tolist():
+            if name != prev:
+                cleaned.append(name)
+                prev = name
+
+        history_str = cleaned[0] if len(cleaned) == 1 else " → ".join(cleaned)
+        changes = max(len(cleaned) - 1, 0)
+
+        return history_str, changes
+
+    rows = []
+
+    for owner in df["owner_name"].unique():
+
+        oc = cap_df[
+            cap_df["owner_name"] == owner
+        ].sort_values("from_day")
+
+        if not oc.empty:
+            captain_history, cap_changes = format_history(oc["captain"])
+            vc_history, vc_changes = format_history(oc["vice_captain"])
+        else:
+            captain_history, vc_history = "—", "—"
+            cap_changes, vc_changes = 0, 0
+
+        rows.append({
+            "Owner": owner,
+            "Captain": captain_history,
+            "Cap Points": season.c_vc_points(df, cap_df, owner, day, role="captain"),
+            "Vice Captain": vc_history,
+            "VC Points": season.c_vc_points(df, cap_df, owner, day, role="vice_captain"),
+            "Changes": cap_changes + vc_changes
+        })
+
+    return pd.DataFrame(rows)
+
+
+def day_captains(season, day):
+    return cached("captains", season, day, compute_captains)
+
+
+def compute_planner(season, day):
+
+    # eligible players in action over the next PLANNER_DAYS days, with the
+    # same form-based expected points as the match forecasts
+    return watchlist_horizon(
+        season.df, season.matches_df, season.cap_df, day,
+        days=PLANNER_DAYS, level=season.form(day).level()
+    )
+
+
+def day_planner(season, day):
+    return cached("planner", season, day, compute_planner)
+
+
+def day_digest(season, day):
+    return cached("digest", season, day, compute_digest)
+
+
+def season_progress(matches_df, selected_day, total_matches=TOTAL_MATCHES):
+
+    completed_df = matches_df[
+        matches_df["Day"] < selected_day
+    ]
+
+    matches_completed = completed_df["team_list"].apply(
+        lambda x: len(x) // 2
+    ).sum()
+
+    return matches_completed, matches_completed / total_matches
+
+
+def season_cube(season):
+    return cached("cube", season, None, lambda s, _: PointsCube(s))
+
+
+def season_h2h(season):
+    return cached("h2h", season, None, lambda s, _: HeadToHead(season_cube(s)))
+
+
+def day_trades(season, day, owner):
+
+    # best mutually beneficial 1-for-1 / 2-for-2 trades for `owner`
+    return cached(f"trades:{owner}", season, day, lambda s, d: find_trades(s, owner, d))
+
+
+def season_auction(season):
+    return cached("auction", season, None, lambda s, _: AuctionValue(s))
+
+
+def day_matches(matches_df, day):
+
+    # (team1, team2) pairs played on `day`
+    rows = matches_df[matches_df["Day"] == day]
+
+    teams = []
+    for team_list in rows["team_list"]:
+        teams.extend(team_list)
+
+    return [
+        (teams[i], teams[i+1])
+        for i in range(0, len(teams), 2)
+        if i + 1 < len(teams)
+    ]
+
+
+def match_table(season, day, team1, team2):
+
+    # players of both franchises with their points on `day`
+    rows = season_cube(season).rows([team1, team2])
+
+    display_df = season.df.iloc[rows][
+        ["owner_name", "player_name", "franchise"]
+    ].assign(Points=season.day_points(day)[rows]).rename(columns={
+        "owner_name": "Owner",
+        "player_name": "Player",
+        "franchise": "Team"
+    }).sort_values("Points", ascending=False)
+
+    return display_df
+
+
+def match_points(season, day):
+
+    # per match on `day`: (team1, team2, player points frame)
+    if day not in season.day_numbers:
+        return []
+
+    return [
+        (team1, team2, match_table(season, day, team1, team2))
+        for team1, team2 in day_matches(season.matches_df, day)
+    ]
+
+
+# ----------------------------------------
+# JSON PAYLOAD (export + api)
+# ----------------------------------------
+def records(df):
+
+    return json.loads(df.to_json(orient="records"))
+
+
+def owner_players(season, day, owner):
+
+    scored_df = day_view(season, day)["scored_df"]
+
+    owner_df = (
+        scored_df
+        .loc[scored_df["owner_name"] == owner]
+        .groupby(["player_name", "franchise"], observed=True)["player_points"]
+        .sum()
+        .reset_index()
+        .sort_values("player_points", ascending=False)
+        .rename(columns={
+            "player_name": "Player",
+            "franchise": "Franchise",
+            "player_points": "Points"
+        })
+    )
+
+    caps = season.cap_df[
+        (season.cap_df["owner_name"] == owner) &
+        (season.cap_df["from_day"] <= day)
+    ]
+
+    c = vc = None
+    if not caps.empty:
+        c, vc = caps.iloc[-1]["captain"], caps.iloc[-1]["vice_captain"]
+
+    owner_df["C / VC"] = owner_df["Player"].map(
+        lambda p: "Captain" if p == c else "Vice Captain" if p == vc else ""
+    )
+
+    return owner_df
+
+
+def compute_payload(season, day):
+
+    matches_df = season.matches_df
+
+    view = day_view(season, day)
+    team_df = view["team_df"]
+
+    forecasts = day_forecasts(season, day)
+    forecast_df = forecasts["forecast_df"]
+    previous_df = forecasts["previous_df"]
+
+    forecast_df = forecast_df.assign(Delta=(
+        forecast_df["Predicted Final"] -
+        forecast_df["Owner"].map(dict(zip(previous_df["Owner"], previous_df["Predicted Final"])))
+    ).round(1))
+
+    matches_completed, progress = season_progress(matches_df, day)
+
+    return {
+        "day": day,
+        "kpis": {
+            "teams": len(team_df),
+            "leader": str(team_df.iloc[0]["Owner"]),
+            "top_owner": str(view["top_owner"]),
+            "max_points": float(view["max_points"]),
+            "low_owner": str(view["low_owner"]),
+            "min_points": float(view["min_points"])
+        },
+        "progress": {
+            "matches_completed": int(matches_completed),
+            "total_matches": TOTAL_MATCHES,
+            "percent": round(float(progress) * 100, 1)
+        },
+        "standings": records(team_df[
+            ["Rank", "Owner", "Points", "Movement", "Next Rank", "1st Rank", "Win %", "Status", "Watchlist"]
+        ]),
+        "win_probability": records(view["prob_df"]),
+        "bounds": records(view["bounds_df"]),
+        "forecast_summary": records(forecasts["summary_df"]),
+        "match_forecasts": {
+            label: records(f) for label, f in forecasts["match_forecasts"].items()
+        },
+        "final_forecast": records(forecast_df),
+        "franchise_points": records(
+            season_cube(season).slice("franchise", upto_day=view["effective_day"])
+            .rename(columns={"scored": "player_points"})
+        ),
+        "match_points": [
+            {"match": f"{t1} vs {t2}", "players": records(players)}
+            for t1, t2, players in match_points(season, day)
+        ]
+    }
+
+
+def day_payload(season, day):
+    return cached("payload", season, day, compute_payload)
+
+
+# ----------------------------------------
+# DATA HASH (what a day's numbers depend on)
+# ----------------------------------------
+def frame_digest(h, frame):
+
+    h.update(",".join(map(str, frame.columns)).encode())
+    h.update(pd.util.hash_pandas_object(frame, index=True).to_numpy().tobytes())
+
+
+def compute_day_hash(season, day):
+
+    df = season.df
+    day_cols = [c for c in get_day_cols(df) if int(c[3:]) <= day]
+    id_cols = [c for c in df.columns if c not in get_day_cols(df)]
+
+    h = hashlib.sha256(f"day{day}:{RULES.digest()}".encode())
+
+    frame_digest(h, df[id_cols].astype(str))
+    frame_digest(h, df[day_cols])
+    frame_digest(h, season.cap_df)
+    frame_digest(h, season.matches_df[["Day", "Teams"]])
+
+    return h.hexdigest()
+
+
+def day_hash(season, day):
+    return cached("hash", season, day, compute_day_hash)
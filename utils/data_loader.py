@@ -1,33 +1,174 @@
 import pandas as pd
+import numpy as np
 import streamlit as st
 import os
+import time
+import sys
+
+from utils.telemetry import FETCH_SECONDS, FETCHES
+
+# ----------------------------------------
+# SCHEMA
+# ----------------------------------------
+POINTS_COLUMNS = [
+    "owner_name", "player_name", "franchise",
+    "bid_price", "role", "released_injured"
+]
+MATCHES_COLUMNS = ["Day", "Teams"]
+CAPTAINS_COLUMNS = ["owner_name", "from_day", "captain", "vice_captain"]
+
+CATEGORY_COLUMNS = ["owner_name", "franchise", "role"]
+
+# day points are whole numbers (or .5 after multipliers), float32 is exact
+DAY_DTYPE = "float32"
+
+
+def validate_schema(df, required, source):
+
+    missing = [c for c in required if c not in df.columns]
+
+    if missing:
+        raise ValueError(
+            f"{source} is missing required columns: {', '.join(missing)}"
+        )
+
+    return df
+
+
+def get_day_cols(df):
+
+    return sorted(
+        [c for c in df.columns if c.startswith("day") and c[3:].isdigit()],
+        key=lambda c: int(c[3:])
+    )
+
+
+def day_matrix(df):
+
+    # players x days; a view onto the single float32 block built at ingestion
+    return df[get_day_cols(df)].to_numpy()
+
+
+def intern_names(series):
+
+    return pd.Series(
+        [sys.intern(str(n)) for n in series],
+        index=series.index,
+        dtype=object
+    )
+
+
+# ----------------------------------------
+# NORMALIZATION (run once at ingestion)
+# ----------------------------------------
+def normalize_points(df):
+
+    df = df.copy()
+    df.columns = df.columns.str.lower().str.strip().str.replace(" ", "", regex=False)
+
+    validate_schema(df, POINTS_COLUMNS, "points sheet")
+
+    for col in ["owner_name", "player_name", "franchise", "role"]:
+        df[col] = df[col].astype(str).str.strip()
+
+    df["player_name"] = intern_names(df["player_name"])
+
+    df["bid_price"] = pd.to_numeric(df["bid_price"], errors="coerce").fillna(0)
+
+    df["released_injured"] = (
+        df["released_injured"].fillna("").astype(str).str.strip().str.upper() == "Y"
+    )
+
+    day_cols = get_day_cols(df)
+
+    # one contiguous players x days block instead of a column per day
+    days = pd.DataFrame(
+        df[day_cols].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=DAY_DTYPE),
+        columns=day_cols,
+        index=df.index
+    )
+
+    for col in CATEGORY_COLUMNS:
+        df[col] = df[col].astype("category")
+
+    other_cols = [c for c in df.columns if c not in POINTS_COLUMNS and c not in day_cols]
+
+    return pd.concat(
+        [df[POINTS_COLUMNS + other_cols], days],
+        axis=1
+    ).reset_index(drop=True)
+
+
+def normalize_matches(df):
+
+    df = df.copy()
+    df.columns = [c.strip() for c in df.columns]
+
+    validate_schema(df, MATCHES_COLUMNS, "matches file")
+
+    df["Day"] = pd.to_numeric(df["Day"], errors="coerce")
+    df = df.dropna(subset=["Day"])
+    df["Day"] = df["Day"].astype(int)
+
+    df["Teams"] = df["Teams"].fillna("").astype(str)
+    df["team_list"] = df["Teams"].apply(
+        lambda x: tuple(t.strip() for t in x.split(",") if t.strip())
+    )
+
+    return df.sort_values("Day").reset_index(drop=True)
+
+
+def normalize_captains(df):
+
+    df = df.copy()
+    df.columns = df.columns.str.lower().str.strip()
+
+    validate_schema(df, CAPTAINS_COLUMNS, "captain changes file")
+
+    df["from_day"] = pd.to_numeric(df["from_day"], errors="coerce").fillna(1).astype(int)
+
+    for col in ["owner_name", "captain", "vice_captain"]:
+        df[col] = intern_names(df[col].fillna("").astype(str).str.strip())
+
+    return df.sort_values(["owner_name", "from_day"], kind="stable").reset_index(drop=True)
+
 
 #for local csv
 # def load_data():
 #     df = pd.read_csv("data/points.csv")
-#     df.columns = df.columns.str.lower().str.strip().str.replace(" ", "", regex=False)
-#     return df
+#     return normalize_points(df)
 
 #for google sheet
-@st.cache_data
-def load_data():
+SHEET_ID = "1CrJzdeHFFctEivaPZ1nFsN2OlZ-D6iFeZoG5b0V4GEQ"
 
-    sheet_id = "1CrJzdeHFFctEivaPZ1nFsN2OlZ-D6iFeZoG5b0V4GEQ"
+def fetch_points():
 
-    url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/export?format=csv"
+    # raw, uncached read of the sheet (live mode polls this directly)
+    url = f"https://docs.google.com/spreadsheets/d/{SHEET_ID}/export?format=csv"
 
-    df = pd.read_csv(url)
+    start = time.perf_counter()
+    outcome = "error"
+    try:
+        raw = pd.read_csv(url)
+        outcome = "ok"
+        return raw
+    finally:
+        FETCH_SECONDS.observe(time.perf_counter() - start, outcome=outcome)
+        FETCHES.inc(outcome=outcome)
 
-    return df
+@st.cache_data
+def load_data():
+
+    return normalize_points(fetch_points())
 
 def load_matches():
     if os.path.exists("data/matches_by_day.csv"):
-        return pd.read_csv("data/matches_by_day.csv")
-    return pd.DataFrame(columns=["Day", "Teams"])
+        return normalize_matches(pd.read_csv("data/matches_by_day.csv"))
+    return normalize_matches(pd.DataFrame(columns=["Day", "Teams"]))
 
 def load_captains():
     if os.path.exists("data/captain_changes.csv"):
-        df = pd.read_csv("data/captain_changes.csv")
-        df.columns = df.columns.str.lower().str.strip()
-        return df
-    return pd.DataFrame(columns=["owner_name","from_day","captain","vice_captain"])
\ No newline at end of file
+        return normalize_captains(pd.read_csv("data/captain_changes.csv"))
+    return normalize_captains(
+        pd.DataFrame(columns=["owner_name","from_day","captain","vice_captain"])
+    )
@@ -0,0 +1,160 @@
+import numpy as np
+import pandas as pd
+
+from utils.scoring import CAPTAIN, VICE_CAPTAIN
+from utils.cube import group_sum
+
+# rows per digest table
+DIGEST_TOP = 5
+
+# streaks shorter than this aren't news
+MIN_STREAK = 2
+
+SLOT_LABELS = {CAPTAIN: "C", VICE_CAPTAIN: "VC"}
+
+TABLES = ["players", "captains", "swaps", "movers", "streaks"]
+
+
+def top_k(values, k=DIGEST_TOP):
+
+    # indices of the k largest, largest first; argpartition keeps it O(n)
+    # with only the k winners sorted
+    k = min(k, len(values))
+    if k == 0:
+        return np.array([], dtype=np.int64)
+
+    idx = np.argpartition(-values, k - 1)[:k]
+    return idx[np.argsort(-values[idx], kind="stable")]
+
+
+def _ranks(points):
+
+    # (days + 1) x owners -> 1-based standings rank per row, ties by owner order
+    order = np.argsort(-points, axis=1, kind="stable")
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(1, points.shape[1] + 1)[None, :], axis=1)
+    return ranks
+
+
+def _trailing(flags):
+
+    # days x owners -> length of the run of True ending at the last row
+    rev = flags[::-1]
+    return np.where(rev.all(axis=0), len(rev), rev.argmin(axis=0))
+
+
+# ----------------------------------------
+# DAILY DIGEST ("what changed today")
+# ----------------------------------------
+# One pass: the day's raw / scored rows plus the owners' cumulative standings
+# (every day at once, summed by owner code) give all the tables below.
+def compute_digest(season, selected_day):
+
+    day = max(selected_day - 1, 1)
+
+    # no points column for the day (yet): nothing happened to report
+    if day not in season.day_numbers:
+        return {"day": day, **{t: pd.DataFrame() for t in TABLES}}
+
+    pos = season._pos(day)
+
+    df = season.df
+    owner_codes = df["owner_name"].cat.codes.to_numpy()
+    owners = np.asarray(df["owner_name"].cat.categories, dtype=object)
+
+    # standings after each of the first `pos` days; row 0 = before day 1
+    standings = group_sum(season.cum_scored[:pos + 1], owner_codes, len(owners))
+    ranks = _ranks(standings)
+
+    players = df["player_name"].to_numpy()
+    player_owner = owners[owner_codes]
+
+    raw = season.raw[pos - 1]
+    scored = season.scored[pos - 1]
+    tags = season.tags[pos - 1]
+
+    # -------------------------------
+    # top performances (league-wide; unpriced bonus rows excluded)
+    # -------------------------------
+    real = (df["bid_price"].to_numpy() > 0) & (raw > 0)
+    best = np.flatnonzero(real)[top_k(raw[real])]
+
+    top_players = pd.DataFrame({
+        "Player": players[best],
+        "Owner": player_owner[best],
+        "Team": df["franchise"].astype(object).to_numpy()[best],
+        "Points": raw[best]
+    })
+
+    # -------------------------------
+    # captain hauls (C/VC points, multiplier included)
+    # -------------------------------
+    slot = ((tags == CAPTAIN) | (tags == VICE_CAPTAIN)) & (scored > 0)
+    hauls = np.flatnonzero(slot)[top_k(scored[slot])]
+
+    captains = pd.DataFrame({
+        "Owner": player_owner[hauls],
+        "Player": players[hauls],
+        "Role": [SLOT_LABELS[t] for t in tags[hauls]],
+        "Points": raw[hauls],
+        "Haul": scored[hauls]
+    })
+
+    # -------------------------------
+    # rank movement (needs a previous day)
+    # -------------------------------
+    today, before = ranks[pos], ranks[pos - 1]
+    gained = standings[pos] - standings[pos - 1]
+
+    if pos > 1:
+        # i was above j yesterday and is below today
+        passed = (before[:, None] < before[None, :]) & (today[:, None] > today[None, :])
+        lost_to, overtook = np.nonzero(passed)
+
+        swaps = pd.DataFrame({
+            "Owner": owners[overtook],
+            "Overtook": owners[lost_to],
+            "New Rank": today[overtook],
+            "Day Points": gained[overtook]
+        }).sort_values("New Rank", kind="stable")
+
+        move = before - today
+        moved = np.flatnonzero(move)
+
+        movers = pd.DataFrame({
+            "Owner": owners[moved],
+            "Rank": today[moved],
+            "Movement": move[moved],
+            "Day Points": gained[moved]
+        }).sort_values(["Movement", "Rank"], ascending=[False, True], kind="stable")
+    else:
+        swaps = movers = pd.DataFrame()
+
+    # -------------------------------
+    # streaks up to this day
+    # -------------------------------
+    day_totals = np.diff(standings, axis=0)
+    league_mean = day_totals.mean(axis=1, keepdims=True)
+
+    hot = _trailing(day_totals > league_mean)
+    cold = _trailing(day_totals < league_mean)
+    held = _trailing(ranks[1:] == today[None, :])
+
+    streaks = pd.concat([
+        pd.DataFrame({"Owner": owners, "Streak": "🔥 Above league average", "Days": hot}),
+        pd.DataFrame({"Owner": owners, "Streak": "🧊 Below league average", "Days": cold}),
+        pd.DataFrame({"Owner": owners, "Streak": [f"📌 Holding #{r}" for r in today], "Days": held})
+    ], ignore_index=True)
+
+    streaks = streaks[streaks["Days"] >= MIN_STREAK].sort_values(
+        "Days", ascending=False, kind="stable"
+    ).reset_index(drop=True)
+
+    return {
+        "day": day,
+        "players": top_players,
+        "captains": captains,
+        "swaps": swaps.reset_index(drop=True),
+        "movers": movers.reset_index(drop=True),
+        "streaks": streaks
+    }
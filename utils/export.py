@@ -0,0 +1,228 @@
+import os
+import sys
+import json
+import html
+import shutil
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+import plotly.express as px
+
+from utils.data_loader import fetch_points, normalize_points, load_matches, load_captains
+from utils.season_store import build_season_state
+from utils.dashboard import day_payload, day_hash
+
+# bump when the page layout or payload changes to force a full rebuild
+EXPORT_VERSION = 3
+
+PLOTLY_CDN = "https://cdn.plot.ly/plotly-2.35.2.min.js"
+
+
+def day_input_hash(season, day):
+
+    return hashlib.sha256(f"v{EXPORT_VERSION}:{day_hash(season, day)}".encode()).hexdigest()
+
+
+# ----------------------------------------
+# HTML
+# ----------------------------------------
+def table_html(rows, columns=None):
+
+    if not rows:
+        return "<p class='subtitle'>No data.</p>"
+
+    return pd.DataFrame(rows, columns=columns).to_html(
+        index=False, na_rep="—", float_format=lambda x: f"{x:.1f}", border=0
+    )
+
+
+def chart_html(fig):
+
+    fig.update_layout(template="plotly_dark")
+    return fig.to_html(full_html=False, include_plotlyjs=False)
+
+
+# day links come from manifest.json, so adding a day never invalidates older pages
+NAV_SCRIPT = """<script>
+fetch("../../manifest.json").then(r => r.json()).then(m => {
+  document.getElementById("nav").innerHTML = Object.keys(m.days)
+    .map(d => `<a href="../${d}/index.html">${d}</a>`).join(" ");
+});
+</script>"""
+
+
+def render_day_html(payload):
+
+    day = payload["day"]
+    k = payload["kpis"]
+    e = html.escape
+
+    kpi_cards = "".join(
+        f"<div class='card'><h4>{e(title)}</h4><h2>{e(value)}</h2></div>"
+        for title, value in [
+            ("📊 Teams", str(k["teams"])),
+            ("🏆 Leader", k["leader"]),
+            ("🔥 Highest Gainer", f"{k['top_owner']} ({k['max_points']:.0f} pts)"),
+            ("🧊 Lowest Gainer", f"{k['low_owner']} ({k['min_points']:.0f} pts)")
+        ]
+    )
+
+    standings = pd.DataFrame(payload["standings"])
+
+    charts = ""
+    if not standings.empty:
+        charts += chart_html(px.bar(standings, x="Owner", y="Points"))
+    if payload["franchise_points"]:
+        charts += chart_html(px.pie(
+            pd.DataFrame(payload["franchise_points"]), names="franchise", values="player_points"
+        ))
+
+    forecasts = ""
+    for label, rows in payload["match_forecasts"].items():
+        fig = px.bar(pd.DataFrame(rows), x="Owner", y="Predicted Points", text_auto=True)
+        forecasts += f"<h3>{e(label)}</h3>" + chart_html(fig)
+
+    match_tables = "".join(
+        f"<h3>🏏 {e(m['match'])}</h3>" + table_html(m["players"])
+        for m in payload["match_points"]
+    )
+
+    p = payload["progress"]
+
+    return f"""<!doctype html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>IPL Fantasy Dashboard - Day {day}</title>
+<link rel="stylesheet" href="../../style.css">
+<script src="{PLOTLY_CDN}"></script>
+</head>
+<body>
+<div class="header"><div>
+<div class="title">🏏 IPL Fantasy Dashboard - Core Group</div>
+<div class="subtitle">Standings till Day {day - 1}</div>
+</div></div>
+<p class="subtitle">📅 Day: <span id="nav">{day}</span></p>
+<p class="subtitle">📊 Season Progress: <b>{p['matches_completed']}</b> / {p['total_matches']} matches ({p['percent']:.0f}%)</p>
+<div style="display:flex;gap:12px;flex-wrap:wrap">{kpi_cards}</div>
+<div class="section-divider"></div>
+<h2>🏆 Team Rankings</h2>
+{table_html(payload["standings"])}
+<div class="section-divider"></div>
+<h2>📊 Insights</h2>
+{charts}
+<div class="section-divider"></div>
+<h2>📈 Upcoming Match Forecasts</h2>
+{table_html(payload["forecast_summary"])}
+{forecasts}
+<h2>🏆 Final Tournament Forecast</h2>
+{table_html(payload["final_forecast"])}
+<div class="section-divider"></div>
+<h2>📅 Match-wise Points</h2>
+{match_tables}
+<p class="subtitle"><a href="data.json">data.json</a></p>
+{NAV_SCRIPT}
+</body>
+</html>
+"""
+
+
+# ----------------------------------------
+# WORKERS
+# ----------------------------------------
+_worker_season = None
+
+
+def _init_worker(season):
+
+    global _worker_season
+    _worker_season = season
+
+
+def _export_day(day, out_dir):
+
+    payload = day_payload(_worker_season, day)
+
+    day_dir = os.path.join(out_dir, "day", str(day))
+    os.makedirs(day_dir, exist_ok=True)
+
+    with open(os.path.join(day_dir, "data.json"), "w") as f:
+        json.dump(payload, f, ensure_ascii=False)
+
+    with open(os.path.join(day_dir, "index.html"), "w") as f:
+        f.write(render_day_html(payload))
+
+    return day
+
+
+def export_site(season, out_dir, workers=None, force=False):
+
+    days = list(season.day_numbers)
+    manifest_path = os.path.join(out_dir, "manifest.json")
+
+    manifest = {}
+    if os.path.exists(manifest_path) and not force:
+        with open(manifest_path) as f:
+            manifest = json.load(f).get("days", {})
+
+    hashes = {str(d): day_input_hash(season, d) for d in days}
+
+    # a day is rebuilt when its inputs changed or its files are missing
+    stale = [
+        d for d in days
+        if manifest.get(str(d)) != hashes[str(d)]
+        or not os.path.exists(os.path.join(out_dir, "day", str(d), "index.html"))
+    ]
+
+    os.makedirs(out_dir, exist_ok=True)
+    shutil.copyfile("style/style.css", os.path.join(out_dir, "style.css"))
+
+    if stale:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(season,)
+        ) as pool:
+            list(pool.map(_export_day, stale, [out_dir] * len(stale)))
+
+    latest = days[-1] if days else None
+
+    with open(os.path.join(out_dir, "index.html"), "w") as f:
+        f.write(
+            f"<!doctype html><meta http-equiv='refresh' content='0; url=day/{latest}/index.html'>"
+            if latest is not None else "<!doctype html><p>No data.</p>"
+        )
+
+    with open(manifest_path, "w") as f:
+        json.dump({"version": EXPORT_VERSION, "days": hashes}, f, indent=2)
+
+    return stale
+
+
+# ----------------------------------------
+# CLI
+#   python -m utils.export --out site [--source local] [--workers 4] [--force]
+# ----------------------------------------
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(
+        description="Export every day of the dashboard as static HTML/JSON."
+    )
+    parser.add_argument("--out", default="site")
+    parser.add_argument("--source", choices=["sheet", "local"], default="sheet")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--force", action="store_true")
+    args = parser.parse_args(argv)
+
+    raw = pd.read_csv("data/points.csv") if args.source == "local" else fetch_points()
+    season = build_season_state(normalize_points(raw), load_captains(), load_matches())
+
+    rebuilt = export_site(season, args.out, args.workers, args.force)
+
+    print(f"Rebuilt {len(rebuilt)} of {len(season.day_numbers)} day(s): {rebuilt}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
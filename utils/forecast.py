@@ -0,0 +1,135 @@
+import numpy as np
+import pandas as pd
+from utils.calculator import day_multipliers
+from utils.telemetry import timed
+
+UPCOMING_MATCHES = 5
+
+
+def fixture_projections(df, cap_df, fixtures, level):
+
+    # owners x fixtures: each owner's expected points from every fixture row,
+    # with the C/VC in force on that fixture's day
+    franchise = df["franchise"].astype(object).to_numpy()
+
+    multipliers = {
+        day: day_multipliers(df, cap_df, day) for day in fixtures["Day"].unique()
+    }
+
+    expected = np.zeros((len(df), len(fixtures)))
+    for j, (day, teams) in enumerate(zip(fixtures["Day"], fixtures["team_list"])):
+        expected[:, j] = np.isin(franchise, list(teams)) * multipliers[day] * level
+
+    return pd.DataFrame(expected, index=df["owner_name"]).groupby(level=0, observed=True).sum()
+
+
+def format_match_label(day, teams, teams_str):
+
+    # DOUBLE HEADER
+    if len(teams) == 4:
+
+        return (
+            f"Day {day} - "
+            f"{teams[0]} vs {teams[1]} | "
+            f"{teams[2]} vs {teams[3]}"
+        )
+
+    # NORMAL MATCH
+    elif len(teams) == 2:
+
+        return (
+            f"Day {day} - "
+            f"{teams[0]} vs {teams[1]}"
+        )
+
+    return f"Day {day} - {teams_str}"
+
+
+# --------------------------------------------------
+# UPCOMING MATCH FORECASTS
+# --------------------------------------------------
+@timed("upcoming_match_forecasts")
+def upcoming_match_forecasts(df, cap_df, matches_df, selected_day, points, limit=UPCOMING_MATCHES):
+
+    future_matches = matches_df[
+        matches_df["Day"] >= selected_day
+    ].head(limit)
+
+    all_match_forecasts = {}
+    summary_rows = []
+
+    projections = fixture_projections(
+        df, cap_df, future_matches, points.form(selected_day).level()
+    )
+
+    for j, (_, match) in enumerate(future_matches.iterrows()):
+
+        match_label = format_match_label(
+            match["Day"],
+            match["team_list"],
+            match["Teams"]
+        )
+
+        forecast_df = pd.DataFrame({
+            "Owner": projections.index.astype(object),
+            "Predicted Points": projections[j].round(1).to_numpy()
+        })
+
+        forecast_df = forecast_df.sort_values(
+            "Predicted Points",
+            ascending=False
+        )
+
+        all_match_forecasts[match_label] = forecast_df
+
+        # ----------------------------------------
+        # SUMMARY ROW
+        # ----------------------------------------
+        top_row = forecast_df.iloc[0]
+
+        summary_rows.append({
+            "Match": match_label,
+            "Top Owner": top_row["Owner"],
+            "Best Forecast": round(top_row["Predicted Points"], 1)
+        })
+
+    return all_match_forecasts, pd.DataFrame(summary_rows)
+
+
+# --------------------------------------------------
+# FINAL TOURNAMENT FORECAST
+# --------------------------------------------------
+@timed("final_forecast")
+def final_forecast(df, team_df, cap_df, matches_df, sim_day, points):
+
+    future_matches_all = matches_df[
+        matches_df["Day"] >= sim_day
+    ]
+
+    # ----------------------------------------
+    # SIMULATE FUTURE MATCHES
+    # ----------------------------------------
+    future_projection = fixture_projections(
+        df, cap_df, future_matches_all, points.form(sim_day).level()
+    ).sum(axis=1)
+
+    # ----------------------------------------
+    # CURRENT POINTS
+    # ----------------------------------------
+    owners = future_projection.index.astype(object)
+
+    current_points = owners.map(
+        dict(zip(team_df["Owner"], team_df["Points"]))
+    ).to_numpy(dtype=float)
+
+    forecast_df = pd.DataFrame({
+        "Owner": owners,
+        "Predicted Final": (current_points + future_projection.to_numpy()).round(1)
+    })
+
+    forecast_df = forecast_df.sort_values(
+        "Predicted Final",
+        ascending=False
+    ).reset_index(drop=True)
+
+    return forecast_df
@@ -0,0 +1,113 @@
+import os
+
+import numpy as np
+
+# "window" (default), "ewma" or "mean" (plain mean of non-zero days)
+FORM_METHOD = os.environ.get("FORM_METHOD", "window")
+
+# EWMA: appearances until an innings counts half as much
+FORM_HALFLIFE = float(os.environ.get("FORM_HALFLIFE", 3))
+
+# WINDOW: last N appearances
+FORM_WINDOW = int(os.environ.get("FORM_WINDOW", 5))
+
+
+# ----------------------------------------
+# FORM STATE (per player, as of one day)
+# ----------------------------------------
+# Only non-zero days count as appearances, as in the old forecast average.
+# Every method's statistics are kept side by side, so switching the method
+# never needs a replay of the season.
+class FormState:
+
+    def __init__(self, games, total, total_sq, ew_mean, ew_var, recent):
+
+        self.games = games
+        self.total = total
+        self.total_sq = total_sq
+        self.ew_mean = ew_mean
+        self.ew_var = ew_var
+
+        # FORM_WINDOW x players ring buffer of the latest appearances
+        self.recent = recent
+
+    @classmethod
+    def empty(cls, n_players, window=None):
+
+        window = window or FORM_WINDOW
+        zeros = np.zeros(n_players)
+
+        return cls(
+            np.zeros(n_players, dtype=np.int64), zeros, zeros, zeros, zeros,
+            np.zeros((window, n_players))
+        )
+
+    @property
+    def nbytes(self):
+        return sum(
+            a.nbytes for a in
+            [self.games, self.total, self.total_sq, self.ew_mean, self.ew_var, self.recent]
+        )
+
+    def step(self, points, halflife=None):
+
+        # next day's state; only players who scored move
+        halflife = halflife or FORM_HALFLIFE
+        played = points != 0
+        if not played.any():
+            return self
+
+        alpha = 1 - 0.5 ** (1 / halflife)
+        first = played & (self.games == 0)
+        again = played & ~first
+
+        delta = np.where(again, points - self.ew_mean, 0.0)
+
+        ew_mean = np.where(first, points, self.ew_mean + alpha * delta)
+        ew_var = np.where(again, (1 - alpha) * (self.ew_var + alpha * delta ** 2), self.ew_var)
+
+        recent = self.recent.copy()
+        cols = np.flatnonzero(played)
+        recent[self.games[cols] % len(recent), cols] = points[cols]
+
+        return FormState(
+            self.games + played,
+            self.total + points,
+            self.total_sq + points ** 2,
+            ew_mean,
+            ew_var,
+            recent
+        )
+
+    def _n(self, method):
+        if method == "window":
+            return np.minimum(self.games, len(self.recent))
+        return self.games
+
+    def level(self, method=None):
+
+        method = method or FORM_METHOD
+
+        if method == "ewma":
+            return self.ew_mean
+
+        n = self._n(method)
+        total = self.recent.sum(axis=0) if method == "window" else self.total
+
+        out = np.zeros(len(n))
+        np.divide(total, n, out=out, where=n > 0)
+        return out
+
+    def variance(self, method=None):
+
+        method = method or FORM_METHOD
+
+        if method == "ewma":
+            return self.ew_var
+
+        n = self._n(method)
+        total_sq = (self.recent ** 2).sum(axis=0) if method == "window" else self.total_sq
+
+        out = np.zeros(len(n))
+        np.divide(total_sq, n, out=out, where=n > 0)
+        return np.maximum(out - self.level(method) ** 2, 0.0)
@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+
+from utils.cube import group_sum
+
+
+# ----------------------------------------
+# OWNERS x OWNERS x DAYS
+# ----------------------------------------
+class HeadToHead:
+
+    def __init__(self, cube):
+
+        owner_of_cell = cube.keys.groupby("owner_name", observed=True).ngroup().to_numpy()
+        self.owners = list(cube.keys["owner_name"].astype(object).drop_duplicates())
+
+        self.day_numbers = cube.day_numbers
+        self._pos = cube._pos
+
+        # (days + 1) x owners, row k = standings after the first k days
+        self.cumulative = group_sum(cube.scored, owner_of_cell, len(self.owners))
+        daily = np.diff(self.cumulative, axis=0)
+
+        # only days somebody scored on count as a contest
+        played = (daily != 0).any(axis=1)[:, None, None]
+
+        beat = (daily[:, :, None] > daily[:, None, :]) & played
+        tied = (daily[:, :, None] == daily[:, None, :]) & played
+
+        # running counts, (days + 1) x owners x owners: [k, i, j] = days i beat j
+        zero = np.zeros((1, len(self.owners), len(self.owners)), dtype=np.int64)
+        self.wins = np.concatenate([zero, beat.cumsum(axis=0)])
+        self.ties = np.concatenate([zero, tied.cumsum(axis=0)])
+
+        squads = cube.slice(["owner_name", "franchise"], "players").pivot_table(
+            index="owner_name", columns="franchise", values="players",
+            aggfunc="sum", fill_value=0, observed=True
+        )
+        self.squads = squads.reindex(self.owners).fillna(0).astype(int)
+
+    @property
+    def nbytes(self):
+        return self.cumulative.nbytes + self.wins.nbytes + self.ties.nbytes
+
+    def _owner(self, owner):
+        return self.owners.index(owner)
+
+    def wins_matrix(self, upto_day=None):
+
+        # row owner's days won against the column owner
+        return pd.DataFrame(
+            self.wins[self._pos(upto_day)], index=self.owners, columns=self.owners
+        )
+
+    def pair(self, owner_a, owner_b, upto_day=None):
+
+        a, b = self._owner(owner_a), self._owner(owner_b)
+        pos = self._pos(upto_day)
+
+        gap = pd.DataFrame({
+            "Day": self.day_numbers[:pos],
+            "Gap": self.cumulative[1:pos + 1, a] - self.cumulative[1:pos + 1, b]
+        })
+
+        both = (self.squads.loc[owner_a] > 0) & (self.squads.loc[owner_b] > 0)
+
+        shared = pd.DataFrame({
+            "Franchise": self.squads.columns[both],
+            owner_a: self.squads.loc[owner_a, both].to_numpy(),
+            owner_b: self.squads.loc[owner_b, both].to_numpy()
+        })
+
+        return {
+            "wins": int(self.wins[pos, a, b]),
+            "losses": int(self.wins[pos, b, a]),
+            "ties": int(self.ties[pos, a, b]),
+            "gap": gap,
+            "shared": shared
+        }
@@ -1,47 +1,73 @@
+import numpy as np
 import pandas as pd
 
-def build_watchlist(df, matches_df, cap_df, selected_day):
+from utils.scoring import RULES, PLAYER, CAPTAIN, VICE_CAPTAIN
+from utils.calculator import day_multipliers
+
+def watchlist_horizon(df, matches_df, cap_df, from_day, days=None, level=None):
+
+    # one row per (day, eligible player in action) from `from_day` on, for
+    # `days` days (None = rest of the season), as one fixture x roster join
+    window = matches_df[matches_df["Day"] >= from_day]
+    if days is not None:
+        window = window[window["Day"] < from_day + days]
+
+    fixtures = (
+        window[["Day", "team_list"]]
+        .explode("team_list")
+        .rename(columns={"team_list": "franchise"})
+        .drop_duplicates()
+    )
 
-    rows = matches_df[matches_df["Day"] == selected_day]
+    rows = np.flatnonzero(~df["released_injured"].to_numpy())
 
-    playing = set()
+    roster = df.iloc[rows][["owner_name", "player_name", "franchise"]].astype(
+        {"owner_name": object, "franchise": object}
+    ).assign(
+        row=rows,
+        expected=0.0 if level is None else level[rows]
+    )
 
-    for _, r in rows.iterrows():
-        teams = [t.strip() for t in r["Teams"].split(",")]
-        playing.update(teams)
+    playing = fixtures.merge(roster, on="franchise").sort_values(["Day", "row"])
 
-    watch = {}
+    # C/VC in force on each fixture day
+    caps = cap_df.sort_values("from_day")[["owner_name", "from_day", "captain", "vice_captain"]]
 
-    for owner, grp in df.groupby("owner_name"):
+    playing = pd.merge_asof(
+        playing, caps.astype({"owner_name": object}),
+        left_on="Day", right_on="from_day", by="owner_name"
+    )
 
-        eligible = grp[
-            (grp["franchise"].isin(playing)) &
-            (grp["released_injured"].fillna("").str.upper() != "Y")
-        ]
+    is_captain = (playing["player_name"] == playing["captain"]).to_numpy()
+    is_vice_captain = (playing["player_name"] == playing["vice_captain"]).to_numpy()
 
-        owner_caps = cap_df[
-            (cap_df["owner_name"] == owner) &
-            (cap_df["from_day"] <= selected_day)
-        ].sort_values("from_day")
+    tags = np.select([is_captain, is_vice_captain], [CAPTAIN, VICE_CAPTAIN], PLAYER)
 
-        c = vc = None
-        if not owner_caps.empty:
-            last = owner_caps.iloc[-1]
-            c = last["captain"]
-            vc = last["vice_captain"]
+    playing["tag"] = np.select([is_captain, is_vice_captain], ["🧢 ", "🎖️ "], "")
+    playing["multiplier"] = RULES.base(df)[playing["row"].to_numpy()] * RULES.factors(
+        tags, playing["owner_name"].to_numpy(), playing["Day"].to_numpy()
+    )
+    playing["expected"] = playing["expected"] * playing["multiplier"]
+
+    return playing[
+        ["Day", "owner_name", "player_name", "franchise", "tag", "multiplier", "expected"]
+    ].reset_index(drop=True)
+
+
+def build_watchlist(df, matches_df, cap_df, selected_day):
 
-        players = []
-        for _, r in eligible.iterrows():
-            name = r["player_name"]
-            if name == c:
-                name = f"🧢 {name}"
-            elif name == vc:
-                name = f"🎖️ {name}"
-            players.append(name)
+    playing = watchlist_horizon(df, matches_df, cap_df, selected_day, days=1)
 
-        watch[owner] = ", ".join(players) if players else "—"
+    names = {}
+    if not playing.empty:
+        names = (playing["tag"] + playing["player_name"]).groupby(
+            playing["owner_name"]
+        ).agg(", ".join)
 
-    return watch
+    return {
+        owner: names.get(owner, "—")
+        for owner in df["owner_name"].astype(object).unique()
+    }
 
 # ----------------------------------------
 # HELPER FUNCTION
@@ -65,15 +91,14 @@ def get_c_vc_points(df,cap_df,owner,selected_day,role="captain"):
         latest = cap_row.iloc[-1]
         player = latest["captain"] if role == "captain" else latest["vice_captain"]
 
-        player_row = df[(df["owner_name"] == owner) & (df["player_name"] == player)]
-        if player_row.empty:
+        rows = np.flatnonzero((df["owner_name"] == owner) & (df["player_name"] == player))
+        if len(rows) == 0:
             continue
 
-        pts = pd.to_numeric(player_row.iloc[0].get(day_col, 0), errors="coerce")
+        pts = df[day_col].iloc[rows[0]]
         pts = 0 if pd.isna(pts) else pts
 
-        mult = 2.0 if role == "captain" else 1.5
-        val = round(pts * mult, 1)
+        val = round(pts * day_multipliers(df, cap_df, d)[rows[0]], 1)
 
         if val != 0:
             pts_list.append(val)
@@ -0,0 +1,200 @@
+import os
+import sys
+import sqlite3
+import argparse
+import datetime
+import threading
+
+import pandas as pd
+
+from utils.data_loader import fetch_points, normalize_points, load_matches, load_captains
+from utils.season_store import build_season_state
+from utils.forecast import final_forecast
+
+# "" turns the store off (everything is recomputed, nothing persists)
+HISTORY_DB = os.environ.get("HISTORY_DB", "data/history.sqlite")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS days (
+    day         INTEGER PRIMARY KEY,
+    data_hash   TEXT NOT NULL,
+    recorded_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS standings (
+    day     INTEGER NOT NULL,
+    owner   TEXT NOT NULL,
+    rank    INTEGER,
+    points  REAL,
+    status  TEXT,
+    PRIMARY KEY (day, owner)
+);
+CREATE TABLE IF NOT EXISTS forecasts (
+    day             INTEGER NOT NULL,
+    owner           TEXT NOT NULL,
+    predicted_final REAL,
+    PRIMARY KEY (day, owner)
+);
+CREATE TABLE IF NOT EXISTS win_probability (
+    day       INTEGER NOT NULL,
+    owner     TEXT NOT NULL,
+    current   REAL,
+    future    REAL,
+    projected REAL,
+    win_pct   REAL,
+    PRIMARY KEY (day, owner)
+);
+"""
+
+TABLES = ["standings", "forecasts", "win_probability"]
+
+
+# ----------------------------------------
+# STORE
+# ----------------------------------------
+# One row set per day, tagged with the day's data hash. A later correction
+# changes the hash, so stale rows are never served and get rewritten.
+class HistoryStore:
+
+    def __init__(self, path=None):
+
+        self.path = path or HISTORY_DB
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def record(self, entries):
+
+        # bulk write: [(day, data_hash, standings_df, forecast_df, prob_df), ...]
+        now = datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds")
+
+        days, standings, forecasts, probs = [], [], [], []
+
+        for day, data_hash, team_df, forecast_df, prob_df in entries:
+
+            days.append((day, data_hash, now))
+
+            standings += [
+                (day, str(r.Owner), int(r.Rank), float(r.Points), r.Status)
+                for r in team_df[["Owner", "Rank", "Points", "Status"]].itertuples(index=False)
+            ]
+            forecasts += [
+                (day, str(o), float(p))
+                for o, p in zip(forecast_df["Owner"], forecast_df["Predicted Final"])
+            ]
+            probs += [
+                (day, str(o), float(c), float(f), float(p), float(w))
+                for o, c, f, p, w in prob_df[["Owner", "Current", "Future", "Projected", "Win %"]].to_numpy()
+            ]
+
+        with self.lock, self.conn:
+            marks = ",".join("?" * len(days))
+            for table in TABLES:
+                self.conn.execute(
+                    f"DELETE FROM {table} WHERE day IN ({marks})", [d[0] for d in days]
+                )
+
+            self.conn.executemany("INSERT OR REPLACE INTO days VALUES (?, ?, ?)", days)
+            self.conn.executemany("INSERT INTO standings VALUES (?, ?, ?, ?, ?)", standings)
+            self.conn.executemany("INSERT INTO forecasts VALUES (?, ?, ?)", forecasts)
+            self.conn.executemany("INSERT INTO win_probability VALUES (?, ?, ?, ?, ?, ?)", probs)
+
+    def recorded(self, data_hashes):
+
+        # {day: hash} -> the days whose stored rows match that hash
+        with self.lock:
+            stored = dict(self.conn.execute("SELECT day, data_hash FROM days"))
+
+        return {d for d, h in data_hashes.items() if stored.get(d) == h}
+
+    def _query(self, sql, params):
+        with self.lock:
+            return pd.read_sql_query(sql, self.conn, params=params)
+
+    def _day(self, table, columns, day, data_hash, order):
+
+        return self._query(
+            f"SELECT {columns} FROM {table} JOIN days USING (day) "
+            f"WHERE day = ? AND data_hash = ? ORDER BY {order}",
+            (day, data_hash)
+        )
+
+    def final_forecast(self, day, data_hash):
+
+        # None when the day isn't stored for this data
+        out = self._day(
+            "forecasts", 'owner AS "Owner", predicted_final AS "Predicted Final"',
+            day, data_hash, "predicted_final DESC"
+        )
+        return out if not out.empty else None
+
+
+_history = None
+_history_lock = threading.Lock()
+
+
+def get_history():
+
+    # process-wide store, or None when HISTORY_DB is ""
+    global _history
+
+    if not HISTORY_DB:
+        return None
+
+    with _history_lock:
+        if _history is None:
+            _history = HistoryStore(HISTORY_DB)
+
+    return _history
+
+
+# ----------------------------------------
+# BACKFILL
+#   python -m utils.history [--source local]
+# ----------------------------------------
+def backfill(season, history):
+
+    # dashboard records into this module, so import it at call time
+    from utils.dashboard import day_view, day_hash
+
+    df, matches_df, cap_df = season.df, season.matches_df, season.cap_df
+
+    hashes = {d: day_hash(season, d) for d in season.day_numbers}
+    recorded = history.recorded(hashes)
+    missing = [d for d in season.day_numbers if d not in recorded]
+
+    entries = []
+    for d in missing:
+        view = day_view(season, d)
+        forecast_df = final_forecast(df, view["team_df"], cap_df, matches_df, d, season)
+        entries.append((d, hashes[d], view["team_df"], forecast_df, view["prob_df"]))
+
+    if entries:
+        history.record(entries)
+
+    return missing
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Record every day's standings in the history store.")
+    parser.add_argument("--source", choices=["sheet", "local"], default="sheet")
+    parser.add_argument("--db", default=HISTORY_DB)
+    args = parser.parse_args(argv)
+
+    raw = pd.read_csv("data/points.csv") if args.source == "local" else fetch_points()
+    season = build_season_state(normalize_points(raw), load_captains(), load_matches())
+
+    history = HistoryStore(args.db)
+    missing = backfill(season, history)
+
+    print(f"Recorded {len(missing)} of {len(season.day_numbers)} day(s): {missing}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+import time
+import logging
+import threading
+
+import numpy as np
+import pandas as pd
+
+from utils.data_loader import normalize_points
+
+logger = logging.getLogger(__name__)
+
+# one source fetch per interval, however many sessions are watching
+LIVE_INTERVAL_SECONDS = 60
+
+
+# ----------------------------------------
+# POLLER (shared per process)
+# ----------------------------------------
+class LivePoller:
+
+    def __init__(self, store, fetch, interval=LIVE_INTERVAL_SECONDS):
+
+        self.store = store
+        self.fetch = fetch
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.last_fetch = 0.0
+        self.last_error = None
+
+    def refresh(self, day):
+
+        # only the first caller in each interval pays for the fetch
+        with self.lock:
+            if time.time() - self.last_fetch < self.interval:
+                return self.store.state
+
+            self.last_fetch = time.time()
+
+            try:
+                latest = normalize_points(self.fetch())
+                self.last_error = None
+            except Exception as e:
+                self.last_error = str(e)
+                logger.warning("Live fetch failed: %s", e)
+                return self.store.poll()
+
+            self.store.apply(changed_day_scores(self.store.state, latest, day))
+
+        return self.store.poll()
+
+
+def changed_day_scores(season, latest, day):
+
+    # cells of `day` that differ from what the season already holds; cells
+    # emptied in the sheet (a wrongly entered score taken back) go out as
+    # explicit clears
+    day_col = f"day{day}"
+    empty = pd.DataFrame(columns=["day", "player_name", "franchise", "points", "clear"])
+
+    if day_col not in latest.columns:
+        return empty
+
+    incoming = latest[["player_name", "franchise", day_col]]
+
+    current = pd.DataFrame({
+        "player_name": season.df["player_name"].to_numpy(),
+        "franchise": season.df["franchise"].astype(object).to_numpy(),
+        "current": season.day_points(day)
+    })
+
+    merged = incoming.astype({"franchise": object}).merge(
+        current, on=["player_name", "franchise"], how="left"
+    )
+
+    cleared = merged[day_col].isna()
+    changed = merged[
+        (~cleared & (merged[day_col] != merged["current"])) |
+        (cleared & (merged["current"].fillna(0) != 0))
+    ]
+
+    return pd.DataFrame({
+        "day": day,
+        "player_name": changed["player_name"],
+        "franchise": changed["franchise"],
+        "points": changed[day_col],
+        "clear": changed[day_col].isna()
+    })
+
+
+# ----------------------------------------
+# PARTIAL-DAY STANDINGS
+# ----------------------------------------
+def live_standings(season, day):
+
+    # cached cumulative totals up to yesterday + today's in-progress delta
+    owners = season.df["owner_name"]
+
+    before = pd.Series(season.scored_points(day - 1)["player_points"].to_numpy(), index=owners)
+    today = pd.Series(season.day_scored(day), index=owners)
+
+    live = pd.DataFrame({
+        "Before": before.groupby(level=0, observed=True).sum(),
+        "Today": today.groupby(level=0, observed=True).sum()
+    })
+
+    live["Live Points"] = live["Before"] + live["Today"]
+
+    live["Prev Rank"] = live["Before"].rank(ascending=False, method="first")
+    live = live.sort_values("Live Points", ascending=False)
+    live["Rank"] = range(1, len(live) + 1)
+
+    def format_movement(movement):
+        if movement > 0:
+            return f"▲ +{int(movement)}"
+        if movement < 0:
+            return f"▼ {int(movement)}"
+        return "— 0"
+
+    live["Movement"] = (live["Prev Rank"] - live["Rank"]).apply(format_movement)
+
+    return (
+        live.reset_index(names="Owner")
+        [["Rank", "Owner", "Live Points", "Today", "Movement"]]
+    )
@@ -0,0 +1,87 @@
+import os
+import sys
+import time
+import resource
+
+import numpy as np
+import pandas as pd
+
+# sessions not seen for this long are dropped from the report
+SESSION_TTL_SECONDS = 30 * 60
+
+
+def object_bytes(obj):
+
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        usage = obj.memory_usage(deep=True)
+        return int(usage.sum()) if isinstance(usage, pd.Series) else int(usage)
+
+    if isinstance(obj, np.ndarray) or hasattr(obj, "nbytes"):
+        return int(obj.nbytes)
+
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(object_bytes(v) for v in obj.values())
+
+    if isinstance(obj, (list, tuple, set)):
+        return sys.getsizeof(obj) + sum(object_bytes(v) for v in obj)
+
+    return sys.getsizeof(obj)
+
+
+def process_rss_bytes():
+
+    # current RSS from /proc where available, peak RSS otherwise
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def record_session(registry, session_id, objects):
+
+    now = time.time()
+
+    registry[session_id] = {
+        "bytes": sum(object_bytes(o) for o in objects.values()),
+        "seen": now
+    }
+
+    for sid in [s for s, v in registry.items() if now - v["seen"] > SESSION_TTL_SECONDS]:
+        registry.pop(sid, None)
+
+    return registry[session_id]["bytes"]
+
+
+def memory_report(shared, registry, session_id):
+
+    mb = 1024 * 1024
+
+    shared_bytes = sum(object_bytes(o) for o in shared.values())
+    session_bytes = registry.get(session_id, {}).get("bytes", 0)
+
+    sessions = len(registry)
+    avg_session = (
+        sum(v["bytes"] for v in registry.values()) / sessions
+        if sessions else 0
+    )
+
+    def fmt(n):
+        return f"{n / mb:.2f} MB"
+
+    rows = [
+        {"Scope": "Process", "Item": "RSS", "Value": fmt(process_rss_bytes())},
+        {"Scope": "Process", "Item": "Shared data", "Value": fmt(shared_bytes)},
+        {"Scope": "Process", "Item": "Active sessions", "Value": str(sessions)},
+        {"Scope": "Session", "Item": "This session", "Value": fmt(session_bytes)},
+        {"Scope": "Session", "Item": "Avg per session", "Value": fmt(avg_session)},
+    ]
+
+    rows += [
+        {"Scope": "Shared", "Item": name, "Value": fmt(object_bytes(obj))}
+        for name, obj in shared.items()
+    ]
+
+    return pd.DataFrame(rows)
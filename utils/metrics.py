@@ -10,17 +10,11 @@ def get_day_wise_gainers(df, effective_day):
 
     # Aggregate
     day_points = (
-        df.groupby("owner_name")[day_col]
+        df.groupby("owner_name", observed=True)[day_col]
         .sum()
         .reset_index()
     )
 
-    # Clean values
-    day_points[day_col] = pd.to_numeric(
-        day_points[day_col],
-        errors="coerce"
-    ).fillna(0)
-
     max_points = day_points[day_col].max()
     min_points = day_points[day_col].min()
 
@@ -0,0 +1,135 @@
+import os
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.dashboard import day_view, day_forecasts, day_captains, peek, latest
+
+logger = logging.getLogger(__name__)
+
+# background threads filling the shared day cache; 0 computes in the script thread
+PRECOMPUTE_WORKERS = int(os.environ.get("PRECOMPUTE_WORKERS", 2))
+
+# how often a page showing stale results checks whether the fresh ones landed
+PRECOMPUTE_POLL_SECONDS = 2
+
+# the slow per-day results, in the order a page needs them
+KINDS = {
+    "view": day_view,
+    "forecasts": day_forecasts,
+    "captains": day_captains
+}
+
+
+# ----------------------------------------
+# WORKER POOL (shared per process)
+# ----------------------------------------
+# Threads rather than processes: results land in the same in-process cache
+# the app, api and export read, and most of the work is numpy/pandas.
+class Precomputer:
+
+    def __init__(self, workers=PRECOMPUTE_WORKERS):
+
+        self.workers = workers
+        self.pool = ThreadPoolExecutor(workers, thread_name_prefix="precompute") if workers else None
+        self.lock = threading.RLock()
+
+        # (kind, season version, day) -> Future
+        self.pending = {}
+
+    def _run(self, kind, season, day):
+        try:
+            return KINDS[kind](season, day)
+        except Exception:
+            logger.exception("Precompute of %s for day %s failed", kind, day)
+            raise
+
+    def _submit(self, kind, season, day):
+
+        # caller holds self.lock
+        key = (kind, season.version, day)
+
+        future = self.pending.get(key)
+
+        if future is None:
+            future = self.pool.submit(self._run, kind, season, day)
+            self.pending[key] = future
+            future.add_done_callback(lambda _: self._done(key))
+
+        return future
+
+    def _done(self, key):
+        with self.lock:
+            self.pending.pop(key, None)
+
+    def schedule(self, season, days):
+
+        # queue every missing result of `days`, first day first
+        if self.pool is None:
+            return
+
+        with self.lock:
+            for day in days:
+                for kind in KINDS:
+                    if peek(kind, season, day) is None:
+                        self._submit(kind, season, day)
+
+    def run(self, fn, *args):
+
+        # any other job for the pool (warm-up); None when computing inline
+        if self.pool is None:
+            return None
+
+        return self.pool.submit(fn, *args)
+
+    def get(self, kind, season, day):
+
+        # (result, stale): the current result when it's ready, else the newest
+        # older one while this season's is computed in the background
+        value = peek(kind, season, day)
+        if value is not None:
+            return value, False
+
+        if self.pool is None:
+            return KINDS[kind](season, day), False
+
+        with self.lock:
+            future = self._submit(kind, season, day)
+
+        stale = latest(kind, season, day)
+        if stale is not None:
+            return stale, True
+
+        # nothing to show yet (first load of this day): still queued behind
+        # other days, so compute it here rather than wait its turn
+        if future.cancel():
+            return KINDS[kind](season, day), False
+
+        return future.result(), False
+
+    def ready(self, season, day):
+        return all(peek(kind, season, day) is not None for kind in KINDS)
+
+    def shutdown(self):
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+
+
+_precomputer = None
+_precomputer_lock = threading.Lock()
+
+
+def get_precomputer():
+
+    # process-wide pool, shared by every session
+    global _precomputer
+
+    with _precomputer_lock:
+        if _precomputer is None:
+            _precomputer = Precomputer()
+
+    return _precomputer
+
+
+def precomputed(kind, season, day):
+    return get_precomputer().get(kind, season, day)
@@ -1,15 +1,15 @@
 import pandas as pd
+from utils.bounds import owner_bounds
+from utils.telemetry import timed
 
-def calculate_win_probability(df, scored_df, matches_df, selected_day):
-
-    # Normalize
-    matches_df.columns = [c.strip() for c in matches_df.columns]
+@timed("calculate_win_probability")
+def calculate_win_probability(df, scored_df, matches_df, selected_day, points, bounds=None):
 
     # ----------------------------------------
     # CURRENT POINTS
     # ----------------------------------------
     current_points = (
-        scored_df.groupby("owner_name")["player_points"]
+        scored_df.groupby("owner_name", observed=True)["player_points"]
         .sum()
     )
 
@@ -18,16 +18,8 @@ def calculate_win_probability(df, scored_df, matches_df, selected_day):
     # ----------------------------------------
     # PLAYER AVG
     # ----------------------------------------
-    day_cols = [c for c in df.columns if c.startswith("day")]
-
-    player_avg = df.copy()
-
-    player_avg["avg_points"] = (
-        player_avg[day_cols]
-        .apply(pd.to_numeric, errors="coerce")
-        .fillna(0)
-        .mean(axis=1)
-    )
+    # as of the selected day, so a past day's numbers don't move when new days land
+    avg_points = pd.Series(points.mean(selected_day), index=df.index)
 
     # ----------------------------------------
     # TEAM MATCH COUNT
@@ -36,8 +28,7 @@ def calculate_win_probability(df, scored_df, matches_df, selected_day):
 
     team_match_count = {}
 
-    for _, row in remaining_matches.iterrows():
-        teams = [t.strip() for t in row["Teams"].split(",")]
+    for teams in remaining_matches["team_list"]:
 
         for t in teams:
             team_match_count[t] = team_match_count.get(t, 0) + 1
@@ -50,18 +41,18 @@ def calculate_win_probability(df, scored_df, matches_df, selected_day):
 
     for owner in owners:
 
-        owner_players = player_avg[
-            (player_avg["owner_name"] == owner) &
-            (player_avg["released_injured"].fillna("").str.upper() != "Y")
+        owner_players = df[
+            (df["owner_name"] == owner) &
+            (~df["released_injured"])
         ]
 
         total_future = 0
         player_contrib = []
 
-        for _, p in owner_players.iterrows():
+        for idx, p in owner_players.iterrows():
 
             team = p["franchise"]
-            avg = p["avg_points"]
+            avg = avg_points.at[idx]
 
             matches_left = team_match_count.get(team, 0)
 
@@ -92,9 +83,20 @@ def calculate_win_probability(df, scored_df, matches_df, selected_day):
 
     prob_df["Projected"] = prob_df["Current"] + prob_df["Future"]
 
-    total_proj = prob_df["Projected"].sum()
+    # ----------------------------------------
+    # ELIMINATED / CLINCHED
+    # ----------------------------------------
+    if bounds is None:
+        bounds = owner_bounds(df, current_points, matches_df, selected_day)
+
+    # an owner who clinched 1st leaves every other owner's best rank below 1st
+    contenders = prob_df["Owner"].map(
+        dict(zip(bounds["Owner"], bounds["Best Rank"]))
+    ) == 1
+
+    total_proj = prob_df["Projected"].where(contenders, 0).sum()
 
-    prob_df["Win %"] = (prob_df["Projected"] / total_proj) * 100
+    prob_df["Win %"] = (prob_df["Projected"].where(contenders, 0) / total_proj) * 100
 
     prob_df = prob_df.sort_values("Win %", ascending=False)
 
@@ -0,0 +1,226 @@
+import os
+import sys
+import json
+import logging
+import argparse
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# fantasy points per scorecard stat; the built-in table applies when the file is missing
+POINTS_TABLE = os.environ.get("POINTS_TABLE", "data/points_table.json")
+
+SCORECARD_DIR = "data/scorecards"
+
+# ----------------------------------------
+# SCORECARD LINES
+# ----------------------------------------
+# One row per batting, bowling or fielding line (csv or json records):
+#   day, player_name [, franchise], then any of the stat columns below.
+# Lines of the same player on the same day are added up.
+STAT_COLUMNS = [
+    "runs", "balls", "fours", "sixes", "dismissed",
+    "wickets", "lbw_bowled", "balls_bowled", "runs_conceded", "maidens", "dot_balls",
+    "catches", "stumpings", "run_outs"
+]
+
+DEFAULT_TABLE = {
+    "playing": 4,
+    "per_unit": {
+        "runs": 1, "fours": 1, "sixes": 2,
+        "wickets": 25, "lbw_bowled": 8, "maidens": 12,
+        "catches": 8, "stumpings": 12, "run_outs": 6
+    },
+    # highest threshold reached only
+    "milestones": {
+        "runs": {"30": 4, "50": 8, "100": 16},
+        "wickets": {"3": 4, "4": 8, "5": 16},
+        "catches": {"3": 4}
+    },
+    "duck": -2,
+    # numerator / denominator x scale, banded by inclusive upper bound (null = no bound);
+    # only once the denominator reaches min_denominator
+    "rates": [
+        {
+            "numerator": "runs", "denominator": "balls", "scale": 100, "min_denominator": 10,
+            "bands": [[50, -6], [60, -4], [70, -2], [130, 0], [150, 2], [170, 4], [None, 6]]
+        },
+        {
+            "numerator": "runs_conceded", "denominator": "balls_bowled", "scale": 6, "min_denominator": 12,
+            "bands": [[5, 6], [6, 4], [7, 2], [10, 0], [11, -2], [12, -4], [None, -6]]
+        }
+    ]
+}
+
+
+def load_points_table(path=None):
+
+    path = path or POINTS_TABLE
+
+    if not os.path.exists(path):
+        return DEFAULT_TABLE
+
+    with open(path) as f:
+        return json.load(f)
+
+
+def read_scorecard(path):
+
+    if path.endswith(".json"):
+        with open(path) as f:
+            lines = pd.DataFrame(json.load(f))
+    else:
+        lines = pd.read_csv(path)
+
+    lines.columns = lines.columns.str.lower().str.strip()
+
+    missing = [c for c in ["day", "player_name"] if c not in lines.columns]
+    if missing:
+        raise ValueError(f"missing columns: {', '.join(missing)}")
+
+    return lines
+
+
+def is_scorecard(lines):
+    return "points" not in lines.columns and any(c in lines.columns for c in STAT_COLUMNS + ["overs"])
+
+
+def overs_to_balls(overs):
+
+    # cricket notation: 3.4 overs = 22 balls
+    overs = pd.to_numeric(overs, errors="coerce").fillna(0)
+    whole = np.floor(overs)
+
+    return whole * 6 + np.round((overs - whole) * 10)
+
+
+# ----------------------------------------
+# FANTASY POINTS (one vectorized pass)
+# ----------------------------------------
+def fantasy_points(lines, table=None):
+
+    # -> day, player_name[, franchise], points: one row per player per day
+    table = table or load_points_table()
+
+    lines = lines.copy()
+    lines["player_name"] = lines["player_name"].astype(str).str.strip()
+    lines["day"] = pd.to_numeric(lines["day"], errors="coerce")
+    lines = lines.dropna(subset=["day"])
+    lines["day"] = lines["day"].astype(int)
+
+    if "balls_bowled" not in lines.columns and "overs" in lines.columns:
+        lines["balls_bowled"] = overs_to_balls(lines["overs"])
+
+    for col in STAT_COLUMNS:
+        lines[col] = pd.to_numeric(lines[col], errors="coerce").fillna(0) if col in lines.columns else 0.0
+
+    keys = ["day", "player_name"]
+    if "franchise" in lines.columns:
+        lines["franchise"] = lines["franchise"].astype(str).str.strip()
+        keys.append("franchise")
+
+    stats = lines.groupby(keys, sort=False)[STAT_COLUMNS].sum()
+
+    # per-unit points: stats x weights
+    weights = np.array([table.get("per_unit", {}).get(c, 0) for c in STAT_COLUMNS], dtype=np.float64)
+    points = stats.to_numpy(dtype=np.float64) @ weights + table.get("playing", 0)
+
+    for stat, bonuses in table.get("milestones", {}).items():
+        thresholds = np.array(sorted(float(t) for t in bonuses))
+        bonus = np.array([bonuses[k] for k in sorted(bonuses, key=float)], dtype=np.float64)
+
+        reached = np.searchsorted(thresholds, stats[stat].to_numpy(), side="right") - 1
+        points += np.where(reached >= 0, bonus[np.maximum(reached, 0)], 0.0)
+
+    duck = (stats["dismissed"].to_numpy() > 0) & (stats["runs"].to_numpy() == 0)
+    points += duck * table.get("duck", 0)
+
+    for rate in table.get("rates", []):
+        num = stats[rate["numerator"]].to_numpy(dtype=np.float64)
+        den = stats[rate["denominator"]].to_numpy(dtype=np.float64)
+
+        qualifies = den >= max(rate.get("min_denominator", 1), 1)
+        value = np.divide(num, den, out=np.zeros_like(num), where=den > 0) * rate.get("scale", 1)
+
+        uppers = np.array([np.inf if u is None else u for u, _ in rate["bands"]], dtype=np.float64)
+        band_points = np.array([p for _, p in rate["bands"]], dtype=np.float64)
+
+        # first band whose upper bound is >= value, so a bound belongs to its own band
+        band = np.minimum(np.searchsorted(uppers, value, side="left"), len(uppers) - 1)
+        points += np.where(qualifies, band_points[band], 0.0)
+
+    return stats.index.to_frame(index=False).assign(points=points)
+
+
+# ----------------------------------------
+# ROSTER DAY COLUMNS
+# ----------------------------------------
+def _name_key(series):
+    return series.astype(str).str.strip().str.casefold().str.split().str.join(" ")
+
+
+def write_day_columns(points_df, scores):
+
+    # -> (points_df, scorecard players not on any roster). Rebuilds every
+    # day in `scores`: listed players get their points, the rest of that
+    # day's column is left empty (did not play)
+    keys = ["player_name"] + (["franchise"] if "franchise" in scores.columns else [])
+
+    roster = pd.DataFrame({k: _name_key(points_df[k]) for k in keys}).assign(row=np.arange(len(points_df)))
+    scores = scores.assign(**{k: _name_key(scores[k]) for k in keys})
+
+    matched = scores.merge(roster, on=keys, how="inner")
+
+    unmatched = len(scores.drop_duplicates(keys)) - len(matched.drop_duplicates(keys))
+    if unmatched:
+        logger.warning("%d scorecard player(s) are not on any roster", unmatched)
+
+    out = points_df.copy()
+    for day, day_scores in matched.groupby("day"):
+        values = np.full(len(out), np.nan)
+        values[day_scores["row"].to_numpy()] = day_scores["points"].to_numpy()
+        out[f"day{day}"] = values
+
+    # keep day columns in day order after the id columns
+    day_cols = sorted((c for c in out.columns if c.startswith("day")), key=lambda c: int(c[3:]))
+    return out[[c for c in out.columns if not c.startswith("day")] + day_cols], unmatched
+
+
+# ----------------------------------------
+# CLI
+#   python -m utils.scorecards [data/scorecards] [--out data/points.csv]
+# ----------------------------------------
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Rebuild day columns of points.csv from raw scorecards.")
+    parser.add_argument("scorecards", nargs="?", default=SCORECARD_DIR)
+    parser.add_argument("--points", default="data/points.csv")
+    parser.add_argument("--out", default=None, help="defaults to --points")
+    parser.add_argument("--table", default=POINTS_TABLE)
+    args = parser.parse_args(argv)
+
+    files = sorted(
+        os.path.join(args.scorecards, f) for f in os.listdir(args.scorecards)
+        if f.endswith((".csv", ".json"))
+    )
+    if not files:
+        print(f"No scorecards in {args.scorecards}")
+        return 1
+
+    lines = pd.concat([read_scorecard(f) for f in files], ignore_index=True)
+    scores = fantasy_points(lines, load_points_table(args.table))
+
+    points_df = pd.read_csv(args.points)
+    points_df.columns = points_df.columns.str.strip()
+
+    out, unmatched = write_day_columns(points_df, scores)
+    out.to_csv(args.out or args.points, index=False)
+
+    print(f"Scored {len(scores)} player-day(s) from {len(files)} file(s) into {args.out or args.points}"
+          f" ({unmatched} player(s) not on any roster)")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
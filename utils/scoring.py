@@ -0,0 +1,163 @@
+import os
+import json
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+# league scoring rules; the built-in defaults apply when the file is missing
+SCORING_RULES = os.environ.get("SCORING_RULES", "data/scoring_rules.json")
+
+# what a roster row is on a given day
+PLAYER, CAPTAIN, VICE_CAPTAIN = 0, 1, 2
+
+BOOSTER_COLUMNS = ["owner_name", "day", "target", "multiplier"]
+BOOSTER_TARGETS = {"captain", "vice_captain", "all"}
+
+
+# ----------------------------------------
+# RULES
+# ----------------------------------------
+# A player's multiplier on a day is
+#   role multiplier x released multiplier x C/VC multiplier x boosters
+# Boosters are one-day overrides for an owner: "captain" / "vice_captain"
+# replace that slot's multiplier (triple captain = captain, 3.0), "all"
+# multiplies every player of the owner (bench boost).
+class ScoringRules:
+
+    def __init__(self, captain=2.0, vice_captain=1.5, roles=None, released=1.0, boosters=None):
+
+        self.captain = float(captain)
+        self.vice_captain = float(vice_captain)
+        self.roles = {str(k): float(v) for k, v in (roles or {}).items()}
+        self.released = float(released)
+
+        boosters = pd.DataFrame(boosters or [], columns=BOOSTER_COLUMNS)
+        unknown = set(boosters["target"]) - BOOSTER_TARGETS
+        if unknown:
+            raise ValueError(f"Unknown booster target(s): {', '.join(sorted(map(str, unknown)))}")
+
+        self.boosters = boosters.astype({"day": int, "multiplier": float})
+
+    @classmethod
+    def from_dict(cls, rules):
+        return cls(**rules)
+
+    def to_dict(self):
+        return {
+            "captain": self.captain,
+            "vice_captain": self.vice_captain,
+            "roles": self.roles,
+            "released": self.released,
+            "boosters": self.boosters.to_dict(orient="records")
+        }
+
+    def digest(self):
+        return hashlib.sha256(json.dumps(self.to_dict(), sort_keys=True).encode()).hexdigest()
+
+    # ----------------------------------------
+    # COMPONENTS
+    # ----------------------------------------
+    def base(self, df):
+
+        # per roster row: role x released multiplier
+        role = df["role"].astype(object).map(self.roles).fillna(1.0).to_numpy(dtype=np.float64)
+        released = np.where(df["released_injured"].to_numpy(dtype=bool), self.released, 1.0)
+
+        return role * released
+
+    def tags(self, df, cap_df, day_numbers):
+
+        # days x players: PLAYER / CAPTAIN / VICE_CAPTAIN, from the C/VC in force each day
+        owners = df["owner_name"].astype(object).to_numpy()
+        players = df["player_name"].to_numpy()
+        owner_list = pd.unique(owners)
+
+        grid = pd.DataFrame({
+            "Day": np.repeat(np.asarray(day_numbers, dtype=np.int64), len(owner_list)),
+            "owner_name": pd.Series(np.tile(owner_list, len(day_numbers)), dtype=object)
+        })
+
+        caps = cap_df.sort_values("from_day")[["owner_name", "from_day", "captain", "vice_captain"]]
+
+        in_force = pd.merge_asof(
+            grid, caps.astype({"owner_name": object, "from_day": np.int64}),
+            left_on="Day", right_on="from_day", by="owner_name"
+        )
+
+        # merge_asof keeps the left order: day-major, owner-minor
+        shape = (len(day_numbers), len(owner_list))
+        column = pd.Index(owner_list).get_indexer(owners)
+
+        captain = in_force["captain"].to_numpy(dtype=object).reshape(shape)[:, column]
+        vice_captain = in_force["vice_captain"].to_numpy(dtype=object).reshape(shape)[:, column]
+
+        return np.select(
+            [players[None, :] == captain, players[None, :] == vice_captain],
+            [CAPTAIN, VICE_CAPTAIN],
+            PLAYER
+        ).astype(np.int8)
+
+    def factors(self, tags, owners, days):
+
+        # C/VC and booster multiplier for each (day, player) cell; `owners` and
+        # `days` broadcast against `tags`
+        out = np.select(
+            [tags == CAPTAIN, tags == VICE_CAPTAIN],
+            [self.captain, self.vice_captain],
+            1.0
+        )
+
+        for b in self.boosters.itertuples(index=False):
+            hit = (owners == b.owner_name) & (days == b.day)
+
+            if b.target == "captain":
+                out = np.where(hit & (tags == CAPTAIN), b.multiplier, out)
+            elif b.target == "vice_captain":
+                out = np.where(hit & (tags == VICE_CAPTAIN), b.multiplier, out)
+            else:
+                out = np.where(hit, out * b.multiplier, out)
+
+        return out
+
+    # ----------------------------------------
+    # COMPILED
+    # ----------------------------------------
+    def compile(self, df, cap_df, day_numbers):
+
+        # (multipliers, tags), both days x players
+        tags = self.tags(df, cap_df, day_numbers)
+
+        owners = df["owner_name"].astype(object).to_numpy()[None, :]
+        days = np.asarray(day_numbers)[:, None]
+
+        return self.base(df)[None, :] * self.factors(tags, owners, days), tags
+
+    def peak(self, df):
+
+        # most a non-C/VC player of `df` can be multiplied by on any day
+        boost = self.boosters.loc[self.boosters["target"] == "all", "multiplier"].to_numpy()
+
+        return float(self.base(df).max(initial=1.0)) * float(boost.max(initial=1.0))
+
+    def slot_peak(self, target):
+
+        # best multiplier the captain / vice-captain slot can carry
+        usual = self.captain if target == "captain" else self.vice_captain
+        boost = self.boosters.loc[self.boosters["target"] == target, "multiplier"].to_numpy()
+
+        return float(boost.max(initial=usual))
+
+
+def load_rules(path=None):
+
+    path = path or SCORING_RULES
+
+    if not os.path.exists(path):
+        return ScoringRules()
+
+    with open(path) as f:
+        return ScoringRules.from_dict(json.load(f))
+
+
+RULES = load_rules()
@@ -0,0 +1,469 @@
+import os
+import json
+import itertools
+import queue
+import logging
+import threading
+
+import numpy as np
+import pandas as pd
+
+from utils.data_loader import get_day_cols, DAY_DTYPE
+from utils.calculator import SCORED_COLUMNS
+from utils.scoring import RULES, CAPTAIN, VICE_CAPTAIN
+from utils.helpers import build_watchlist
+from utils.form import FormState
+from utils.snapshot import diff_snapshots, audit
+from utils.scorecards import is_scorecard, fantasy_points
+
+logger = logging.getLogger(__name__)
+
+# process-wide, so cached results never collide across store rebuilds
+_versions = itertools.count(1)
+
+# how many earlier versions a state can borrow cached results from
+REUSE_DEPTH = 8
+
+# ----------------------------------------
+# DROP DIRECTORY
+# ----------------------------------------
+# Per-match score files (csv or json records) with columns:
+#   day, player_name, points  [, franchise]
+# or raw scorecard lines (see utils.scorecards) instead of points.
+# A file sets the listed players' points for that day; other cells are untouched.
+# Applied files move to processed/, unreadable ones to failed/.
+INCOMING_DIR = "data/incoming"
+
+
+# ----------------------------------------
+# SEASON STATE (immutable once published)
+# ----------------------------------------
+class SeasonState:
+
+    def __init__(self, df, cap_df, matches_df, day_numbers, raw, mult, tags, scored, watchlists=None):
+
+        self.df = df
+        self.cap_df = cap_df
+        self.matches_df = matches_df
+        self.day_numbers = day_numbers
+        self.version = next(_versions)
+
+        # days x players; NaN cells already zeroed
+        self.raw = raw
+        self.mult = mult
+        self.scored = scored
+
+        # days x players: scoring.PLAYER / CAPTAIN / VICE_CAPTAIN
+        self.tags = tags
+
+        self.cum_raw = None
+        self.cum_scored = None
+        self.cum_counts = None
+
+        # forms[k]: player form after the first k days
+        self.forms = None
+
+        # watchlists depend on roster/fixtures/captains only, never on points
+        self.watchlists = {} if watchlists is None else watchlists
+
+        # (earlier version, first changed day): that version's per-day results
+        # for days before the changed one are still valid for this state
+        self.reusable = []
+
+        # archive snapshot id when rebuilt from a past snapshot (time travel)
+        self.snapshot = None
+
+    @property
+    def n_players(self):
+        return len(self.df)
+
+    @property
+    def nbytes(self):
+        return sum(
+            a.nbytes for a in
+            [self.raw, self.mult, self.tags, self.scored, self.cum_raw, self.cum_scored, self.cum_counts]
+        ) + sum(f.nbytes for f in self.forms)
+
+    def accumulate(self, from_pos=0, previous=None):
+
+        n_days = len(self.day_numbers)
+        shape = (n_days + 1, self.n_players)
+
+        cum_raw = np.zeros(shape)
+        cum_scored = np.zeros(shape)
+        cum_counts = np.zeros(shape, dtype=np.int64)
+
+        # rows before the first changed day are reused as-is
+        if previous is not None and from_pos > 0:
+            cum_raw[:from_pos + 1] = previous.cum_raw[:from_pos + 1]
+            cum_scored[:from_pos + 1] = previous.cum_scored[:from_pos + 1]
+            cum_counts[:from_pos + 1] = previous.cum_counts[:from_pos + 1]
+            forms = previous.forms[:from_pos + 1]
+        else:
+            from_pos = 0
+            forms = [FormState.empty(self.n_players)]
+
+        for k in range(from_pos, n_days):
+            cum_raw[k + 1] = cum_raw[k] + self.raw[k]
+            cum_scored[k + 1] = cum_scored[k] + self.scored[k]
+            cum_counts[k + 1] = cum_counts[k] + (self.raw[k] != 0)
+            forms.append(forms[k].step(self.raw[k]))
+
+        self.cum_raw, self.cum_scored, self.cum_counts = cum_raw, cum_scored, cum_counts
+        self.forms = forms
+
+        return self
+
+    def inherit(self, previous, first_day):
+
+        # a day's results only depend on points up to that day
+        if first_day is None:
+            return self
+
+        self.reusable = [(previous.version, first_day)] + [
+            (v, min(d, first_day)) for v, d in previous.reusable
+        ][:REUSE_DEPTH - 1]
+
+        return self
+
+    def _pos(self, upto_day):
+        if upto_day is None:
+            return len(self.day_numbers)
+        return int(np.searchsorted(self.day_numbers, upto_day, side="right"))
+
+    # ----------------------------------------
+    # POINTS-MATRIX INTERFACE (used by forecasts / probability)
+    # ----------------------------------------
+    def totals(self, upto_day=None):
+        return self.cum_raw[self._pos(upto_day)]
+
+    def nonzero_counts(self, upto_day=None):
+        return self.cum_counts[self._pos(upto_day)]
+
+    def mean(self, upto_day=None):
+        pos = self._pos(upto_day)
+        if pos == 0:
+            return np.zeros(self.n_players)
+        return self.cum_raw[pos] / pos
+
+    def form(self, upto_day=None):
+        return self.forms[self._pos(upto_day)]
+
+    def day_points(self, day):
+        if day not in self.day_numbers:
+            return np.zeros(self.n_players)
+        return self.raw[self.day_numbers.index(day)]
+
+    def day_scored(self, day):
+        if day not in self.day_numbers:
+            return np.zeros(self.n_players)
+        return self.scored[self.day_numbers.index(day)]
+
+    # ----------------------------------------
+    # STANDINGS
+    # ----------------------------------------
+    def scored_points(self, upto_day):
+
+        # same frame calculate_points(df, cap_df, upto_day) returns
+        return self.df[SCORED_COLUMNS].assign(
+            player_points=self.cum_scored[self._pos(upto_day)]
+        )
+
+    def watchlist(self, day):
+
+        if day not in self.watchlists:
+            self.watchlists[day] = build_watchlist(
+                self.df, self.matches_df, self.cap_df, day
+            )
+
+        return self.watchlists[day]
+
+    def c_vc_points(self, df, cap_df, owner, selected_day, role="captain"):
+
+        # drop-in for helpers.get_c_vc_points, read from the per-day arrays
+        target = CAPTAIN if role == "captain" else VICE_CAPTAIN
+        owner_mask = (self.df["owner_name"] == owner).to_numpy()
+
+        pts_list = []
+        for k, d in enumerate(self.day_numbers):
+            if d > selected_day:
+                break
+
+            rows = np.flatnonzero(owner_mask & (self.tags[k] == target))
+            if len(rows) == 0:
+                continue
+
+            val = round(self.scored[k][rows[0]], 1)
+            if val != 0:
+                pts_list.append(val)
+
+        return "—" if not pts_list else f"({', '.join(map(str, pts_list))})"
+
+
+def build_season_state(df, cap_df, matches_df):
+
+    day_cols = get_day_cols(df)
+    day_numbers = [int(c[3:]) for c in day_cols]
+
+    raw = np.nan_to_num(df[day_cols].to_numpy(dtype=np.float64)).T.copy()
+    mult, tags = RULES.compile(df, cap_df, day_numbers)
+
+    return SeasonState(
+        df, cap_df, matches_df, day_numbers, raw, mult, tags, raw * mult
+    ).accumulate()
+
+
+# ----------------------------------------
+# SEASON STORE (shared, thread-safe)
+# ----------------------------------------
+class SeasonStore:
+
+    def __init__(self, df, cap_df, matches_df, incoming_dir=INCOMING_DIR):
+
+        self.lock = threading.Lock()
+
+        # one poll at a time, so a queued batch or drop file is applied once
+        self.poll_lock = threading.Lock()
+        self.queue = queue.Queue()
+        self.incoming_dir = incoming_dir
+        self.claimed_dir = os.path.join(incoming_dir, "claimed")
+        self.processed_dir = os.path.join(incoming_dir, "processed")
+        self.failed_dir = os.path.join(incoming_dir, "failed")
+        self.state = build_season_state(df, cap_df, matches_df)
+
+        # called with every newly published state (cache warm-up)
+        self.listeners = []
+
+    def subscribe(self, listener):
+        self.listeners.append(listener)
+
+    def _publish(self, previous):
+
+        if self.state is previous:
+            return
+
+        for listener in self.listeners:
+            try:
+                listener(self.state)
+            except Exception:
+                logger.exception("Season listener failed")
+
+    def submit(self, records):
+
+        # local queue: list of {"day", "player_name", "points"[, "franchise"]}
+        self.queue.put(list(records))
+
+    def poll(self):
+        with self.poll_lock:
+            return self._poll()
+
+    def _poll(self):
+
+        batches = []
+
+        while True:
+            try:
+                batches.append(pd.DataFrame(self.queue.get_nowait()))
+            except queue.Empty:
+                break
+
+        files = []
+        if os.path.isdir(self.incoming_dir):
+            files = sorted(
+                f for f in os.listdir(self.incoming_dir)
+                if f.endswith((".csv", ".json"))
+            )
+
+        claimed = []
+
+        for name in files:
+            path = os.path.join(self.incoming_dir, name)
+            claim = os.path.join(self.claimed_dir, name)
+
+            # claim the file with an atomic rename before reading it, so
+            # another process polling the same directory can't apply it too
+            try:
+                os.makedirs(self.claimed_dir, exist_ok=True)
+                os.rename(path, claim)
+            except OSError as e:
+                logger.debug("Score file %s already taken: %s", name, e)
+                continue
+
+            try:
+                batches.append(read_score_file(claim))
+                claimed.append(name)
+            except (ValueError, OSError) as e:
+                logger.warning("Moving unreadable score file %s to %s: %s", name, self.failed_dir, e)
+                self._move(claim, self.failed_dir, name)
+
+        if batches:
+            try:
+                self.apply(pd.concat(batches, ignore_index=True))
+            except Exception:
+                # not applied: hand the files back for the next poll
+                for name in claimed:
+                    self._move(os.path.join(self.claimed_dir, name), self.incoming_dir, name)
+                raise
+
+        for name in claimed:
+            self._move(os.path.join(self.claimed_dir, name), self.processed_dir, name)
+
+        return self.state
+
+    def _move(self, path, directory, name):
+
+        try:
+            os.makedirs(directory, exist_ok=True)
+            os.replace(path, os.path.join(directory, name))
+        except OSError as e:
+            logger.warning("Could not move score file %s to %s: %s", name, directory, e)
+
+    def apply(self, scores):
+
+        with self.lock:
+            previous = self.state
+            self.state = apply_scores(previous, scores)
+
+        self._publish(previous)
+
+        return self.state
+
+    def reload(self, df, cap_df, matches_df):
+
+        # a refetched snapshot: diff it and update only what changed
+        with self.lock:
+            state = self.state
+            diff = diff_snapshots(state, df, cap_df, matches_df)
+            audit(diff)
+
+            if diff.empty:
+                return state
+
+            if diff.cells_only:
+                self.state = apply_scores(
+                    state, diff.cells[["row", "day", "player_name", "new"]].rename(columns={"new": "points"})
+                )
+            else:
+                self.state = build_season_state(df, cap_df, matches_df)
+
+        self._publish(state)
+
+        return self.state
+
+
+def read_score_file(path):
+
+    if path.endswith(".json"):
+        with open(path) as f:
+            scores = pd.DataFrame(json.load(f))
+    else:
+        scores = pd.read_csv(path)
+
+    scores.columns = scores.columns.str.lower().str.strip()
+
+    # raw scorecard lines are scored with the points table
+    if is_scorecard(scores):
+        scores = fantasy_points(scores)
+
+    missing = [c for c in ["day", "player_name", "points"] if c not in scores.columns]
+    if missing:
+        raise ValueError(f"missing columns: {', '.join(missing)}")
+
+    return scores
+
+
+def apply_scores(state, scores):
+
+    if scores.empty:
+        return state
+
+    df = state.df
+    scores = scores.copy()
+    scores["day"] = pd.to_numeric(scores["day"], errors="coerce")
+    scores["points"] = pd.to_numeric(scores["points"], errors="coerce")
+    scores["player_name"] = scores["player_name"].astype(str).str.strip()
+
+    # NaN points are dropped unless the row is an explicit clear (empties the cell)
+    keep = scores["points"].notna()
+    if "clear" in scores.columns:
+        keep |= scores["clear"].fillna(False).astype(bool)
+
+    scores = scores[scores["day"].notna() & keep].copy()
+    scores["day"] = scores["day"].astype(int)
+
+    # ----------------------------------------
+    # MAP TO ROSTER ROWS (unless already given)
+    # ----------------------------------------
+    if "row" in scores.columns:
+        matched = scores
+    else:
+        keys = ["player_name"]
+        if "franchise" in scores.columns:
+            scores["franchise"] = scores["franchise"].astype(str).str.strip()
+            keys.append("franchise")
+
+        roster = df[keys].astype(object).reset_index().rename(columns={"index": "row"})
+        matched = scores.merge(roster, on=keys, how="left")
+
+    unknown = matched[matched["row"].isna()]
+    if not unknown.empty:
+        logger.warning(
+            "Ignoring scores for unknown players: %s",
+            ", ".join(unknown["player_name"].unique())
+        )
+
+    matched = matched.dropna(subset=["row"])
+    if matched.empty:
+        return state
+
+    matched["row"] = matched["row"].astype(int)
+
+    # ----------------------------------------
+    # WRITE DAY CELLS
+    # ----------------------------------------
+    day_cols = get_day_cols(df)
+    new_days = sorted(set(matched["day"]) - set(state.day_numbers))
+    all_days = sorted(state.day_numbers + new_days)
+    all_cols = [f"day{d}" for d in all_days]
+
+    block = df[day_cols].reindex(columns=all_cols).to_numpy(dtype=DAY_DTYPE, copy=True)
+    col_pos = {d: i for i, d in enumerate(all_days)}
+    block[matched["row"].to_numpy(), matched["day"].map(col_pos).to_numpy()] = matched["points"].to_numpy()
+
+    id_cols = [c for c in df.columns if c not in day_cols]
+    new_df = pd.concat(
+        [df[id_cols], pd.DataFrame(block, columns=all_cols, index=df.index)],
+        axis=1
+    )
+
+    # ----------------------------------------
+    # INCREMENTAL UPDATE (affected days only)
+    # ----------------------------------------
+    touched = sorted(set(matched["day"]))
+    first_pos = col_pos[touched[0]]
+
+    raw, mult, tags, scored = state.raw, state.mult, state.tags, state.scored
+    for d in new_days:
+        pos = col_pos[d]
+        day_mult, day_tags = RULES.compile(df, state.cap_df, [d])
+        raw = np.insert(raw, pos, 0.0, axis=0)
+        mult = np.insert(mult, pos, day_mult[0], axis=0)
+        tags = np.insert(tags, pos, day_tags[0], axis=0)
+        scored = np.insert(scored, pos, 0.0, axis=0)
+
+    if not new_days:
+        raw, scored = raw.copy(), scored.copy()
+
+    for d in touched:
+        pos = col_pos[d]
+        raw[pos] = np.nan_to_num(block[:, pos])
+        scored[pos] = raw[pos] * mult[pos]
+
+    new_state = SeasonState(
+        new_df, state.cap_df, state.matches_df, all_days,
+        raw, mult, tags, scored, state.watchlists
+    )
+
+    logger.info("Applied %d scores for day(s) %s", len(matched), touched)
+
+    return new_state.accumulate(first_pos, state).inherit(state, touched[0])
@@ -0,0 +1,238 @@
+import os
+import json
+import logging
+import datetime
+
+import numpy as np
+import pandas as pd
+
+from utils.data_loader import get_day_cols
+
+logger = logging.getLogger(__name__)
+
+# one JSON line per non-empty diff, for auditing data corrections
+AUDIT_LOG = os.environ.get("SNAPSHOT_AUDIT_LOG", "data/snapshot_audit.jsonl")
+
+ROSTER_KEY = ["owner_name", "player_name"]
+CAPTAIN_KEY = ["owner_name", "from_day", "captain", "vice_captain"]
+
+
+# ----------------------------------------
+# DIFF
+# ----------------------------------------
+class SnapshotDiff:
+
+    def __init__(self, cells, new_days, removed_days, roster, added_players,
+                 removed_players, captains_added, captains_removed, matches_changed,
+                 reordered=False):
+
+        # one row per changed day cell: row (roster position), owner_name, player_name, franchise, day, old, new
+        self.cells = cells
+        self.new_days = new_days
+        self.removed_days = removed_days
+
+        # id-column changes of players in both snapshots: owner_name, player_name, column, old, new
+        self.roster = roster
+        self.added_players = added_players
+        self.removed_players = removed_players
+
+        self.captains_added = captains_added
+        self.captains_removed = captains_removed
+        self.matches_changed = matches_changed
+
+        # same players, different row order
+        self.reordered = reordered
+
+    @property
+    def empty(self):
+        return not (
+            len(self.cells) or self.new_days or self.removed_days or len(self.roster)
+            or self.added_players or self.removed_players
+            or self.captains_added or self.captains_removed or self.matches_changed
+            or self.reordered
+        )
+
+    @property
+    def cells_only(self):
+        # point corrections / new days the store can apply incrementally
+        return (
+            not self.removed_days and not len(self.roster)
+            and not self.added_players and not self.removed_players
+            and not self.captains_added and not self.captains_removed
+            and not self.matches_changed and not self.reordered
+            and not self.cells["new"].isna().any()
+            and set(self.new_days) <= set(self.cells["day"])
+        )
+
+    @property
+    def first_day(self):
+
+        # results for days before this one are unaffected; None = nothing is
+        if not self.cells_only:
+            return None
+
+        return int(self.cells["day"].min()) if len(self.cells) else None
+
+    def summary(self):
+
+        parts = []
+        if len(self.cells):
+            parts.append(
+                f"{len(self.cells)} cell(s) on day(s) {sorted(map(int, self.cells['day'].unique()))}"
+            )
+        if self.new_days:
+            parts.append(f"new day column(s) {self.new_days}")
+        if self.removed_days:
+            parts.append(f"removed day column(s) {self.removed_days}")
+        if len(self.roster):
+            parts.append(
+                f"{len(self.roster)} roster field(s) ({', '.join(sorted(self.roster['column'].unique()))})"
+            )
+        if self.added_players or self.removed_players:
+            parts.append(f"+{len(self.added_players)}/-{len(self.removed_players)} player(s)")
+        if self.captains_added or self.captains_removed:
+            parts.append(f"+{len(self.captains_added)}/-{len(self.captains_removed)} captain row(s)")
+        if self.matches_changed:
+            parts.append("fixtures")
+        if self.reordered:
+            parts.append("row order")
+
+        return ", ".join(parts) if parts else "no changes"
+
+    def to_record(self):
+
+        return {
+            "at": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+            "summary": self.summary(),
+            "first_day": self.first_day,
+            "cells": json.loads(self.cells.drop(columns="row").to_json(orient="records")),
+            "new_days": self.new_days,
+            "removed_days": self.removed_days,
+            "roster": json.loads(self.roster.to_json(orient="records")),
+            "added_players": self.added_players,
+            "removed_players": self.removed_players,
+            "captains_added": self.captains_added,
+            "captains_removed": self.captains_removed,
+            "matches_changed": self.matches_changed,
+            "reordered": self.reordered
+        }
+
+
+def _rows(frame):
+    return [list(map(str, r)) for r in frame.itertuples(index=False)]
+
+
+def diff_snapshots(state, df, cap_df, matches_df):
+
+    old = state.df
+
+    # ----------------------------------------
+    # ROSTER (matched on owner + player)
+    # ----------------------------------------
+    old_days, new_days_cols = get_day_cols(old), get_day_cols(df)
+    id_cols = [c for c in df.columns if c not in new_days_cols]
+
+    old_ids = old[id_cols].astype(object).assign(old_row=np.arange(len(old)))
+    new_ids = df[id_cols].astype(object).assign(row=np.arange(len(df)))
+
+    matched = old_ids.merge(new_ids, on=ROSTER_KEY, how="outer", indicator=True, suffixes=("_old", ""))
+
+    added_players = _rows(matched.loc[matched["_merge"] == "right_only", ROSTER_KEY])
+    removed_players = _rows(matched.loc[matched["_merge"] == "left_only", ROSTER_KEY])
+    both = matched[matched["_merge"] == "both"]
+
+    roster = []
+    for col in id_cols:
+        if col in ROSTER_KEY or f"{col}_old" not in both.columns:
+            continue
+        a, b = both[f"{col}_old"], both[col]
+        changed = ~((a == b) | (a.isna() & b.isna()))
+        for _, r in both[changed].iterrows():
+            roster.append({
+                "owner_name": r["owner_name"], "player_name": r["player_name"],
+                "column": col, "old": r[f"{col}_old"], "new": r[col]
+            })
+
+    roster = pd.DataFrame(roster, columns=["owner_name", "player_name", "column", "old", "new"])
+
+    # ----------------------------------------
+    # DAY CELLS (players in both snapshots)
+    # ----------------------------------------
+    old_day_numbers = {int(c[3:]) for c in old_days}
+    new_day_numbers = {int(c[3:]) for c in new_days_cols}
+
+    common = [c for c in new_days_cols if c in old_days]
+    new_cols = [c for c in new_days_cols if c not in old_days]
+
+    old_rows = both["old_row"].to_numpy(dtype=int)
+    new_rows = both["row"].to_numpy(dtype=int)
+
+    before = old[common].to_numpy(dtype=np.float64)[old_rows]
+    after = df[common].to_numpy(dtype=np.float64)[new_rows]
+    changed = ~((before == after) | (np.isnan(before) & np.isnan(after)))
+
+    # a new day column only matters where it holds points
+    added = df[new_cols].to_numpy(dtype=np.float64)[new_rows]
+    filled = ~np.isnan(added)
+
+    r_c, c_c = np.nonzero(changed)
+    r_n, c_n = np.nonzero(filled)
+
+    rows = np.concatenate([new_rows[r_c], new_rows[r_n]])
+
+    cells = pd.DataFrame({
+        "row": rows,
+        "owner_name": df["owner_name"].astype(object).to_numpy()[rows],
+        "player_name": df["player_name"].to_numpy()[rows],
+        "franchise": df["franchise"].astype(object).to_numpy()[rows],
+        "day": [int(common[c][3:]) for c in c_c] + [int(new_cols[c][3:]) for c in c_n],
+        "old": np.concatenate([before[r_c, c_c], np.full(len(r_n), np.nan)]),
+        "new": np.concatenate([after[r_c, c_c], added[r_n, c_n]])
+    }).sort_values(["day", "row"]).reset_index(drop=True)
+
+    # ----------------------------------------
+    # CAPTAINS / FIXTURES
+    # ----------------------------------------
+    old_caps = state.cap_df[CAPTAIN_KEY].astype(str)
+    new_caps = cap_df[CAPTAIN_KEY].astype(str)
+    caps = old_caps.merge(new_caps, how="outer", indicator=True)
+
+    matches_changed = not state.matches_df[["Day", "Teams"]].reset_index(drop=True).astype(str).equals(
+        matches_df[["Day", "Teams"]].reset_index(drop=True).astype(str)
+    )
+
+    return SnapshotDiff(
+        cells=cells,
+        new_days=sorted(new_day_numbers - old_day_numbers),
+        removed_days=sorted(old_day_numbers - new_day_numbers),
+        roster=roster,
+        added_players=added_players,
+        removed_players=removed_players,
+        captains_added=_rows(caps.loc[caps["_merge"] == "right_only", CAPTAIN_KEY]),
+        captains_removed=_rows(caps.loc[caps["_merge"] == "left_only", CAPTAIN_KEY]),
+        matches_changed=matches_changed,
+        reordered=not (old_rows == new_rows).all()
+    )
+
+
+# ----------------------------------------
+# AUDIT
+# ----------------------------------------
+def audit(diff, path=None):
+
+    path = path or AUDIT_LOG
+
+    logger.info("Snapshot diff: %s", diff.summary())
+
+    for _, c in diff.cells.iterrows():
+        logger.info(
+            "  day%d %s (%s): %s -> %s",
+            c["day"], c["player_name"], c["owner_name"], c["old"], c["new"]
+        )
+
+    if diff.empty:
+        return
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "a") as f:
+        f.write(json.dumps(diff.to_record(), ensure_ascii=False, default=str) + "\n")
@@ -2,18 +2,27 @@ import pandas as pd
 from utils.calculator import calculate_points
 from utils.helpers import build_watchlist
 from utils.metrics import get_day_wise_gainers
+from utils.telemetry import timed
 
 
-def prepare_team_standings(df, cap_df, matches_df, selected_day, effective_day):
+@timed("prepare_team_standings")
+def prepare_team_standings(df, cap_df, matches_df, selected_day, effective_day, season=None):
 
     # ----------------------------------------
     # BASE CALCULATION
     # ----------------------------------------
-    scored_df = calculate_points(df, cap_df, effective_day)
-    watch_map = build_watchlist(df, matches_df, cap_df, selected_day)
+    if season is not None:
+        # incrementally maintained cumulative points
+        scored_upto = season.scored_points
+        watch_map = season.watchlist(selected_day)
+    else:
+        scored_upto = lambda day: calculate_points(df, cap_df, day)
+        watch_map = build_watchlist(df, matches_df, cap_df, selected_day)
+
+    scored_df = scored_upto(effective_day)
 
     team_df = (
-        scored_df.groupby("owner_name")["player_points"]
+        scored_df.groupby("owner_name", observed=True)["player_points"]
         .sum().reset_index()
         .rename(columns={"owner_name": "Owner", "player_points": "Points"})
         .sort_values("Points", ascending=False)
@@ -26,10 +35,10 @@ def prepare_team_standings(df, cap_df, matches_df, selected_day, effective_day):
     # MOVEMENT
     # ----------------------------------------
     if effective_day > 1:
-        prev_df = calculate_points(df, cap_df, effective_day - 1)
+        prev_df = scored_upto(effective_day - 1)
 
         prev_team = (
-            prev_df.groupby("owner_name")["player_points"]
+            prev_df.groupby("owner_name", observed=True)["player_points"]
             .sum().reset_index()
             .rename(columns={"owner_name": "Owner", "player_points": "Prev"})
         )
@@ -48,16 +57,14 @@ def prepare_team_standings(df, cap_df, matches_df, selected_day, effective_day):
 
     # Current total (till today)
     curr_points = (
-        scored_df.groupby("owner_name")["player_points"]
+        scored_df.groupby("owner_name", observed=True)["player_points"]
         .sum()
     )
 
     # Previous total (till yesterday)
     if effective_day > 1:
-        prev_df = calculate_points(df, cap_df, effective_day - 1)
-
         prev_points = (
-            prev_df.groupby("owner_name")["player_points"]
+            prev_df.groupby("owner_name", observed=True)["player_points"]
             .sum()
         )
 
@@ -0,0 +1,297 @@
+import os
+import re
+import sys
+import json
+import smtplib
+import logging
+import argparse
+import urllib.request
+from abc import ABC, abstractmethod
+from email.message import EmailMessage
+
+import numpy as np
+import pandas as pd
+
+from utils.data_loader import fetch_points, normalize_points, load_matches, load_captains
+from utils.season_store import build_season_state
+from utils.scoring import CAPTAIN, VICE_CAPTAIN
+from utils.dashboard import cached, day_view, day_forecasts
+
+logger = logging.getLogger(__name__)
+
+# {owner: address}; owners not listed get <owner>@SUMMARY_MAIL_DOMAIN
+SUMMARY_CONTACTS = os.environ.get("SUMMARY_CONTACTS", "data/owner_contacts.json")
+SUMMARY_MAIL_DOMAIN = os.environ.get("SUMMARY_MAIL_DOMAIN", "localhost")
+SUMMARY_FROM = os.environ.get("SUMMARY_FROM", "dashboard@localhost")
+
+WEBHOOK_TIMEOUT_SECONDS = 10
+
+
+def slug(owner):
+    return re.sub(r"[^A-Za-z0-9_-]+", "_", str(owner)).strip("_") or "owner"
+
+
+# ----------------------------------------
+# SUMMARIES (every owner, one pass)
+# ----------------------------------------
+# Everything comes from the shared day view and forecasts; the per-owner
+# numbers are bincounts over the day's row, so the cost barely grows with
+# the number of owners.
+def compute_summaries(season, day):
+
+    view = day_view(season, day)
+    forecasts = day_forecasts(season, day)
+    effective_day = view["effective_day"]
+
+    team = view["team_df"].set_index("Owner")
+    prev_rank = team["Prev Rank"] if "Prev Rank" in team else team["Rank"]
+
+    df = season.df
+    owner_codes = df["owner_name"].cat.codes.to_numpy()
+    owners = np.asarray(df["owner_name"].cat.categories, dtype=object)
+    players = df["player_name"].to_numpy()
+
+    pos = season._pos(effective_day)
+    raw, scored, tags = season.raw[pos - 1], season.scored[pos - 1], season.tags[pos - 1]
+
+    def per_owner(weights):
+        return pd.Series(np.bincount(owner_codes, weights=weights, minlength=len(owners)), index=owners)
+
+    def slot(tag):
+        rows = np.flatnonzero(tags == tag)
+        return (
+            pd.Series(players[rows], index=owners[owner_codes[rows]]),
+            per_owner(np.where(tags == tag, scored, 0.0))
+        )
+
+    day_points = per_owner(scored)
+    bonus = per_owner(scored - raw)
+    captain, captain_points = slot(CAPTAIN)
+    vice_captain, vice_captain_points = slot(VICE_CAPTAIN)
+
+    # the selected day's fixtures are "tomorrow" for standings till the day before
+    next_day = [
+        f for label, f in forecasts["match_forecasts"].items()
+        if label.startswith(f"Day {day} ")
+    ]
+    tomorrow = (
+        pd.concat(next_day).groupby("Owner")["Predicted Points"].sum()
+        if next_day else pd.Series(dtype=float)
+    )
+    final = forecasts["forecast_df"].set_index("Owner")["Predicted Final"]
+
+    return [
+        {
+            "owner": str(owner),
+            "day": day,
+            "standings_day": effective_day,
+            "rank": int(row["Rank"]),
+            "owners": len(team),
+            "movement": int(prev_rank[owner] - row["Rank"]) if effective_day > 1 else 0,
+            "points": float(row["Points"]),
+            "day_points": float(day_points.get(owner, 0.0)),
+            "captain": captain.get(owner),
+            "captain_points": float(captain_points.get(owner, 0.0)),
+            "vice_captain": vice_captain.get(owner),
+            "vice_captain_points": float(vice_captain_points.get(owner, 0.0)),
+            "c_vc_bonus": float(bonus.get(owner, 0.0)),
+            "watchlist": row["Watchlist"] if isinstance(row["Watchlist"], str) else "",
+            "forecast_next_day": float(tomorrow.get(owner, 0.0)),
+            "predicted_final": float(final.get(owner, np.nan)),
+            "win_pct": float(row["Win %"])
+        }
+        for owner, row in team.iterrows()
+    ]
+
+
+def day_summaries(season, day):
+    return cached("summaries", season, day, compute_summaries)
+
+
+def summary_text(s):
+
+    movement = (
+        f"▲ +{s['movement']}" if s["movement"] > 0
+        else f"▼ {s['movement']}" if s["movement"] < 0
+        else "— 0"
+    )
+
+    return "\n".join([
+        f"🏏 {s['owner']} — update till Day {s['standings_day']}",
+        f"🏆 Rank {s['rank']} of {s['owners']} ({movement})",
+        f"📊 {s['points']:.1f} pts total, {s['day_points']:.1f} on Day {s['standings_day']}",
+        f"👑 C {s['captain'] or '—'}: {s['captain_points']:.1f} · "
+        f"VC {s['vice_captain'] or '—'}: {s['vice_captain_points']:.1f} "
+        f"(+{s['c_vc_bonus']:.1f} from C/VC)",
+        f"👀 Day {s['day']} watchlist: {s['watchlist'] or '—'}",
+        f"📈 Day {s['day']} forecast: {s['forecast_next_day']:.1f} pts · "
+        f"predicted final {s['predicted_final']:.1f} · win {s['win_pct']:.1f}%"
+    ])
+
+
+# ----------------------------------------
+# SINKS
+# ----------------------------------------
+class Sink(ABC):
+
+    # open() / close() bracket a batch; send() delivers one owner's summary
+    def open(self):
+        pass
+
+    @abstractmethod
+    def send(self, summary, text):
+        ...
+
+    def close(self):
+        pass
+
+
+class FileSink(Sink):
+
+    # <out>/day<N>/<owner>.txt and .json
+    def __init__(self, out_dir="summaries"):
+        self.out_dir = out_dir
+
+    def send(self, summary, text):
+
+        day_dir = os.path.join(self.out_dir, f"day{summary['day']}")
+        os.makedirs(day_dir, exist_ok=True)
+
+        name = slug(summary["owner"])
+
+        with open(os.path.join(day_dir, f"{name}.txt"), "w") as f:
+            f.write(text + "\n")
+
+        with open(os.path.join(day_dir, f"{name}.json"), "w") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+
+
+class SmtpSink(Sink):
+
+    # one connection per batch; a local stand-in such as
+    # `python -m aiosmtpd -n -l localhost:1025` is enough for testing
+    def __init__(self, address="localhost:1025"):
+
+        host, _, port = address.partition(":")
+        self.host = host or "localhost"
+        self.port = int(port or 1025)
+        self.smtp = None
+
+        self.contacts = {}
+        if os.path.exists(SUMMARY_CONTACTS):
+            with open(SUMMARY_CONTACTS) as f:
+                self.contacts = json.load(f)
+
+    def open(self):
+        self.smtp = smtplib.SMTP(self.host, self.port)
+
+    def send(self, summary, text):
+
+        owner = summary["owner"]
+
+        msg = EmailMessage()
+        msg["From"] = SUMMARY_FROM
+        msg["To"] = self.contacts.get(owner, f"{slug(owner).lower()}@{SUMMARY_MAIL_DOMAIN}")
+        msg["Subject"] = f"🏏 Day {summary['standings_day']}: rank {summary['rank']} of {summary['owners']}"
+        msg.set_content(text)
+
+        self.smtp.send_message(msg)
+
+    def close(self):
+        if self.smtp is not None:
+            self.smtp.quit()
+            self.smtp = None
+
+
+class WebhookSink(Sink):
+
+    # POSTs {"owner", "text", "summary"} as JSON, one request per owner
+    def __init__(self, url):
+        self.url = url
+
+    def send(self, summary, text):
+
+        body = json.dumps({"owner": summary["owner"], "text": text, "summary": summary}).encode()
+        request = urllib.request.Request(
+            self.url, data=body, headers={"Content-Type": "application/json"}, method="POST"
+        )
+
+        with urllib.request.urlopen(request, timeout=WEBHOOK_TIMEOUT_SECONDS):
+            pass
+
+
+SINKS = {"file": FileSink, "smtp": SmtpSink, "webhook": WebhookSink}
+
+
+def make_sink(spec):
+
+    # "file[:dir]", "smtp[:host:port]", "webhook:url"
+    kind, _, target = spec.partition(":")
+
+    if kind not in SINKS:
+        raise ValueError(f"unknown sink {kind!r} (expected one of: {', '.join(SINKS)})")
+
+    return SINKS[kind](target) if target else SINKS[kind]()
+
+
+# ----------------------------------------
+# BATCH
+# ----------------------------------------
+def send_summaries(season, day, sinks):
+
+    # -> (deliveries made, [(owner, sink, error), ...])
+    summaries = day_summaries(season, day)
+    sent, failed = 0, []
+
+    opened = []
+    try:
+        for sink in sinks:
+            sink.open()
+            opened.append(sink)
+
+        for summary in summaries:
+            text = summary_text(summary)
+
+            for sink in sinks:
+                try:
+                    sink.send(summary, text)
+                    sent += 1
+                except (OSError, smtplib.SMTPException) as e:
+                    logger.warning("Could not send %s's summary via %s: %s",
+                                   summary["owner"], type(sink).__name__, e)
+                    failed.append((summary["owner"], type(sink).__name__, str(e)))
+    finally:
+        for sink in opened:
+            sink.close()
+
+    return sent, failed
+
+
+# ----------------------------------------
+# CLI
+#   python -m utils.summaries [--day N] [--source local] --sink file:summaries [--sink webhook:URL]
+# ----------------------------------------
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Send every owner their daily summary.")
+    parser.add_argument("--day", type=int, default=None, help="defaults to the latest day")
+    parser.add_argument("--source", choices=["sheet", "local"], default="sheet")
+    parser.add_argument("--sink", action="append", default=None,
+                        help="file[:dir], smtp[:host:port] or webhook:url (repeatable)")
+    args = parser.parse_args(argv)
+
+    raw = pd.read_csv("data/points.csv") if args.source == "local" else fetch_points()
+    season = build_season_state(normalize_points(raw), load_captains(), load_matches())
+
+    day = args.day or season.day_numbers[-1]
+    sinks = [make_sink(spec) for spec in args.sink or ["file"]]
+
+    sent, failed = send_summaries(season, day, sinks)
+
+    print(f"Day {day}: {sent} summaries delivered, {len(failed)} failed")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,269 @@
+import os
+import time
+import logging
+import threading
+import functools
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from utils.memory import process_rss_bytes
+
+logger = logging.getLogger(__name__)
+
+# where the exposition is served / written; both off by default
+METRICS_PORT = os.environ.get("METRICS_PORT")
+METRICS_HOST = os.environ.get("METRICS_HOST", "127.0.0.1")
+METRICS_FILE = os.environ.get("METRICS_FILE")
+METRICS_INTERVAL_SECONDS = 15
+
+# seconds; Prometheus' defaults
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names, values):
+
+    if not names:
+        return ""
+
+    return "{" + ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values)) + "}"
+
+
+def _number(v):
+    return "+Inf" if v == float("inf") else repr(float(v))
+
+
+# ----------------------------------------
+# METRIC TYPES
+# ----------------------------------------
+# One lock per metric and a dict update per observation, so leaving them on
+# costs a few microseconds per call.
+class Metric:
+
+    kind = None
+
+    def __init__(self, name, help, labels=()):
+
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        self.lock = threading.Lock()
+        self.values = {}
+
+    def _key(self, labels):
+        return tuple(labels.get(n, "") for n in self.label_names)
+
+    def header(self):
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(Metric):
+
+    kind = "counter"
+
+    def inc(self, amount=1.0, **labels):
+        key = self._key(labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0.0) + amount
+
+    def render(self):
+        with self.lock:
+            items = list(self.values.items())
+        return self.header() + [
+            f"{self.name}{_labels(self.label_names, k)} {_number(v)}" for k, v in items
+        ]
+
+
+class Gauge(Counter):
+
+    kind = "gauge"
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self.lock:
+            self.values[key] = float(value)
+
+
+class Histogram(Metric):
+
+    kind = "histogram"
+
+    def __init__(self, name, help, labels=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+
+    def observe(self, value, **labels):
+
+        key = self._key(labels)
+        with self.lock:
+            counts, total = self.values.get(key, ([0] * len(self.buckets), 0.0))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            self.values[key] = (counts, total + value)
+
+    def time(self, **labels):
+        return _Timer(self, labels)
+
+    def render(self):
+
+        with self.lock:
+            items = [(k, (list(c), s)) for k, (c, s) in self.values.items()]
+
+        lines = self.header()
+        names = self.label_names + ("le",)
+
+        for key, (counts, total) in items:
+            running = 0
+            for bound, count in zip(self.buckets, counts):
+                running += count
+                lines.append(f"{self.name}_bucket{_labels(names, key + (_number(bound),))} {running}")
+            lines.append(f"{self.name}_sum{_labels(self.label_names, key)} {_number(total)}")
+            lines.append(f"{self.name}_count{_labels(self.label_names, key)} {running}")
+
+        return lines
+
+
+class _Timer:
+
+    def __init__(self, histogram, labels):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.start, **self.labels)
+
+
+# ----------------------------------------
+# REGISTRY
+# ----------------------------------------
+REGISTRY = []
+
+
+def _register(metric):
+    REGISTRY.append(metric)
+    return metric
+
+
+RERUN_SECONDS = _register(Histogram(
+    "dashboard_rerun_seconds", "Streamlit script run time."
+))
+COMPUTE_SECONDS = _register(Histogram(
+    "dashboard_compute_seconds", "Time spent in compute functions.", ["function"]
+))
+CACHE_REQUESTS = _register(Counter(
+    "dashboard_cache_requests_total",
+    "Shared day-cache lookups by result kind and outcome (hit, reuse, miss).",
+    ["kind", "outcome"]
+))
+FETCH_SECONDS = _register(Histogram(
+    "dashboard_sheet_fetch_seconds", "Points sheet fetch time.", ["outcome"]
+))
+FETCHES = _register(Counter(
+    "dashboard_sheet_fetches_total", "Points sheet fetches by outcome.", ["outcome"]
+))
+ACTIVE_SESSIONS = _register(Gauge(
+    "dashboard_active_sessions", "Sessions seen within the session TTL."
+))
+RSS_BYTES = _register(Gauge(
+    "process_resident_memory_bytes", "Resident memory of the dashboard process."
+))
+
+
+def timed(function):
+
+    # decorator: every call lands in dashboard_compute_seconds{function=...}
+    def wrap(fn):
+        @functools.wraps(fn)
+        def inner(*args, **kwargs):
+            with COMPUTE_SECONDS.time(function=function):
+                return fn(*args, **kwargs)
+        return inner
+
+    return wrap
+
+
+def render():
+
+    RSS_BYTES.set(process_rss_bytes())
+
+    lines = []
+    for metric in REGISTRY:
+        lines += metric.render()
+
+    return "\n".join(lines) + "\n"
+
+
+# ----------------------------------------
+# EXPOSITION (local endpoint and/or scrape file)
+# ----------------------------------------
+class MetricsHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+
+        data = render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, fmt, *args):
+        logger.debug(fmt, *args)
+
+
+class MetricsExporter:
+
+    def __init__(self, port=METRICS_PORT, host=METRICS_HOST, path=METRICS_FILE,
+                 interval=METRICS_INTERVAL_SECONDS):
+
+        self.port = int(port) if port else None
+        self.host = host
+        self.path = path
+        self.interval = interval
+        self.httpd = None
+        self.stopped = threading.Event()
+
+    def start(self):
+
+        if self.port:
+            self.httpd = ThreadingHTTPServer((self.host, self.port), MetricsHandler)
+            threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+            logger.info("Metrics on http://%s:%s/metrics", self.host, self.port)
+
+        if self.path:
+            threading.Thread(target=self._write_loop, daemon=True).start()
+
+        return self
+
+    def write(self):
+
+        # atomic replace, so a scraper never reads half a file
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w") as f:
+            f.write(render())
+        os.replace(tmp, self.path)
+
+    def _write_loop(self):
+        while not self.stopped.wait(self.interval):
+            try:
+                self.write()
+            except OSError as e:
+                logger.warning("Could not write metrics file %s: %s", self.path, e)
+
+    def stop(self):
+        self.stopped.set()
+        if self.httpd:
+            self.httpd.shutdown()
+            self.httpd.server_close()
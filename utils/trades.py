@@ -0,0 +1,166 @@
+import os
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+
+from utils.scoring import RULES
+from utils.bounds import TBC
+
+# bid-price difference a trade may carry (sum given vs sum received)
+TRADE_PRICE_GAP = float(os.environ.get("TRADE_PRICE_GAP", 500))
+
+# players per side considered: 1-for-1 and 2-for-2
+TRADE_SIZES = (1, 2)
+
+TOP_TRADES = 10
+
+
+# ----------------------------------------
+# PLAYER VALUE (rest of season)
+# ----------------------------------------
+def player_values(season, day):
+
+    # form level x remaining fixtures x role multiplier, per roster row;
+    # released / injured players are worth nothing and can't be traded
+    df = season.df
+    fixtures = season.matches_df[season.matches_df["Day"] >= day]
+
+    franchise = df["franchise"].astype(object).to_numpy()
+    games = np.zeros(len(df))
+    for teams in fixtures["team_list"]:
+        games += np.isin(franchise, [t for t in teams if t != TBC])
+
+    value = season.form(day).level() * games * RULES.base(df)
+
+    return np.where(df["released_injured"].to_numpy(dtype=bool), 0.0, value)
+
+
+def _top2(values):
+
+    # (..., n) -> the two largest along the last axis, -inf padded
+    padded = np.concatenate([values, np.full(values.shape[:-1] + (2,), -np.inf)], axis=-1)
+    top = -np.sort(-padded, axis=-1)[..., :2]
+    return np.where(np.isfinite(top), top, 0.0)
+
+
+def _slot_bonus(top):
+    # C/VC extra on the two best players (owners re-pick after a trade)
+    return (RULES.captain - 1) * top[..., 0] + (RULES.vice_captain - 1) * top[..., 1]
+
+
+# ----------------------------------------
+# SEARCH
+# ----------------------------------------
+# Points are additive, so the plain value swap is zero-sum: one side's gain
+# is the other's loss. A trade can only help both through the C/VC slots,
+# i.e. each side must end up with a better captain/vice-captain than it
+# gives away. That gives a cheap upper bound per candidate, and only the
+# candidates passing it get the exact top-2 re-evaluation.
+class _Side:
+
+    def __init__(self, rows, values, size):
+
+        self.rows = rows
+        self.sets = np.array(list(combinations(range(len(rows)), size)), dtype=np.int64).reshape(-1, size)
+
+        v = values[rows]
+        self.set_values = v[self.sets]
+        self.total = self.set_values.sum(axis=1)
+        self.best = self.set_values.max(axis=1, initial=0.0)
+
+        order = np.argsort(-v, kind="stable")
+        self.top = _top2(v[None, :])[0]
+        self.bonus = _slot_bonus(self.top)
+
+        # enough of the best players to know the top 2 after removing `size`
+        self.head = order[:size + 2]
+        self.head_values = v[self.head]
+
+    def kept_head(self, set_ids):
+
+        # head values with each candidate set's players removed (-inf)
+        removed = (self.sets[set_ids][:, :, None] == self.head[None, None, :]).any(axis=1)
+        return np.where(removed, -np.inf, self.head_values[None, :])
+
+    def gain_bound(self, incoming_best):
+
+        # most the C/VC bonus can rise by receiving a player worth `incoming_best`
+        return (
+            (RULES.captain - 1) * np.maximum(incoming_best - self.top[0], 0) +
+            (RULES.vice_captain - 1) * np.maximum(incoming_best - self.top[1], 0)
+        )
+
+
+def find_trades(season, owner, day, sizes=TRADE_SIZES, top_k=TOP_TRADES, price_gap=TRADE_PRICE_GAP):
+
+    df = season.df
+    values = player_values(season, day)
+    price = df["bid_price"].to_numpy(dtype=np.float64)
+    owners = df["owner_name"].astype(object).to_numpy()
+    tradable = ~df["released_injured"].to_numpy(dtype=bool)
+
+    mine = np.flatnonzero((owners == owner) & tradable)
+    found = []
+
+    for partner in pd.unique(owners[owners != owner]):
+
+        theirs = np.flatnonzero((owners == partner) & tradable)
+
+        for size in sizes:
+            if len(mine) < size or len(theirs) < size:
+                continue
+
+            a, b = _Side(mine, values, size), _Side(theirs, values, size)
+
+            # owner gives a set of A, receives a set of B (rows x cols)
+            swap = b.total[None, :] - a.total[:, None]
+            price_ok = np.abs(
+                price[b.rows][b.sets].sum(axis=1)[None, :] - price[a.rows][a.sets].sum(axis=1)[:, None]
+            ) <= price_gap
+
+            # bound-based pruning: both sides' bonus gain must beat the swap
+            possible = (
+                price_ok &
+                (swap + a.gain_bound(b.best)[None, :] > 0) &
+                (-swap + b.gain_bound(a.best)[:, None] > 0)
+            )
+
+            give, get = np.nonzero(possible)
+            if len(give) == 0:
+                continue
+
+            # exact: top 2 after the swap, from each side's head plus what it receives
+            a_top = _top2(np.concatenate([a.kept_head(give), b.set_values[get]], axis=1))
+            b_top = _top2(np.concatenate([b.kept_head(get), a.set_values[give]], axis=1))
+
+            gain = swap[give, get] + _slot_bonus(a_top) - a.bonus
+            partner_gain = -swap[give, get] + _slot_bonus(b_top) - b.bonus
+
+            both = (gain > 0) & (partner_gain > 0)
+
+            for i, j, g, pg in zip(give[both], get[both], gain[both], partner_gain[both]):
+                gives = a.rows[a.sets[i]]
+                receives = b.rows[b.sets[j]]
+                found.append({
+                    "Partner": partner,
+                    "Gives": ", ".join(df["player_name"].to_numpy()[gives]),
+                    "Receives": ", ".join(df["player_name"].to_numpy()[receives]),
+                    "Gain": g,
+                    "Partner Gain": pg,
+                    "Price Δ": price[receives].sum() - price[gives].sum()
+                })
+
+    columns = ["Partner", "Gives", "Receives", "Gain", "Partner Gain", "Price Δ"]
+    if not found:
+        return pd.DataFrame(columns=columns)
+
+    out = pd.DataFrame(found, columns=columns)
+
+    # fairest first: the smaller of the two gains, then the total
+    out["_fair"] = out[["Gain", "Partner Gain"]].min(axis=1)
+    out["_total"] = out["Gain"] + out["Partner Gain"]
+
+    return out.sort_values(["_fair", "_total"], ascending=False).head(top_k).drop(
+        columns=["_fair", "_total"]
+    ).reset_index(drop=True)
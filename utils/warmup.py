@@ -0,0 +1,63 @@
+import os
+import logging
+
+from utils.dashboard import (
+    season_cube, season_h2h, season_auction, day_planner, day_digest, day_payload
+)
+from utils.precompute import get_precomputer
+
+logger = logging.getLogger(__name__)
+
+# "1" warms every day, newest first; otherwise only the latest one
+WARM_ALL_DAYS = os.environ.get("WARM_ALL_DAYS", "") == "1"
+
+# season-wide results every page reads
+SEASON_JOBS = [season_cube, season_h2h, season_auction]
+
+# per-day results outside the precompute kinds
+DAY_JOBS = [day_planner, day_digest, day_payload]
+
+
+def _job(fn, *args):
+    try:
+        fn(*args)
+    except Exception:
+        logger.exception("Warm-up of %s failed", fn.__name__)
+
+
+# ----------------------------------------
+# WARM-UP
+# ----------------------------------------
+def warm(season, all_days=None):
+
+    # queue the default page's results (latest day) and the season-wide ones
+    # on the background pool; a no-op when PRECOMPUTE_WORKERS is 0
+    precomputer = get_precomputer()
+
+    if not season.day_numbers or not precomputer.workers:
+        return
+
+    all_days = WARM_ALL_DAYS if all_days is None else all_days
+    days = season.day_numbers[::-1] if all_days else season.day_numbers[-1:]
+
+    precomputer.schedule(season, days[:1])
+
+    for fn in SEASON_JOBS:
+        precomputer.run(_job, fn, season)
+
+    for day in days:
+        for fn in DAY_JOBS:
+            precomputer.run(_job, fn, season, day)
+
+    precomputer.schedule(season, days[1:])
+
+    logger.info("Warming season version %s, day(s) %s", season.version, days)
+
+
+def attach(store, all_days=None):
+
+    # warm now and again on every new data version the store publishes
+    store.subscribe(lambda season: warm(season, all_days))
+    warm(store.state, all_days)
+
+    return store